@@ -4,8 +4,10 @@ from dotenv import load_dotenv
 from api.config import Config
 from api.extensions import api, jwt, db, migrate
 from api.resources import ALL_BLUEPRINTS
+from api.commands import ALL_COMMANDS
 from api import jwt_callbacks
 from api.error_handlers import register_error_handlers
+from api.infra import db_pool, db_routing
 
 def create_app(test_config=None):
     app = Flask(__name__)
@@ -16,7 +18,20 @@ def create_app(test_config=None):
     if test_config:
         app.config.update(test_config)
 
+    engine_options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = db_pool.engine_options(app.config["SQLALCHEMY_DATABASE_URI"], engine_options)
+    replica_uri = app.config.get("SQLALCHEMY_REPLICA_URI")
+    if replica_uri:
+        app.config["SQLALCHEMY_BINDS"] = {
+            **app.config.get("SQLALCHEMY_BINDS", {}),
+            db_routing.REPLICA_BIND: {"url": replica_uri, **db_pool.engine_options(replica_uri, engine_options)},
+        }
+
     db.init_app(app)
+    db_routing.init_app(app)
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            db_pool.instrument_engine(engine, bind or db_pool.PRIMARY)
     migrate.init_app(app, db)
     api.init_app(app)
     jwt.init_app(app)
@@ -26,4 +41,7 @@ def create_app(test_config=None):
     for blp in ALL_BLUEPRINTS:
         api.register_blueprint(blp)
 
+    for command in ALL_COMMANDS:
+        app.cli.add_command(command)
+
     return app
\ No newline at end of file
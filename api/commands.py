@@ -0,0 +1,32 @@
+import click
+from flask.cli import AppGroup
+
+from api.services import spend_rollup
+
+rollups_cli = AppGroup("rollups", help="Maintain the monthly spend rollup table.")
+
+@rollups_cli.command("rebuild")
+def rebuild_rollups_command() -> None:
+    """Backfill monthly_spend_rollups from the subscriptions table."""
+    written = spend_rollup.rebuild_rollups()
+    click.echo(f"Rebuilt {written} rollup row(s).")
+
+@rollups_cli.command("check")
+def check_rollups_command() -> None:
+    """Report rollups that drifted from the subscriptions table."""
+    mismatches = spend_rollup.find_rollup_inconsistencies()
+    if not mismatches:
+        click.echo("Rollups are consistent.")
+        return
+
+    for mismatch in mismatches:
+        click.echo(
+            f"user_id={mismatch['user_id']} month={mismatch['month']} "
+            f"category={mismatch['category']} expected={mismatch['expected']} "
+            f"actual={mismatch['actual']}"
+        )
+    raise click.ClickException(f"Found {len(mismatches)} inconsistent rollup(s).")
+
+ALL_COMMANDS = [
+    rollups_cli,
+]
@@ -9,7 +9,32 @@ class Config:
     OPENAPI_SWAGGER_UI_PATH = "/swagger-ui"
     OPENAPI_SWAGGER_UI_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///data.db")
+    # Read replica for GET requests and orchestrator scans; unset sends everything to the primary.
+    SQLALCHEMY_REPLICA_URI = os.getenv("DATABASE_REPLICA_URL")
+    REPLICA_MAX_LAG = float(os.getenv("REPLICA_MAX_LAG", 5))  # seconds; a replica further behind is skipped
+    REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 5))  # seconds
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Per process (web worker, RQ worker); the sizing options are ignored for SQLite.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),  # seconds to wait for a free connection
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),  # seconds; keep below MySQL's wait_timeout
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "secret")
     JWT_ACCESS_TOKEN_EXPIRES = 300  # 5 minutes
-    JWT_REFRESH_TOKEN_EXPIRES = 2592000  # 30 days
\ No newline at end of file
+    JWT_REFRESH_TOKEN_EXPIRES = 2592000  # 30 days
+    REMINDER_FANOUT_MODE = os.getenv("REMINDER_FANOUT_MODE", "single")  # "single" | "batch"
+    REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", 500))
+    REMINDER_EMAIL_BATCH_SIZE = int(os.getenv("REMINDER_EMAIL_BATCH_SIZE", 1000))  # Mailgun recipients per request
+    # Buffered reminder log writes; batch mode only, single jobs commit one row each.
+    REMINDER_LOG_FLUSH_SIZE = int(os.getenv("REMINDER_LOG_FLUSH_SIZE", 200))
+    REMINDER_LOG_FLUSH_INTERVAL = float(os.getenv("REMINDER_LOG_FLUSH_INTERVAL", 5))  # seconds
+    SUBSCRIPTION_IMPORT_BATCH_SIZE = int(os.getenv("SUBSCRIPTION_IMPORT_BATCH_SIZE", 1000))  # rows per transaction
+    SUBSCRIPTION_IMPORT_MAX_ROWS = int(os.getenv("SUBSCRIPTION_IMPORT_MAX_ROWS", 10000))
+    SPEND_ROLLUPS_ENABLED = os.getenv("SPEND_ROLLUPS_ENABLED", "false").lower() == "true"
+    # Kill switch for the Redis response cache of read endpoints.
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 60))  # seconds
+    RESPONSE_CACHE_MAX_ENTRY_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", 256 * 1024))
\ No newline at end of file
@@ -12,6 +12,22 @@ LISTING_ERRORS = [
     (401, "Unauthorized access."),
 ]
 
+NOT_MODIFIED = [
+    (304, "Not modified since the ETag sent in If-None-Match."),
+]
+
+# Response headers of endpoints answering conditional GETs.
+ETAG_HEADERS = {
+    "ETag": {
+        "description": "Weak ETag of the response; send it back in If-None-Match.",
+        "schema": {"type": "string"},
+    },
+    "Cache-Control": {
+        "description": "Always `private, no-cache`: revalidate before reusing.",
+        "schema": {"type": "string"},
+    },
+}
+
 def apply_common_responses(blp, responses):
     def decorator(fn):
         for code, desc in responses:
@@ -16,6 +16,10 @@ class SubscriptionDeleteError(Exception): pass
 class SubscriptionNotFoundError(Exception): pass
 class SubscriptionExistError(Exception): pass
 
+# Spend rollup exceptions
+
+class SpendRollupRebuildError(Exception): pass
+
 # Exceptions used by email providers (Mailgun, etc.)
 
 class EmailTemporaryError(Exception): pass
@@ -0,0 +1,133 @@
+import time
+import threading
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Engine options that only apply to a sized QueuePool.
+QUEUE_POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout")
+# Stats name of the default engine; binds are counted under their bind key.
+PRIMARY = "primary"
+
+_STAT_DEFAULTS = {
+    "connects": 0,
+    "checkouts": 0,
+    "checkins": 0,
+    "invalidations": 0,
+    "timeouts": 0,
+    "checkout_wait_ms_total": 0.0,
+    "checkout_wait_ms_max": 0.0,
+    "checked_out_max": 0,
+}
+_stats: dict[str, dict[str, Any]] = {}  # engine name -> counters
+_stats_lock = threading.Lock()
+
+def _engine_stats(name: str) -> dict[str, Any]:
+    # Callers hold _stats_lock.
+    return _stats.setdefault(name, dict(_STAT_DEFAULTS))
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited, including connecting and the pre-ping."""
+
+    # Set by `instrument_engine`, so each engine's pool is counted on its own.
+    stats_name = PRIMARY
+
+    def recreate(self):
+        # `engine.dispose()` swaps in a recreated pool.
+        pool = super().recreate()
+        pool.stats_name = self.stats_name
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            with _stats_lock:
+                _engine_stats(self.stats_name)["timeouts"] += 1
+            raise
+        finally:
+            waited = (time.perf_counter() - started) * 1000
+            with _stats_lock:
+                stats = _engine_stats(self.stats_name)
+                stats["checkout_wait_ms_total"] += waited
+                stats["checkout_wait_ms_max"] = max(stats["checkout_wait_ms_max"], waited)
+
+def engine_options(database_uri: str, options: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the engine options to use for `database_uri`.
+
+    SQLite gets no sized pool (Flask-SQLAlchemy picks a static pool for
+    in-memory databases), so the QueuePool sizing options are dropped for
+    it. Every other database gets an `InstrumentedQueuePool`.
+    """
+    if make_url(database_uri).get_backend_name() == "sqlite":
+        return {name: value for name, value in options.items() if name not in QUEUE_POOL_OPTIONS}
+    return {"poolclass": InstrumentedQueuePool, **options}
+
+def _count(name: str, counter: str) -> None:
+    with _stats_lock:
+        _engine_stats(name)[counter] += 1
+
+def instrument_engine(engine: Engine, name: str = PRIMARY) -> None:
+    """
+    Count connection pool events of `engine` in this process's pool stats under `name`.
+
+    The listeners stay attached when the pool is recreated, e.g. by
+    `engine.dispose()` after a fork.
+    """
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.stats_name = name
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        _count(name, "connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out = engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0
+        with _stats_lock:
+            stats = _engine_stats(name)
+            stats["checkouts"] += 1
+            stats["checked_out_max"] = max(stats["checked_out_max"], checked_out)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        _count(name, "checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        _count(name, "invalidations")
+
+def get_pool_stats(engine: Engine, name: str = PRIMARY) -> dict[str, Any]:
+    """
+    Return connection pool counters and utilization of one engine for this process.
+
+    Returns:
+        dict[str, Any]: Event counters since the process started ('connects'
+        opened, 'checkouts', 'checkins', 'invalidations' of broken or stale
+        connections, 'timeouts' waiting for a free connection), the total and
+        longest checkout wait in milliseconds, the most connections ever
+        checked out at once, and for a QueuePool its current 'size',
+        'checked_in', 'checked_out' and 'overflow'.
+    """
+    with _stats_lock:
+        stats = dict(_engine_stats(name))
+
+    pool = engine.pool
+    stats["pool"] = type(pool).__name__
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # QueuePool counts overflow from -pool_size while the pool fills up.
+            overflow=max(pool.overflow(), 0),
+        )
+    return stats
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,189 @@
+import logging
+from contextlib import contextmanager
+from typing import Any, Iterator
+from flask import Flask, current_app, has_request_context, request
+from flask_jwt_extended import get_jwt_identity
+from flask_sqlalchemy.session import Session
+from redis.exceptions import RedisError
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
+
+from api.infra.redis import get_redis
+from api.utils.ttl_cache import TTLCache
+
+# Key of the replica engine in SQLALCHEMY_BINDS.
+REPLICA_BIND = "replica"
+# Requests that only read and are routed to the replica.
+SAFE_METHODS = ("GET", "HEAD")
+
+# Session.info keys.
+REPLICA_READS = "replica_reads"
+WROTE = "wrote"
+UNMARKED_WRITE = "unmarked_write"
+RECENT_WRITE = "recent_write"
+
+logger = logging.getLogger(__name__)
+
+_replica_health = TTLCache(maxsize=16, ttl=5)
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to the replica while replica reads are enabled.
+
+    Replica reads are enabled for GET/HEAD requests and inside
+    `replica_reads()`. Even then a statement goes to the primary when:
+    - it is not a SELECT (flushes, Core writes, raw SQL),
+    - the session already wrote, so reads after a write see it,
+    - the replica is lagging more than `REPLICA_MAX_LAG` seconds or down,
+    - the current user wrote less than `REPLICA_MAX_LAG` seconds ago.
+    Without a replica bind it behaves exactly like the Flask-SQLAlchemy session.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None and self._use_replica(replica, clause):
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, replica: Engine, clause: Any) -> bool:
+        if not isinstance(clause, Select):
+            self.info[WROTE] = True
+            self.info[UNMARKED_WRITE] = True
+            return False
+        if not self.info.get(REPLICA_READS) or self.info.get(WROTE):
+            return False
+        return replica_is_healthy(replica) and not self._user_wrote_recently()
+
+    def _user_wrote_recently(self) -> bool:
+        user_id = _current_user_id()
+        if user_id is None:
+            return False
+
+        cached = self.info.get(RECENT_WRITE)
+        if cached is not None and cached[0] == user_id:
+            return cached[1]
+
+        try:
+            recent = bool(get_redis().exists(_recent_write_key(user_id)))
+        except RedisError as e:
+            logger.warning("Could not check recent writes; reading from primary.", extra={"error": str(e)})
+            recent = True
+        self.info[RECENT_WRITE] = (user_id, recent)
+        return recent
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_recent_write(session: RoutingSession) -> None:
+    # Only needed when there is a replica to fall behind.
+    if not session.info.pop(UNMARKED_WRITE, False) or REPLICA_BIND not in session._db.engines:
+        return
+
+    user_id = _current_user_id()
+    if user_id is None:
+        return
+
+    config = current_app.config
+    try:
+        get_redis().set(
+            _recent_write_key(user_id),
+            1,
+            ex=int(config["REPLICA_MAX_LAG"] + config["REPLICA_LAG_CHECK_INTERVAL"]) + 1,
+        )
+    except RedisError as e:
+        logger.error("Could not record a recent write.", extra={"user_id": user_id, "error": str(e)})
+
+def _recent_write_key(user_id: str) -> str:
+    return f"db:recent_write:{user_id}"
+
+def _current_user_id() -> str | None:
+    if not has_request_context():
+        return None
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        # The request's JWT has not been verified (yet).
+        return None
+
+def replica_lag(engine: Engine) -> float | None:
+    """
+    Return how many seconds the replica is behind its source, or None if replication is broken.
+
+    Only MySQL replicas report lag (`SHOW REPLICA STATUS` needs the
+    REPLICATION CLIENT privilege); a server that is not a replica, and any
+    other database, counts as up to date.
+    """
+    if engine.dialect.name != "mysql":
+        return 0.0
+
+    with engine.connect() as conn:
+        status = conn.execute(text("SHOW REPLICA STATUS")).mappings().first()
+    if status is None:
+        return 0.0
+
+    lag = status.get("Seconds_Behind_Source")
+    return None if lag is None else float(lag)
+
+def replica_is_healthy(engine: Engine) -> bool:
+    """
+    Whether the replica may serve reads: reachable and at most `REPLICA_MAX_LAG` seconds behind.
+
+    The answer is cached in process for `REPLICA_LAG_CHECK_INTERVAL` seconds.
+    """
+    healthy = _replica_health.get(engine)
+    if healthy is not None:
+        return healthy
+
+    config = current_app.config
+    try:
+        lag = replica_lag(engine)
+        healthy = lag is not None and lag <= config["REPLICA_MAX_LAG"]
+        if not healthy:
+            logger.warning("Replica is lagging; reading from primary.", extra={"lag": lag})
+    except SQLAlchemyError as e:
+        logger.warning("Replica is unavailable; reading from primary.", extra={"error": str(e)})
+        healthy = False
+
+    _replica_health.set(engine, healthy, ttl=config["REPLICA_LAG_CHECK_INTERVAL"])
+    return healthy
+
+@contextmanager
+def _reads(replica: bool) -> Iterator[None]:
+    session = current_app.extensions["sqlalchemy"].session
+    previous = session.info.get(REPLICA_READS, False)
+    session.info[REPLICA_READS] = replica
+    try:
+        yield
+    finally:
+        session.info[REPLICA_READS] = previous
+
+def replica_reads():
+    """
+    Send the SELECTs of the enclosed block to the replica, e.g. for orchestrator scans.
+
+    Works as a context manager and as a function decorator.
+    """
+    return _reads(True)
+
+def primary_reads():
+    """Keep the SELECTs of the enclosed block on the primary, e.g. lookups that must see the latest writes."""
+    return _reads(False)
+
+def init_app(app: Flask) -> None:
+    """Route reads of GET/HEAD requests to the replica bind, if one is configured."""
+
+    @app.before_request
+    def route_safe_methods() -> None:
+        if request.method in SAFE_METHODS and REPLICA_BIND in app.config.get("SQLALCHEMY_BINDS", {}):
+            app.extensions["sqlalchemy"].session.info[REPLICA_READS] = True
+
+    @app.teardown_request
+    def reset_routing(exc: BaseException | None) -> None:
+        info = app.extensions["sqlalchemy"].session.info
+        for key in (REPLICA_READS, WROTE, UNMARKED_WRITE, RECENT_WRITE):
+            info.pop(key, None)
+
+def reset_cache() -> None:
+    """Forget cached replica health answers."""
+    _replica_health.clear()
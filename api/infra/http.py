@@ -0,0 +1,32 @@
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: requests.Session | None = None
+_session_pid: int | None = None
+
+def _build_session() -> requests.Session:
+    pool_size = int(os.getenv("MAILGUN_POOL_SIZE", 10))
+    # pool_block keeps the number of open connections bounded by pool_size.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by outbound calls in this process.
+
+    Connections are kept alive and reused, so TCP and TLS handshakes are paid
+    once per pooled connection instead of once per request. The session is
+    rebuilt after a fork, because pooled sockets must not be shared between
+    RQ work horses or gunicorn workers.
+    """
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        _session = _build_session()
+        _session_pid = os.getpid()
+    return _session
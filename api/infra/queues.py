@@ -1,12 +1,128 @@
-from rq import Queue
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+from rq import Queue, Retry
+from rq.job import Job
+from rq.queue import EnqueueData
+from redis import RedisError
 
 from api.infra.redis import get_redis
 
-def get_email_queue():
-    return Queue("emails", connection=get_redis())
+# Number of prepared jobs pushed per `enqueue_many` pipeline.
+ENQUEUE_MANY_FLUSH_SIZE = 100
 
-def get_reminder_queue():
-    return Queue("reminders", connection=get_redis())
+logger = logging.getLogger(__name__)
 
-def get_report_queue():
-    return Queue("reports", connection=get_redis())
\ No newline at end of file
+@dataclass(frozen=True)
+class QueuePolicy:
+    """
+    Defaults applied to every job enqueued through this module.
+
+    `serializer` is passed to both the queue and its workers; None keeps
+    RQ's default pickle serializer.
+    """
+    job_timeout: int = 60
+    retry_max: int = 3
+    retry_intervals: tuple[int, ...] = (30, 60, 120)
+    serializer: Any = None
+
+    def retry(self) -> Retry:
+        return Retry(max=self.retry_max, interval=list(self.retry_intervals))
+
+DEFAULT_POLICY = QueuePolicy()
+
+QUEUE_POLICIES = {
+    "emails": QueuePolicy(job_timeout=30),
+    "reminders": QueuePolicy(job_timeout=60),
+    "reports": QueuePolicy(job_timeout=60),
+}
+
+_queues: dict[str, Queue] = {}
+
+def get_policy(queue_name: str) -> QueuePolicy:
+    return QUEUE_POLICIES.get(queue_name, DEFAULT_POLICY)
+
+def get_queue(name: str) -> Queue:
+    """
+    Return the queue called `name`, built once per process.
+
+    A queue is rebuilt only when `get_redis` hands out a new client, i.e.
+    after a fork or a `reset_redis`.
+    """
+    connection = get_redis()
+    queue = _queues.get(name)
+    if queue is None or queue.connection is not connection:
+        policy = get_policy(name)
+        queue = Queue(name, connection=connection, serializer=policy.serializer, default_timeout=policy.job_timeout)
+        _queues[name] = queue
+    return queue
+
+def reset_queues() -> None:
+    _queues.clear()
+
+def get_email_queue() -> Queue:
+    return get_queue("emails")
+
+def get_reminder_queue() -> Queue:
+    return get_queue("reminders")
+
+def get_report_queue() -> Queue:
+    return get_queue("reports")
+
+def enqueue(queue: Queue, func: Callable, *args: Any, **options: Any) -> Job:
+    """
+    Enqueue `func(*args)` with the queue's default retry and timeout policy.
+
+    Keyword `options` are passed on to `Queue.enqueue` and override the
+    policy defaults (e.g. `job_timeout=...`).
+    """
+    policy = get_policy(queue.name)
+    options.setdefault("retry", policy.retry())
+    options.setdefault("job_timeout", policy.job_timeout)
+    return queue.enqueue(func, *args, **options)
+
+def prepare_job(queue: Queue, func: Callable, *args: Any, **options: Any) -> EnqueueData:
+    """
+    Prepare `func(*args)` for `enqueue_many` with the queue's default policy.
+
+    Keyword `options` are passed on to `Queue.prepare_data` and override the
+    policy defaults (e.g. `timeout=...`).
+    """
+    policy = get_policy(queue.name)
+    options.setdefault("retry", policy.retry())
+    options.setdefault("timeout", policy.job_timeout)
+    return Queue.prepare_data(func, args=args, **options)
+
+def enqueue_many(queue: Queue, job_datas: Iterable[EnqueueData], flush_size: int = ENQUEUE_MANY_FLUSH_SIZE) -> int:
+    """
+    Enqueue prepared jobs, `flush_size` jobs per Redis pipeline.
+
+    `job_datas` may be a generator; it is consumed lazily. A flush that
+    fails is logged and skipped so the remaining jobs are still enqueued.
+
+    Returns:
+        int: Number of jobs enqueued.
+    """
+    enqueued = 0
+    pending = []
+
+    for job_data in job_datas:
+        pending.append(job_data)
+        if len(pending) >= flush_size:
+            enqueued += _flush(queue, pending)
+            pending = []
+
+    if pending:
+        enqueued += _flush(queue, pending)
+    return enqueued
+
+def _flush(queue: Queue, job_datas: list[EnqueueData]) -> int:
+    try:
+        queue.enqueue_many(job_datas)
+    except RedisError as e:
+        logger.error(
+            "Failed to enqueue jobs",
+            extra={"error": str(e), "queue": queue.name, "jobs": len(job_datas)}
+        )
+        return 0
+    return len(job_datas)
@@ -1,7 +1,96 @@
 import os
+import threading
 import redis
 
-_redis = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+class InstrumentedBlockingConnectionPool(redis.BlockingConnectionPool):
+    """BlockingConnectionPool that counts the connections it opened and has handed out."""
 
-def get_redis():
-    return _redis
\ No newline at end of file
+    def reset(self):
+        # Also runs in __init__ and when the pool is first used after a fork.
+        self._stats_lock = threading.Lock()
+        self.created_connections = 0
+        self._in_use: set[int] = set()
+        super().reset()
+
+    @property
+    def in_use_connections(self) -> int:
+        return len(self._in_use)
+
+    def make_connection(self):
+        connection = super().make_connection()
+        with self._stats_lock:
+            self.created_connections += 1
+        return connection
+
+    def get_connection(self, *args, **kwargs):
+        connection = super().get_connection(*args, **kwargs)
+        with self._stats_lock:
+            self._in_use.add(id(connection))
+        return connection
+
+    def release(self, connection):
+        # Also called by get_connection for a connection that failed to connect.
+        with self._stats_lock:
+            self._in_use.discard(id(connection))
+        super().release(connection)
+
+_redis: redis.Redis | None = None
+_redis_pid: int | None = None
+
+def _build_pool() -> InstrumentedBlockingConnectionPool:
+    # A blocking pool caps open connections at max_connections; callers wait
+    # up to REDIS_POOL_TIMEOUT seconds for a free one instead of opening more.
+    return InstrumentedBlockingConnectionPool.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", 20)),
+        timeout=float(os.getenv("REDIS_POOL_TIMEOUT", 5)),
+        socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", 5)),
+        socket_connect_timeout=float(os.getenv("REDIS_CONNECT_TIMEOUT", 2)),
+        health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30)),
+        retry_on_timeout=os.getenv("REDIS_RETRY_ON_TIMEOUT", "true").lower() == "true",
+    )
+
+def get_redis() -> redis.Redis:
+    """
+    Return the Redis client shared by this process.
+
+    The client and its connection pool are created on first use and again
+    after a fork, so gunicorn workers and RQ work horses each open their own
+    connections lazily instead of all reusing (or all reconnecting) the
+    parent's sockets at once.
+    """
+    global _redis, _redis_pid
+
+    if _redis is None or _redis_pid != os.getpid():
+        _redis = redis.Redis(connection_pool=_build_pool())
+        _redis_pid = os.getpid()
+    return _redis
+
+def reset_redis() -> None:
+    """Drop this process's client, e.g. right after a fork; the next call to `get_redis` builds a new one."""
+    global _redis, _redis_pid
+
+    if _redis is not None and _redis_pid == os.getpid():
+        _redis.connection_pool.disconnect()
+    _redis = None
+    _redis_pid = None
+
+def get_redis_pool_stats() -> dict[str, int]:
+    """
+    Return connection pool utilization for this process.
+
+    Returns:
+        dict[str, int]: 'max_connections', 'created' (connections opened so
+        far), 'in_use' (checked out right now) and 'idle' (open and free).
+    """
+    if _redis is None or _redis_pid != os.getpid():
+        return {"max_connections": 0, "created": 0, "in_use": 0, "idle": 0}
+
+    pool = _redis.connection_pool
+    created, in_use = pool.created_connections, pool.in_use_connections
+    return {
+        "max_connections": pool.max_connections,
+        "created": created,
+        "in_use": in_use,
+        "idle": created - in_use,
+    }
@@ -0,0 +1,142 @@
+import json
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable
+from flask import Response, current_app, request
+from flask_jwt_extended import get_jwt_identity
+from redis.exceptions import RedisError
+
+from api.infra.redis import get_redis
+
+# Response headers that are recomputed rather than replayed from the cache.
+SKIPPED_HEADERS = {"Content-Length", "Content-Type"}
+
+logger = logging.getLogger(__name__)
+
+_stats = {"hits": 0, "misses": 0, "stores": 0, "too_large": 0, "errors": 0}
+_stats_lock = threading.Lock()
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+def _version_key(user_id: Any) -> str:
+    return f"cache:version:{user_id}"
+
+def _entry_key(user_id: Any) -> str:
+    # Date-relative responses (upcoming payments, the current month's summary)
+    # must not outlive the day they were computed on.
+    today = datetime.now(timezone.utc).date().isoformat()
+    args = json.dumps(sorted(request.args.items(multi=True)))
+    digest = hashlib.sha1(f"{today}:{args}".encode()).hexdigest()
+    return f"cache:response:{user_id}:{request.endpoint}:{digest}"
+
+def invalidate_user(user_id: Any) -> None:
+    """
+    Invalidate every cached response of a user, on all web replicas.
+
+    Call after the write is committed. A missing version key starts from the
+    current time rather than 0, so a key lost to eviction can never bring an
+    older entry's version back.
+    """
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.set(_version_key(user_id), time.time_ns(), nx=True)
+        pipe.incr(_version_key(user_id))
+        pipe.execute()
+    except RedisError as e:
+        # Cached entries are bounded by RESPONSE_CACHE_TTL even if this fails.
+        logger.error("Could not invalidate cached responses.", extra={"user_id": user_id, "error": str(e)})
+
+def _current_version(redis_conn, user_id: Any, stored_version: bytes | None) -> str:
+    if stored_version is not None:
+        return stored_version.decode()
+
+    pipe = redis_conn.pipeline(transaction=False)
+    pipe.set(_version_key(user_id), time.time_ns(), nx=True)
+    pipe.get(_version_key(user_id))
+    return pipe.execute()[1].decode()
+
+def cached_response(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Serve a user's GET responses from Redis while their subscriptions are unchanged.
+
+    Place the decorator below `jwt_required` and above `blp.response`, so it
+    caches the final JSON body and headers and a hit skips the database,
+    argument parsing and serialization. Entries are keyed by user, endpoint
+    and query arguments and hold the user's version at the time they were
+    computed, so an `invalidate_user` call on any replica turns them all into
+    misses. The version and the entry are read in one round trip.
+
+    Entries expire after `RESPONSE_CACHE_TTL` seconds and bodies larger than
+    `RESPONSE_CACHE_MAX_ENTRY_BYTES` are not stored. When Redis fails, the
+    response is computed as if the cache were disabled.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        config = current_app.config
+        if not config.get("RESPONSE_CACHE_ENABLED") or request.method != "GET":
+            return view(*args, **kwargs)
+
+        user_id = get_jwt_identity()
+        entry_key = _entry_key(user_id)
+        try:
+            redis_conn = get_redis()
+            stored_version, entry = redis_conn.mget([_version_key(user_id), entry_key])
+            version = _current_version(redis_conn, user_id, stored_version)
+        except RedisError as e:
+            logger.warning("Response cache unavailable.", extra={"error": str(e)})
+            _count("errors")
+            return view(*args, **kwargs)
+
+        if entry is not None:
+            cached = json.loads(entry)
+            if cached["version"] == version:
+                _count("hits")
+                response = Response(cached["body"], status=200, headers=cached["headers"], mimetype="application/json")
+                return response.make_conditional(request)
+
+        _count("misses")
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code != 200:
+            return response
+
+        body = response.get_data()
+        if len(body) > config["RESPONSE_CACHE_MAX_ENTRY_BYTES"]:
+            _count("too_large")
+            return response
+
+        entry = json.dumps({
+            "version": version,
+            "headers": [(name, value) for name, value in response.headers if name not in SKIPPED_HEADERS],
+            "body": body.decode(),
+        })
+        try:
+            redis_conn.set(entry_key, entry, ex=config["RESPONSE_CACHE_TTL"])
+            _count("stores")
+        except RedisError as e:
+            logger.warning("Could not store cached response.", extra={"error": str(e)})
+            _count("errors")
+        return response
+
+    return wrapper
+
+def get_stats() -> dict[str, int]:
+    """
+    Return this process's response cache counters.
+
+    Returns:
+        dict[str, int]: 'hits', 'misses', 'stores', 'too_large' (responses
+        not stored because of their size) and 'errors' (Redis failures).
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+def reset_stats() -> None:
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,58 @@
+import os
+import jinja2
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+EMAIL_TEMPLATES = (
+    "email/reminder.html",
+    "email/monthly_summary.html",
+    "email/registration.html",
+)
+
+_env: jinja2.Environment | None = None
+
+def _build_env() -> jinja2.Environment:
+    cache_dir = os.getenv("TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        bytecode_cache=jinja2.FileSystemBytecodeCache(cache_dir),
+        # Without auto-reload, a loaded template is served from memory
+        # without stat()-ing its source file on every render.
+        auto_reload=os.getenv("TEMPLATE_AUTO_RELOAD", "false").lower() == "true",
+    )
+
+def get_template_env() -> jinja2.Environment:
+    """
+    Return the Jinja2 environment used to render email templates.
+
+    Templates are resolved relative to the `api` package, so rendering does
+    not depend on the working directory. Compiled templates are written to a
+    bytecode cache on disk (`TEMPLATE_CACHE_DIR`, the system temp directory
+    by default) and reused by later processes, which then skip parsing and
+    compiling the sources. Auto-reload is off unless `TEMPLATE_AUTO_RELOAD`
+    is set, as in development.
+    """
+    global _env
+
+    if _env is None:
+        _env = _build_env()
+    return _env
+
+def get_template(name: str) -> jinja2.Template:
+    return get_template_env().get_template(name)
+
+def precompile_templates(names: tuple[str, ...] = EMAIL_TEMPLATES) -> int:
+    """
+    Load and compile templates ahead of the first render.
+
+    Called at worker startup, before RQ forks its work horses, so every job
+    inherits the compiled templates instead of loading them itself.
+
+    Returns:
+        int: Number of templates compiled.
+    """
+    for name in names:
+        get_template(name)
+    return len(names)
@@ -1,11 +1,24 @@
 from flask import jsonify
 from api.extensions import jwt
-from api.services.blocklist import is_jti_blocked
+from api.services.blocklist import is_token_revoked, now_ms
+from api.services.user_cache import get_user_record
+
+@jwt.additional_claims_loader
+def add_issued_at_ms(identity):
+    # `iat` has one-second resolution; revocation epochs are compared with this instead.
+    return {"iat_ms": now_ms()}
 
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
-    jti = jwt_payload["jti"]
-    return is_jti_blocked(jti)
+    return is_token_revoked(jwt_payload)
+
+@jwt.user_lookup_loader
+def load_current_user(jwt_header, jwt_payload):
+    return get_user_record(jwt_payload["sub"])
+
+@jwt.user_lookup_error_loader
+def user_lookup_error_callback(jwt_header, jwt_payload):
+    return (jsonify({"message": "User not found.", "error": "user_not_found"}), 401)
 
 @jwt.revoked_token_loader
 def revoked_token_callback(jwt_header, jwt_payload):
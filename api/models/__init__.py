@@ -1,3 +1,4 @@
 from api.models.user import UserModel
 from api.models.subscription import SubscriptionModel
-from api.models.reminder_log import ReminderLogModel
\ No newline at end of file
+from api.models.reminder_log import ReminderLogModel
+from api.models.monthly_spend_rollup import MonthlySpendRollupModel
\ No newline at end of file
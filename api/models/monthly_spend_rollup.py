@@ -0,0 +1,21 @@
+from api.extensions import db
+
+class MonthlySpendRollupModel(db.Model):
+    __tablename__ = "monthly_spend_rollups"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    month = db.Column(db.String(7), nullable=False)  # YYYY-MM
+    category = db.Column(db.String(80), nullable=False)
+    total = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    subscription_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # Relationships
+    user = db.relationship("UserModel", back_populates="spend_rollups")
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'month', 'category', name='unique_user_month_category'),
+    )
+
+    def __repr__(self):
+        return f"<MonthlySpendRollup user_id={self.user_id} month={self.month} category={self.category}>"
@@ -13,5 +13,9 @@ class ReminderLogModel(db.Model):
     # Relationships
     subscription = db.relationship("SubscriptionModel", back_populates="reminders")
 
+    __table_args__ = (
+        db.Index('ix_reminder_logs_subscription_id_sent_at', 'subscription_id', 'sent_at'),
+    )
+
     def __repr__(self):
         return f"<ReminderLog sub_id={self.subscription_id} sent_at={self.sent_at}>"
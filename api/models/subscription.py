@@ -21,6 +21,12 @@ class SubscriptionModel(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint('user_id', 'name', name='unique_user_subscription_name'),
+        # Global nightly scans filter by date and page by id; per-user ranges filter by user first.
+        db.Index('ix_subscriptions_next_payment_date_id', 'next_payment_date', 'id'),
+        db.Index('ix_subscriptions_user_id_next_payment_date', 'user_id', 'next_payment_date'),
+        # Listing filters/sorts: category keeps the default payment date order, price backs range filters and sorting.
+        db.Index('ix_subscriptions_user_id_category_next_payment_date', 'user_id', 'category', 'next_payment_date'),
+        db.Index('ix_subscriptions_user_id_price', 'user_id', 'price'),
     )
 
     def __repr__(self):
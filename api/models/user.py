@@ -7,12 +7,15 @@ class UserModel(db.Model):
     username = db.Column(db.String(80), nullable=False)
     email = db.Column(db.String(80), unique=True, nullable=False)
     password = db.Column(db.String(256), nullable=False)
+    # Bumped on every subscription write; conditional GETs derive their ETags from it.
+    subscriptions_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now(), nullable=False)
 
     # Relationships
     subscriptions = db.relationship("SubscriptionModel", back_populates="user", lazy="dynamic", cascade="all, delete-orphan")
+    spend_rollups = db.relationship("MonthlySpendRollupModel", back_populates="user", lazy="dynamic", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<User id={self.id} username={self.username} email={self.email}>"
\ No newline at end of file
@@ -1,23 +1,35 @@
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime, timezone
 from typing import List
 
 from api.schemas import SubscriptionSchema, UpcomingQueryArgsSchema
 from api.models import SubscriptionModel
 from api.services import subscription as subscription_service
-from api.docs.common_responses import apply_common_responses, LISTING_ERRORS
+from api.docs.common_responses import apply_common_responses, LISTING_ERRORS, NOT_MODIFIED, ETAG_HEADERS
+from api.infra.response_cache import cached_response
+from api.utils.etag import conditional_get
 
 blp = Blueprint("reminder", __name__, description="Endpoints for managing upcoming subscription payment reminders")
 
 @blp.route("/reminders/upcoming")
 class RemindersList(MethodView):
     @jwt_required()
+    @cached_response
     @blp.arguments(UpcomingQueryArgsSchema, location="query")
-    @blp.response(200, SubscriptionSchema(many=True), description="List of user upcoming payments for subscriptions.")
-    @apply_common_responses(blp, LISTING_ERRORS)
-    def get(self, query_args: dict[str, int]) -> List[SubscriptionModel]:
+    @blp.response(
+        200,
+        SubscriptionSchema(many=True),
+        description="List of user upcoming payments for subscriptions.",
+        headers=ETAG_HEADERS
+    )
+    @apply_common_responses(blp, LISTING_ERRORS + NOT_MODIFIED)
+    def get(self, query_args: dict[str, int]) -> tuple[List[SubscriptionModel], dict[str, str]]:
         """Return upcoming subscription payments for the authenticated user within the specified number of days."""
         user_id = get_jwt_identity()
         days = query_args['days']
-        return subscription_service.get_user_upcoming_within(user_id, days)
\ No newline at end of file
+        # The window moves every day even when no subscription changes.
+        today = datetime.now(timezone.utc).date()
+        headers = conditional_get(user_id, subscription_service.get_subscriptions_version(user_id), today)
+        return subscription_service.get_user_upcoming_within(user_id, days), headers
\ No newline at end of file
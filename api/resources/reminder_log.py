@@ -1,12 +1,14 @@
+from flask import Response
 from flask.views import MethodView
 from flask_smorest import Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from typing import List
 
-from api.schemas import ReminderLogResponseSchema
+from api.schemas import ReminderLogResponseSchema, ExportQueryArgsSchema
 from api.models import ReminderLogModel
 from api.services import reminder_log as reminder_log_service
-from api.docs.common_responses import apply_common_responses, RESOURCE_ERRORS
+from api.docs.common_responses import apply_common_responses, RESOURCE_ERRORS, LISTING_ERRORS
+from api.utils.export import stream_export
 
 blp = Blueprint("reminder_log", __name__, description="Endpoints for tracking and retrieving reminder delivery logs")
 
@@ -19,6 +21,28 @@ class ReminderLogList(MethodView):
         user_id = get_jwt_identity()
         return reminder_log_service.get_user_reminder_logs_by_subscription(sub_id, user_id)
 
+@blp.route("/reminder_logs/export")
+class ReminderLogExport(MethodView):
+    @jwt_required()
+    @blp.arguments(ExportQueryArgsSchema, location="query")
+    @blp.response(
+        200,
+        content_type="application/x-ndjson",
+        description="Reminder logs of all the user's subscriptions, with subscription names, as NDJSON or CSV."
+    )
+    @apply_common_responses(blp, LISTING_ERRORS)
+    def get(self, query_args: dict[str, str]) -> Response:
+        """
+        Download the reminder logs of all the authenticated user's subscriptions.
+
+        Logs are joined with their subscriptions in a single query and
+        streamed while they are read, so memory stays constant regardless
+        of how many logs the user has.
+        """
+        user_id = get_jwt_identity()
+        rows = reminder_log_service.iter_user_reminder_logs_for_export(user_id)
+        return stream_export("reminder_logs", reminder_log_service.REMINDER_LOG_EXPORT_FIELDS, rows, query_args['format'])
+
 @blp.route("/reminder_logs/<int:log_id>")
 class ReminderLog(MethodView):
     @jwt_required()
@@ -1,21 +1,31 @@
+from datetime import date
 from flask.views import MethodView
 from flask_smorest import Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from api.schemas import StatsSummaryResponseSchema, StatsSummaryQueryArgsSchema
 from api.services import subscription as subscription_service
-from api.docs.common_responses import apply_common_responses, LISTING_ERRORS
+from api.docs.common_responses import apply_common_responses, LISTING_ERRORS, NOT_MODIFIED, ETAG_HEADERS
+from api.infra.response_cache import cached_response
+from api.utils.etag import conditional_get
 
 blp = Blueprint("statistic", __name__, description="Endpoints for generating monthly spending summaries and subscription statistics")
 
 @blp.route("/stats/summary")
 class StatsSummary(MethodView):
     @jwt_required()
+    @cached_response
     @blp.arguments(StatsSummaryQueryArgsSchema, location="query")
-    @blp.response(200, StatsSummaryResponseSchema, description="Monthly spending summary")
-    @apply_common_responses(blp, LISTING_ERRORS)
-    def get(self, query_args: dict[str, str]) -> dict[str, object]:
+    @blp.response(200, StatsSummaryResponseSchema, description="Monthly spending summary", headers=ETAG_HEADERS)
+    @apply_common_responses(blp, LISTING_ERRORS + NOT_MODIFIED)
+    def get(self, query_args: dict[str, str]) -> tuple[dict[str, object], dict[str, str]]:
         """Retrieve a summary of monthly subscription spending."""
         user_id = get_jwt_identity()
         month = query_args.get("month")
-        return subscription_service.get_monthly_summary(user_id, month)
\ No newline at end of file
+        # Without a month the summary follows the calendar, so the month is part of the version.
+        headers = conditional_get(
+            user_id,
+            subscription_service.get_subscriptions_version(user_id),
+            month or date.today().strftime("%Y-%m"),
+        )
+        return subscription_service.get_monthly_summary(user_id, month), headers
\ No newline at end of file
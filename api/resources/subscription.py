@@ -1,23 +1,89 @@
+from flask import Response, current_app, request
 from flask.views import MethodView
-from flask_smorest import Blueprint
+from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from typing import List
+from typing import Any, List
+from urllib.parse import urlencode
 
-from api.schemas import SubscriptionSchema, SubscriptionUpdateSchema
+from api.schemas import (
+    SubscriptionSchema,
+    SubscriptionUpdateSchema,
+    SubscriptionListQueryArgsSchema,
+    SubscriptionImportResultSchema,
+    ExportQueryArgsSchema
+)
 from api.models import SubscriptionModel
 from api.services import subscription as subscription_service
-from api.docs.common_responses import apply_common_responses, RESOURCE_ERRORS, CREATION_ERRORS, LISTING_ERRORS
+from api.services import subscription_import
+from api.docs.common_responses import (
+    apply_common_responses,
+    RESOURCE_ERRORS,
+    CREATION_ERRORS,
+    LISTING_ERRORS,
+    NOT_MODIFIED,
+    ETAG_HEADERS
+)
+from api.infra.response_cache import cached_response
+from api.utils.etag import conditional_get
+from api.utils.export import stream_export
+from api.utils.pagination import encode_cursor
 
 blp = Blueprint("subscription", __name__, description="Endpoints for managing user subscriptions")
 
 @blp.route("/subscriptions")
 class SubscriptionsList(MethodView):
     @jwt_required()
-    @blp.response(200, SubscriptionSchema(many=True), description="List of user subscriptions.")
-    @apply_common_responses(blp, LISTING_ERRORS)
-    def get(self) -> List[SubscriptionModel]:
+    @cached_response
+    @blp.arguments(SubscriptionListQueryArgsSchema, location="query")
+    @blp.response(
+        200,
+        SubscriptionSchema(many=True),
+        description="One page of user subscriptions, ordered by next payment date unless `sort` says otherwise.",
+        headers={
+            **ETAG_HEADERS,
+            "X-Next-Cursor": {
+                "description": "Cursor of the next page; absent on the last page.",
+                "schema": {"type": "string"},
+            },
+            "Link": {
+                "description": 'URL of the next page with rel="next"; absent on the last page.',
+                "schema": {"type": "string"},
+            },
+        },
+    )
+    @apply_common_responses(blp, LISTING_ERRORS + NOT_MODIFIED)
+    def get(self, query_args: dict[str, Any]) -> tuple[List[dict[str, Any]], dict[str, str]]:
+        """
+        Return the authenticated user's subscriptions, one page at a time.
+
+        Pages are keyset-paginated: follow the `Link` header, or pass the
+        `X-Next-Cursor` header value as `cursor`, to fetch the next page.
+        `fields` limits both the returned fields and the columns read.
+        Filters and `sort` are applied in the database; a cursor only
+        works with the sort order it was issued for.
+        """
         user_id = get_jwt_identity()
-        return subscription_service.get_user_subscriptions(user_id)
+        headers = conditional_get(user_id, subscription_service.get_subscriptions_version(user_id))
+
+        subscriptions, next_after = subscription_service.get_user_subscriptions_page(
+            user_id,
+            limit=query_args['limit'],
+            after=query_args.get('after'),
+            fields=query_args.get('fields'),
+            filters={
+                name: query_args[name]
+                for name in ("category", "billing_cycle", "min_price", "max_price", "due_after", "due_before")
+                if name in query_args
+            },
+            sort=query_args['sort'],
+        )
+
+        if next_after is not None:
+            cursor = encode_cursor([query_args['sort'], *next_after])
+            next_args = {**request.args.to_dict(), "cursor": cursor}
+            headers["X-Next-Cursor"] = cursor
+            headers["Link"] = f'<{request.base_url}?{urlencode(next_args)}>; rel="next"'
+        return subscriptions, headers
 
     @jwt_required()
     @blp.arguments(SubscriptionSchema)
@@ -27,14 +93,80 @@ class SubscriptionsList(MethodView):
         user_id = get_jwt_identity()
         return subscription_service.create_subscription(data, user_id)
     
+@blp.route("/subscriptions/export")
+class SubscriptionsExport(MethodView):
+    @jwt_required()
+    @blp.arguments(ExportQueryArgsSchema, location="query")
+    @blp.response(200, content_type="application/x-ndjson", description="All subscriptions of the user, as NDJSON or CSV.")
+    @apply_common_responses(blp, LISTING_ERRORS)
+    def get(self, query_args: dict[str, str]) -> Response:
+        """
+        Download all of the authenticated user's subscriptions.
+
+        The body is streamed while rows are read from the database, so
+        exports of any size use constant memory.
+        """
+        user_id = get_jwt_identity()
+        rows = subscription_service.iter_user_subscriptions_for_export(user_id)
+        return stream_export("subscriptions", subscription_service.SUBSCRIPTION_FIELDS, rows, query_args['format'])
+
+# Streamed bodies are parsed row by row while the import runs.
+STREAMED_IMPORT_PARSERS = {
+    "text/csv": subscription_import.iter_csv_rows,
+    "application/x-ndjson": subscription_import.iter_ndjson_rows,
+}
+
+@blp.route("/subscriptions/import")
+class SubscriptionsImport(MethodView):
+    @jwt_required()
+    @blp.doc(requestBody={
+        "required": True,
+        "description": "Subscriptions as a JSON array, CSV with a header line, or NDJSON (one object per line).",
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": SubscriptionSchema}},
+            "text/csv": {"schema": {"type": "string"}},
+            "application/x-ndjson": {"schema": {"type": "string"}},
+        },
+    })
+    @blp.response(200, SubscriptionImportResultSchema, description="Import finished; rows that were not created are listed in `errors`.")
+    @blp.alt_response(400, description="Body is not a JSON array.")
+    @blp.alt_response(415, description="Unsupported body content type.")
+    @apply_common_responses(blp, LISTING_ERRORS)
+    def post(self) -> dict[str, Any]:
+        """
+        Create many subscriptions at once, e.g. when migrating from a spreadsheet.
+
+        Rows are validated like `POST /subscriptions` and committed in
+        batches; invalid or conflicting rows are reported by row number
+        without stopping the rest of the import.
+        """
+        user_id = get_jwt_identity()
+
+        if request.mimetype == "application/json":
+            rows = request.get_json(silent=True)
+            if not isinstance(rows, list):
+                abort(400, message="Expected a JSON array of subscriptions.")
+        elif request.mimetype in STREAMED_IMPORT_PARSERS:
+            rows = STREAMED_IMPORT_PARSERS[request.mimetype](request.stream)
+        else:
+            abort(415, message="Send subscriptions as application/json, text/csv or application/x-ndjson.")
+
+        return subscription_import.import_subscriptions(
+            user_id,
+            rows,
+            batch_size=current_app.config['SUBSCRIPTION_IMPORT_BATCH_SIZE'],
+            max_rows=current_app.config['SUBSCRIPTION_IMPORT_MAX_ROWS'],
+        )
+
 @blp.route("/subscriptions/<int:sub_id>")
 class Subscription(MethodView):
     @jwt_required()
-    @blp.response(200, SubscriptionSchema, description="Subscription details retrieved successfully.")
-    @apply_common_responses(blp, RESOURCE_ERRORS)
-    def get(self, sub_id: int) -> SubscriptionModel:
+    @blp.response(200, SubscriptionSchema, description="Subscription details retrieved successfully.", headers=ETAG_HEADERS)
+    @apply_common_responses(blp, RESOURCE_ERRORS + NOT_MODIFIED)
+    def get(self, sub_id: int) -> tuple[SubscriptionModel, dict[str, str]]:
         user_id = get_jwt_identity()
-        return subscription_service.get_user_subscription_by_id(sub_id, user_id)
+        headers = conditional_get(user_id, subscription_service.get_subscriptions_version(user_id))
+        return subscription_service.get_user_subscription_by_id(sub_id, user_id), headers
     
     @jwt_required()
     @blp.arguments(SubscriptionUpdateSchema)
@@ -5,7 +5,10 @@ from typing import Any
 from sqlalchemy.exc import SQLAlchemyError
 
 from api.extensions import db
+from api.infra import db_pool, response_cache
+from api.infra.redis import get_redis_pool_stats
 from api.models import UserModel
+from api.services import user_cache
 from api.schemas import (
     ReminderSendTestSchema, 
     StatsSendTestSchema, 
@@ -54,9 +57,9 @@ class TestFreshAuthEndpoint(MethodView):
 class User(MethodView):
     @blp.response(200, UserResponseSchema, description="User details retrieved successfully.")
     @blp.alt_response(404, description="User not found.")
-    def get(self, user_id: int) -> UserModel:
+    def get(self, user_id: int) -> user_cache.UserRecord:
         """Developer endpoint to retrieve user details by user ID."""
-        user = UserModel.query.filter_by(id=user_id).first()
+        user = user_cache.get_user_record(user_id)
         if not user:
             abort(404, message="User not found.")
         return user
@@ -75,6 +78,7 @@ class User(MethodView):
         except SQLAlchemyError:
             abort(500, message="An error occurred while deleting the user.")
 
+        user_cache.invalidate_user(user_id)
         return {"message": "User deleted."}
     
 @blp.route("/reminders/send-test")
@@ -111,4 +115,38 @@ class StatsSendTest(MethodView):
             user_email=args['email'], 
             summary=summary
         )
-        return {"status": "ok", "mailgun_status": response.status_code}
\ No newline at end of file
+        return {"status": "ok", "mailgun_status": response.status_code}
+    
+@blp.route("/redis/pool-stats")
+class RedisPoolStats(MethodView):
+    @blp.response(200, description="Redis connection pool utilization of the serving process.")
+    def get(self) -> dict[str, int]:
+        """
+        Developer endpoint to inspect the Redis connection pool of the worker process that served the request.
+        Useful for sizing REDIS_MAX_CONNECTIONS.
+        """
+        return get_redis_pool_stats()
+
+@blp.route("/db/pool-stats")
+class DatabasePoolStats(MethodView):
+    @blp.response(200, description="Database connection pool events and utilization of the serving process, per engine.")
+    def get(self) -> dict[str, Any]:
+        """
+        Developer endpoint to inspect the database connection pools of the worker process that served the request.
+        Reports the primary and, if configured, the replica separately.
+        Useful for sizing DB_POOL_SIZE and DB_MAX_OVERFLOW.
+        """
+        return {
+            bind or db_pool.PRIMARY: db_pool.get_pool_stats(engine, bind or db_pool.PRIMARY)
+            for bind, engine in db.engines.items()
+        }
+
+@blp.route("/cache/stats")
+class ResponseCacheStats(MethodView):
+    @blp.response(200, description="Response cache counters of the serving process.")
+    def get(self) -> dict[str, int]:
+        """
+        Developer endpoint to inspect the response cache hit/miss counters of the worker process that served the request.
+        Useful for tuning RESPONSE_CACHE_TTL.
+        """
+        return response_cache.get_stats()
@@ -1,18 +1,18 @@
 from flask import current_app
 from flask.views import MethodView
 from flask_smorest import abort, Blueprint
-from passlib.hash import pbkdf2_sha256 as sha256
-from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt, get_jwt_identity
+from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt, get_jwt_identity, current_user
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timezone
-from rq import Retry
 from redis.exceptions import RedisError
 
 from api.extensions import db
-from api.infra.queues import get_email_queue
+from api.infra.queues import get_email_queue, enqueue
 from api.models import UserModel
 from api.schemas import UserRegisterSchema, UserLoginSchema, UserResponseSchema
-from api.services.blocklist import add_jti_to_blocklist
+from api.services.blocklist import add_jti_to_blocklist, revoke_user_tokens
+from api.services.password import hash_password, verify_password
+from api.services.user_cache import UserRecord
 from api.tasks.email_tasks import send_user_registration_email
 
 blp = Blueprint("user", __name__, description="Endpoints for user registration, authentication and account management")
@@ -29,7 +29,7 @@ class UserRegister(MethodView):
         user = UserModel(
             username=user_data['username'],
             email=user_data['email'],
-            password=sha256.hash(user_data['password'])
+            password=hash_password(user_data['password'])
         )
 
         try:
@@ -39,13 +39,7 @@ class UserRegister(MethodView):
             abort(500, message="An error occurred while creating the user.")
 
         try:
-            get_email_queue().enqueue(
-                send_user_registration_email, 
-                user.email, 
-                user.username,
-                retry=Retry(max=3, interval=[30, 60, 120]),
-                job_timeout=30
-            )
+            enqueue(get_email_queue(), send_user_registration_email, user.email, user.username)
         except RedisError as e:
             current_app.logger.error(
                 "Failed to enqueue registration email task.",
@@ -62,7 +56,21 @@ class UserLogin(MethodView):
     def post(self, user_data: dict) -> dict[str, str]:
         user = UserModel.query.filter(UserModel.email == user_data['email']).first()
 
-        if user and sha256.verify(user_data['password'], user.password):
+        verified, new_hash = verify_password(user_data['password'], user.password) if user else (False, None)
+
+        if verified:
+            if new_hash:
+                # Hashing parameters changed since this hash was made.
+                try:
+                    user.password = new_hash
+                    db.session.commit()
+                except SQLAlchemyError as e:
+                    db.session.rollback()
+                    current_app.logger.warning(
+                        "Failed to store upgraded password hash.",
+                        extra={"error": str(e), "user_id": user.id}
+                    )
+
             access_token = create_access_token(identity=str(user.id), fresh=True)
             refresh_token = create_refresh_token(identity=str(user.id))
             return {"access_token": access_token, "refresh_token": refresh_token}
@@ -78,6 +86,15 @@ class UserLogout(MethodView):
         exp = get_jwt()['exp'] - datetime.now(timezone.utc).timestamp()
         add_jti_to_blocklist(jti, int(exp))
         return {"message": "Successfully logged out."}
+
+@blp.route("/logout/all")
+class UserLogoutAll(MethodView):
+    @jwt_required(refresh=True)
+    @blp.response(200, description="User logged out on all devices.")
+    def post(self) -> dict[str, str]:
+        # Every access and refresh token issued so far, including this one, stops working.
+        revoke_user_tokens(get_jwt_identity())
+        return {"message": "Successfully logged out on all devices."}
     
 @blp.route("/refresh")
 class TokenRefresh(MethodView):
@@ -92,7 +109,6 @@ class TokenRefresh(MethodView):
 class UserMe(MethodView):
     @jwt_required()
     @blp.response(200, UserResponseSchema, description="Authenticated user's profile.")
-    def get(self) -> UserModel:
-        user_id = get_jwt_identity()
-        user = UserModel.query.filter_by(id=user_id).first()
-        return user
\ No newline at end of file
+    def get(self) -> UserRecord:
+        # Loaded by the user_lookup_loader, usually from cache.
+        return current_user
\ No newline at end of file
@@ -1,6 +1,12 @@
 from api.schemas.user import UserRegisterSchema, UserLoginSchema, UserResponseSchema
-from api.schemas.subscription import SubscriptionSchema, SubscriptionUpdateSchema
+from api.schemas.subscription import (
+    SubscriptionSchema,
+    SubscriptionUpdateSchema,
+    SubscriptionListQueryArgsSchema,
+    SubscriptionImportResultSchema
+)
 from api.schemas.reminder_log import ReminderLogResponseSchema
 from api.schemas.reminder import UpcomingQueryArgsSchema
 from api.schemas.test import ReminderSendTestSchema, StatsSendTestSchema
-from api.schemas.statistic import StatsSummaryQueryArgsSchema, StatsSummaryResponseSchema
\ No newline at end of file
+from api.schemas.statistic import StatsSummaryQueryArgsSchema, StatsSummaryResponseSchema
+from api.schemas.export import ExportQueryArgsSchema
\ No newline at end of file
@@ -0,0 +1,10 @@
+from marshmallow import Schema, fields, validate
+
+from api.utils.export import EXPORT_FORMATS
+
+class ExportQueryArgsSchema(Schema):
+    format = fields.Str(
+        load_default="ndjson",
+        validate=validate.OneOf(list(EXPORT_FORMATS)),
+        metadata={"description": "Export format: ndjson (one JSON object per line) or csv."}
+    )
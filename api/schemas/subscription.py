@@ -1,7 +1,19 @@
-from marshmallow import Schema, fields, validate, ValidationError
+from marshmallow import Schema, fields, validate, ValidationError, missing, post_load, validates_schema
+from webargs.fields import DelimitedList
+from datetime import date
 from decimal import Decimal
 
 from api.models.enums import BillingCycleEnum
+from api.services.subscription import SUBSCRIPTION_FIELDS, SUBSCRIPTION_SORT_FIELDS
+from api.utils.pagination import decode_cursor
+
+SORT_CHOICES = [prefix + name for name in SUBSCRIPTION_SORT_FIELDS for prefix in ("", "-")]
+# How each sort column's value is read back from a cursor.
+CURSOR_VALUE_PARSERS = {
+    "next_payment_date": date.fromisoformat,
+    "name": str,
+    "price": Decimal,
+}
 
 class SubscriptionBaseSchema(Schema):
     id = fields.Int(dump_only=True)
@@ -10,7 +22,11 @@ class SubscriptionBaseSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
     def get_billing_cycle(self, obj):
-        return obj.billing_cycle.value if obj.billing_cycle else None
+        # Sparse fieldset rows are dicts that may not hold the column at all.
+        billing_cycle = self.get_attribute(obj, "billing_cycle", missing)
+        if billing_cycle is missing:
+            return missing
+        return billing_cycle.value if billing_cycle else None
 
     def load_billing_cycle(self, value):
         try:
@@ -50,4 +66,70 @@ class SubscriptionUpdateSchema(SubscriptionBaseSchema):
         }
     )
     next_payment_date = fields.Date()
-    category = fields.Str(validate=validate.Length(max=80))
\ No newline at end of file
+    category = fields.Str(validate=validate.Length(max=80))
+
+class SubscriptionImportRowErrorSchema(Schema):
+    row = fields.Int(dump_only=True, metadata={"description": "1-based row number in the imported body."})
+    errors = fields.Dict(dump_only=True, metadata={"description": "Error messages per field."})
+
+class SubscriptionImportResultSchema(Schema):
+    created = fields.Int(dump_only=True)
+    failed = fields.Int(dump_only=True)
+    errors = fields.List(fields.Nested(SubscriptionImportRowErrorSchema), dump_only=True)
+
+class SubscriptionListQueryArgsSchema(Schema):
+    limit = fields.Int(
+        load_default=100,
+        validate=validate.Range(min=1, max=1000),
+        metadata={"description": "Maximum number of subscriptions per page."}
+    )
+    cursor = fields.Str(
+        metadata={"description": "Opaque cursor from the X-Next-Cursor header of the previous page."}
+    )
+    category = fields.Str(metadata={"description": "Only subscriptions in this category."})
+    billing_cycle = fields.Enum(
+        BillingCycleEnum,
+        by_value=True,
+        metadata={"description": "Only subscriptions with this billing cycle."}
+    )
+    min_price = fields.Decimal(validate=validate.Range(min=0), metadata={"description": "Minimum price, inclusive."})
+    max_price = fields.Decimal(validate=validate.Range(min=0), metadata={"description": "Maximum price, inclusive."})
+    due_after = fields.Date(metadata={"description": "Only subscriptions due on or after this date (YYYY-MM-DD)."})
+    due_before = fields.Date(metadata={"description": "Only subscriptions due on or before this date (YYYY-MM-DD)."})
+    sort = fields.Str(
+        load_default="next_payment_date",
+        validate=validate.OneOf(SORT_CHOICES),
+        metadata={"description": "Sort field, prefixed with '-' for descending order."}
+    )
+    # Declared last: the attribute shadows the `fields` module in the class body.
+    fields = DelimitedList(
+        fields.Str(validate=validate.OneOf(SUBSCRIPTION_FIELDS)),
+        metadata={"description": "Comma-separated subset of fields to return, e.g. id,name,price."}
+    )
+
+    @validates_schema
+    def validate_ranges(self, data, **kwargs):
+        if data.get('min_price') is not None and data.get('max_price') is not None \
+                and data['min_price'] > data['max_price']:
+            raise ValidationError("min_price cannot be greater than max_price.", field_name="min_price")
+        if data.get('due_after') is not None and data.get('due_before') is not None \
+                and data['due_after'] > data['due_before']:
+            raise ValidationError("due_after cannot be later than due_before.", field_name="due_after")
+
+    @post_load
+    def load_cursor(self, data, **kwargs):
+        """Turn the cursor into the `(sort value, id)` key the page starts after."""
+        cursor = data.pop('cursor', None)
+        if cursor is None:
+            return data
+
+        # A cursor is only valid for the sort order it was issued under.
+        try:
+            sort, after_value, after_id = decode_cursor(cursor)
+            if sort != data['sort']:
+                raise ValueError("Cursor was issued for another sort order.")
+            data['after'] = (CURSOR_VALUE_PARSERS[sort.lstrip("-")](after_value), int(after_id))
+        except (ValueError, TypeError, ArithmeticError):
+            raise ValidationError("Invalid cursor.", field_name="cursor")
+        return data
+
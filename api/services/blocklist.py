@@ -1,9 +1,313 @@
+import os
+import time
+import logging
+import threading
+from redis.exceptions import RedisError
+
+from api.config import Config
 from api.infra.redis import get_redis
+from api.utils.bloom import BloomFilter
+from api.utils.ttl_cache import TTLCache
+
+BLOCKLIST_CHANNEL = "blocklist:revoked"
+EPOCH_CHANNEL = "blocklist:epoch"
+# How long a cached "not revoked" answer may be served without asking Redis.
+CACHE_TTL = float(os.getenv("JWT_BLOCKLIST_CACHE_TTL", 5))
+CACHE_SIZE = int(os.getenv("JWT_BLOCKLIST_CACHE_SIZE", 10000))
+
+# How long a user's revocation epoch may be served without asking Redis.
+EPOCH_CACHE_TTL = float(os.getenv("JWT_REVOCATION_EPOCH_CACHE_TTL", 5))
+# Every token issued before an epoch has expired once a refresh token lifetime has passed.
+EPOCH_TTL = Config.JWT_REFRESH_TOKEN_EXPIRES
+
+BLOOM_ENABLED = os.getenv("JWT_BLOCKLIST_BLOOM_ENABLED", "false").lower() == "true"
+# Expected revocations per rotation period and the false positive rate at that load.
+BLOOM_CAPACITY = int(os.getenv("JWT_BLOCKLIST_BLOOM_CAPACITY", 100000))
+BLOOM_ERROR_RATE = float(os.getenv("JWT_BLOCKLIST_BLOOM_ERROR_RATE", 0.01))
+BLOOM_SYNC_INTERVAL = float(os.getenv("JWT_BLOCKLIST_BLOOM_SYNC_INTERVAL", 5))  # seconds
+# No revoked token outlives a refresh token, so each filter only has to
+# answer for one refresh token lifetime after its period ends.
+BLOOM_PERIOD = Config.JWT_REFRESH_TOKEN_EXPIRES
+
+logger = logging.getLogger(__name__)
+
+_cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+_epoch_cache = TTLCache(maxsize=CACHE_SIZE, ttl=EPOCH_CACHE_TTL)
+_listener: threading.Thread | None = None
+_listener_pid: int | None = None
+_listener_lock = threading.Lock()
+
+_bloom_size, _bloom_hash_count = BloomFilter.parameters_for(BLOOM_CAPACITY, BLOOM_ERROR_RATE)
+_bloom_filters: dict[int, tuple[int, BloomFilter]] = {}  # generation -> (item count, filter)
+_bloom_synced_at: float | None = None
+_bloom_lock = threading.Lock()
 
 def add_jti_to_blocklist(jti: str, exp: int) -> None:
-    """Add a JWT identifier (JTI) to the Redis blocklist."""
-    get_redis().setex(f"blocklist:{jti}", exp, "true")
+    """
+    Add a JWT identifier (JTI) to the Redis blocklist.
+
+    The JTI is also published on `BLOCKLIST_CHANNEL`, so every process
+    evicts it from its local cache right away instead of waiting for the
+    cached answer to expire. With the Bloom filter enabled, the JTI is also
+    added to the current generation's filter in the same round trip.
+    """
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.setex(f"blocklist:{jti}", exp, "true")
+    if BLOOM_ENABLED:
+        _bloom_add(pipe, jti)
+    pipe.publish(BLOCKLIST_CHANNEL, jti)
+    pipe.execute()
+
+    _cache.set(jti, True, ttl=exp)
+
+def now_ms() -> int:
+    """Return the current Unix time in milliseconds, the unit of `iat_ms` claims and epochs."""
+    return time.time_ns() // 1_000_000
+
+def _epoch_key(user_id: str) -> str:
+    return f"blocklist:epoch:{user_id}"
+
+def revoke_user_tokens(user_id: str) -> int:
+    """
+    Revoke every token issued to a user up to now, on all devices.
+
+    Stores one per-user epoch instead of one blocklist key per token; tokens
+    issued at or before the epoch are rejected. The epoch is in
+    milliseconds and compared with the tokens' `iat_ms` claim, so a login
+    right after the revocation gets tokens that are not revoked. The epoch
+    is published on `EPOCH_CHANNEL` so every process updates its cached copy
+    right away.
+
+    Returns:
+        int: The new epoch (Unix timestamp in milliseconds).
+    """
+    epoch = now_ms()
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.set(_epoch_key(user_id), epoch, ex=EPOCH_TTL)
+    pipe.publish(EPOCH_CHANNEL, f"{user_id}:{epoch}")
+    pipe.execute()
+
+    _epoch_cache.set(str(user_id), epoch)
+    return epoch
+
+def get_revocation_epoch(user_id: str) -> int:
+    """
+    Return the user's revocation epoch in milliseconds, or 0 if none is set.
+
+    Answers are cached in process for up to `EPOCH_CACHE_TTL` seconds and
+    refreshed immediately by messages on `EPOCH_CHANNEL`. Setting
+    `JWT_REVOCATION_EPOCH_CACHE_TTL=0` disables the cache.
+    """
+    user_id = str(user_id)
+    if EPOCH_CACHE_TTL > 0:
+        _ensure_listener()
+        cached = _epoch_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+    epoch = int(get_redis().get(_epoch_key(user_id)) or 0)
+    if EPOCH_CACHE_TTL > 0:
+        _epoch_cache.set(user_id, epoch)
+    return epoch
+
+def is_token_revoked(jwt_payload: dict) -> bool:
+    """
+    Check a decoded JWT against its user's revocation epoch and the JTI blocklist.
+
+    The epoch check comes first: it is a single cached value per user, so
+    it is almost always answered without a Redis round trip. Tokens without
+    an `iat_ms` claim are compared by their whole-second `iat`.
+    """
+    issued_at = jwt_payload.get("iat_ms", jwt_payload["iat"] * 1000)
+    if issued_at <= get_revocation_epoch(jwt_payload["sub"]):
+        return True
+    return is_jti_blocked(jwt_payload["jti"])
 
 def is_jti_blocked(jti: str) -> bool:
-    """Check if a JWT identifier (JTI) is present in the Redis blocklist."""
-    return get_redis().exists(f"blocklist:{jti}") == 1
\ No newline at end of file
+    """
+    Check if a JWT identifier (JTI) is present in the Redis blocklist.
+
+    Answers are cached in process for up to `CACHE_TTL` seconds, which bounds
+    how long a revoked token can still be accepted if an invalidation message
+    is lost. Revoked JTIs are cached until their blocklist entry expires,
+    since a revocation is never undone. Setting `JWT_BLOCKLIST_CACHE_TTL=0`
+    disables the cache.
+
+    With `JWT_BLOCKLIST_BLOOM_ENABLED`, a cache miss first consults a local
+    copy of the blocklist Bloom filter and only asks Redis for the exact key
+    when the filter reports a possible match.
+    """
+    if BLOOM_ENABLED or CACHE_TTL > 0:
+        _ensure_listener()
+
+    if CACHE_TTL <= 0:
+        return _bloom_might_contain(jti) and get_redis().exists(f"blocklist:{jti}") == 1
+
+    cached = _cache.get(jti)
+    if cached is not None:
+        return cached
+
+    if not _bloom_might_contain(jti):
+        _cache.set(jti, False)
+        return False
+
+    # PTTL answers both "is it blocked" and "for how long" in one round trip.
+    remaining_ms = get_redis().pttl(f"blocklist:{jti}")
+    if remaining_ms == -2:
+        _cache.set(jti, False)
+        return False
+
+    _cache.set(jti, True, ttl=remaining_ms / 1000 if remaining_ms > 0 else CACHE_TTL)
+    return True
+
+def _bloom_generation(now: float | None = None) -> int:
+    return int((time.time() if now is None else now) // BLOOM_PERIOD)
+
+def _bloom_key(generation: int) -> str:
+    return f"blocklist:bloom:{generation}"
+
+def _bloom_add(pipe, jti: str) -> None:
+    """Queue the commands adding `jti` to the current generation's filter."""
+    generation = _bloom_generation()
+    key = _bloom_key(generation)
+    for position in BloomFilter(_bloom_size, _bloom_hash_count).positions(jti):
+        pipe.setbit(key, position, 1)
+    pipe.incr(f"{key}:count")
+    # A generation is consulted during its own period and the next one.
+    for suffix in ("", ":count"):
+        pipe.expire(f"{key}{suffix}", 2 * BLOOM_PERIOD)
+
+def _sync_bloom_filters() -> None:
+    """
+    Refresh the local filter copies from Redis.
+
+    Each generation keeps an item counter next to its bitmap, so a sync costs
+    one round trip for the counters and downloads only bitmaps that changed.
+    """
+    global _bloom_filters, _bloom_synced_at
+
+    current = _bloom_generation()
+    # The next generation is included in case a writer's clock is ahead.
+    generations = (current - 1, current, current + 1)
+
+    redis_conn = get_redis()
+    counts = redis_conn.mget([f"{_bloom_key(generation)}:count" for generation in generations])
+
+    filters = {}
+    for generation, count in zip(generations, counts):
+        count = int(count or 0)
+        known = _bloom_filters.get(generation)
+        if known is not None and known[0] == count:
+            filters[generation] = known
+            continue
+        bits = redis_conn.get(_bloom_key(generation)) if count else None
+        filters[generation] = (count, BloomFilter(_bloom_size, _bloom_hash_count, bits))
+
+    _bloom_filters = filters
+    _bloom_synced_at = time.monotonic()
+
+def _bloom_might_contain(jti: str) -> bool:
+    """
+    Return False only if `jti` is certainly not blocklisted.
+
+    Revocations from other processes reach the local copy through the
+    invalidation channel right away, and through a sync at most
+    `BLOOM_SYNC_INTERVAL` seconds later if a message was missed. If Redis
+    cannot be reached, the filter answers "maybe" so the exact key decides.
+    """
+    if not BLOOM_ENABLED:
+        return True
+
+    if _bloom_synced_at is None or time.monotonic() - _bloom_synced_at >= BLOOM_SYNC_INTERVAL:
+        with _bloom_lock:
+            if _bloom_synced_at is None or time.monotonic() - _bloom_synced_at >= BLOOM_SYNC_INTERVAL:
+                try:
+                    _sync_bloom_filters()
+                except RedisError as e:
+                    logger.warning("Could not sync blocklist Bloom filter.", extra={"error": str(e)})
+                    return True
+
+    return any(jti in bloom for _, bloom in _bloom_filters.values())
+
+def _on_revoked(message: dict) -> None:
+    jti = message["data"]
+    jti = jti.decode() if isinstance(jti, bytes) else jti
+    _cache.pop(jti)
+
+    if BLOOM_ENABLED:
+        entry = _bloom_filters.get(_bloom_generation())
+        if entry is not None:
+            entry[1].add(jti)
+
+def _on_epoch(message: dict) -> None:
+    data = message["data"]
+    data = data.decode() if isinstance(data, bytes) else data
+    user_id, epoch = data.rsplit(":", 1)
+    _epoch_cache.set(user_id, int(epoch))
+
+def _on_listener_error(error: Exception, pubsub, thread) -> None:
+    global _listener
+
+    logger.warning("Blocklist invalidation listener failed, will resubscribe.", extra={"error": str(error)})
+    thread.stop()
+    pubsub.close()
+    with _listener_lock:
+        _listener = None
+        # Revocations published while disconnected were missed.
+        _cache.clear()
+        _epoch_cache.clear()
+        _expire_bloom_filters()
+
+def _expire_bloom_filters(forget: bool = False) -> None:
+    """Force a Bloom filter sync on the next lookup, optionally dropping the local copies."""
+    global _bloom_filters, _bloom_synced_at
+
+    with _bloom_lock:
+        _bloom_synced_at = None
+        if forget:
+            _bloom_filters = {}
+
+def _ensure_listener() -> None:
+    """
+    Subscribe this process to blocklist invalidations, once per process.
+
+    The listener thread does not survive a fork, so a new one is started in
+    each gunicorn worker on first use.
+    """
+    global _listener, _listener_pid
+
+    if _listener is not None and _listener_pid == os.getpid():
+        return
+
+    with _listener_lock:
+        if _listener is not None and _listener_pid == os.getpid():
+            return
+
+        try:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{BLOCKLIST_CHANNEL: _on_revoked, EPOCH_CHANNEL: _on_epoch})
+            listener = pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=_on_listener_error)
+        except RedisError as e:
+            logger.warning("Could not subscribe to blocklist invalidations.", extra={"error": str(e)})
+            return
+
+        # Anything cached before subscribing may have missed an invalidation.
+        _cache.clear()
+        _epoch_cache.clear()
+        _expire_bloom_filters()
+        _listener = listener
+        _listener_pid = os.getpid()
+
+def reset_cache() -> None:
+    """Drop cached blocklist answers, epochs and filters and stop this process's invalidation listener."""
+    global _listener, _listener_pid
+
+    with _listener_lock:
+        if _listener is not None and _listener_pid == os.getpid():
+            _listener.stop()
+        _listener = None
+        _listener_pid = None
+        _cache.clear()
+        _epoch_cache.clear()
+
+    _expire_bloom_filters(forget=True)
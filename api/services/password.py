@@ -0,0 +1,134 @@
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
+
+# Schemes in order of preference; argon2 and bcrypt need optional backends.
+SUPPORTED_SCHEMES = ("argon2", "bcrypt", "pbkdf2_sha256")
+HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "pbkdf2_sha256")
+PBKDF2_ROUNDS = int(os.getenv("PASSWORD_PBKDF2_ROUNDS", 29000))
+BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 102400))  # KiB
+# Processes hashing and verifying passwords; 0 hashes in the calling thread.
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+# Requests allowed to wait for a hashing process before callers block.
+HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+
+logger = logging.getLogger(__name__)
+
+_context: CryptContext | None = None
+_pool: ProcessPoolExecutor | None = None
+_pool_pid: int | None = None
+_pool_slots: threading.BoundedSemaphore | None = None
+_pool_lock = threading.Lock()
+
+def available_schemes() -> list[str]:
+    """Return the supported schemes whose backend is installed, in order of preference."""
+    return [
+        scheme for scheme in SUPPORTED_SCHEMES
+        if scheme == "pbkdf2_sha256" or get_crypt_handler(scheme).has_backend()
+    ]
+
+def _build_context() -> CryptContext:
+    schemes = available_schemes()
+
+    default = HASH_SCHEME
+    if default not in schemes:
+        logger.warning(
+            "Password hash scheme is not available, falling back to pbkdf2_sha256.",
+            extra={"scheme": default}
+        )
+        default = "pbkdf2_sha256"
+
+    # Pinning min and max to the configured cost flags hashes made with any
+    # other cost (or a non-default scheme) for an upgrade on the next login.
+    return CryptContext(
+        schemes=[default] + [scheme for scheme in schemes if scheme != default],
+        default=default,
+        deprecated="auto",
+        pbkdf2_sha256__rounds=PBKDF2_ROUNDS,
+        pbkdf2_sha256__min_rounds=PBKDF2_ROUNDS,
+        pbkdf2_sha256__max_rounds=PBKDF2_ROUNDS,
+        bcrypt__rounds=BCRYPT_ROUNDS,
+        bcrypt__min_rounds=BCRYPT_ROUNDS,
+        bcrypt__max_rounds=BCRYPT_ROUNDS,
+        argon2__time_cost=ARGON2_TIME_COST,
+        argon2__memory_cost=ARGON2_MEMORY_COST,
+    )
+
+def get_password_context() -> CryptContext:
+    global _context
+
+    if _context is None:
+        _context = _build_context()
+    return _context
+
+def _hash(password: str) -> str:
+    return get_password_context().hash(password)
+
+def _verify(password: str, hashed: str) -> tuple[bool, str | None]:
+    try:
+        return get_password_context().verify_and_update(password, hashed)
+    except ValueError:
+        # Not a hash of any configured scheme.
+        return False, None
+
+def _get_pool() -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+    global _pool, _pool_pid, _pool_slots
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            # Spawned rather than forked: web workers run background threads
+            # (e.g. the blocklist listener) that must not be forked mid-lock.
+            _pool = ProcessPoolExecutor(max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+            _pool_pid = os.getpid()
+            _pool_slots = threading.BoundedSemaphore(HASH_WORKERS + HASH_MAX_PENDING)
+        return _pool, _pool_slots
+
+def _run(fn: Callable[..., Any], *args: Any) -> Any:
+    if HASH_WORKERS <= 0:
+        return fn(*args)
+
+    pool, slots = _get_pool()
+    slots.acquire()
+    try:
+        return pool.submit(fn, *args).result()
+    finally:
+        slots.release()
+
+def hash_password(password: str) -> str:
+    """Hash a password with the configured default scheme and cost."""
+    return _run(_hash, password)
+
+def verify_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """
+    Check a password against a stored hash.
+
+    With `PASSWORD_HASH_WORKERS` set, hashing runs in a bounded process pool.
+    The calling thread still waits for the result, but the CPU-bound work no
+    longer holds the GIL, so other requests served by the same worker keep
+    running. Once `HASH_MAX_PENDING` requests are queued, further callers
+    block until a slot frees up.
+
+    Returns:
+        tuple[bool, str | None]: Whether the password matches and, if the hash
+        was made with another scheme or cost, a new hash to store instead.
+    """
+    return _run(_verify, password, hashed)
+
+def reset() -> None:
+    """Drop the hashing context and shut down this process's hashing pool."""
+    global _context, _pool, _pool_pid, _pool_slots
+
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_pid = None
+        _pool_slots = None
+    _context = None
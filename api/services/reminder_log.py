@@ -1,5 +1,6 @@
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
+from typing import Any, Iterator, List
 
 from api.extensions import db
 from api.models import ReminderLogModel, SubscriptionModel
@@ -18,12 +19,57 @@ def create_reminder_log(data: dict, sub_id: int) -> ReminderLogModel:
     
     return reminder_log
 
+def create_reminder_logs(rows: List[dict]) -> None:
+    """
+    Persist many reminder logs with a single bulk INSERT and one commit.
+
+    Args:
+        rows (List[dict]): Log rows with keys 'subscription_id', 'message' and 'success'.
+    """
+    if not rows:
+        return
+
+    try:
+        db.session.execute(insert(ReminderLogModel), rows)
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        raise ReminderLogCreateError("An error occurred while creating the reminder logs.")
+
 def get_user_reminder_logs_by_subscription(sub_id: int, user_id: int) -> List[ReminderLogModel]:
     subscription_service.get_user_subscription_by_id(sub_id, user_id)
     return ReminderLogModel.query.filter_by(
         subscription_id=sub_id
     ).order_by(ReminderLogModel.sent_at.desc()).all()
 
+# Columns of a reminder log export row.
+REMINDER_LOG_EXPORT_FIELDS = ("id", "subscription_id", "subscription_name", "message", "success", "sent_at")
+
+def iter_user_reminder_logs_for_export(user_id: int, batch_size: int = 1000) -> Iterator[Any]:
+    """
+    Stream every reminder log of a user's subscriptions as rows of `REMINDER_LOG_EXPORT_FIELDS`.
+
+    Logs and their subscription names come from a single join, fetched
+    `batch_size` rows at a time from a server-side cursor (`yield_per`).
+    Rows are grouped by subscription name, which the `(user_id, name)` and
+    `(subscription_id, sent_at)` indexes return in order, so the database
+    does not sort the user's logs either.
+    """
+    return (
+        db.session.query(
+            ReminderLogModel.id,
+            ReminderLogModel.subscription_id,
+            SubscriptionModel.name.label("subscription_name"),
+            ReminderLogModel.message,
+            ReminderLogModel.success,
+            ReminderLogModel.sent_at,
+        )
+        .join(SubscriptionModel, ReminderLogModel.subscription_id == SubscriptionModel.id)
+        .filter(SubscriptionModel.user_id == user_id)
+        .order_by(SubscriptionModel.name, ReminderLogModel.sent_at)
+        .yield_per(batch_size)
+    )
+
 def get_user_reminder_log_by_id(log_id: int, user_id: int) -> ReminderLogModel:
     reminder_log = ReminderLogModel.query.filter(
         ReminderLogModel.id == log_id,
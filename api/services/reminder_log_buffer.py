@@ -0,0 +1,90 @@
+import time
+from flask import current_app
+from typing import Callable
+
+from api.services import reminder_log as reminder_log_service
+from api.exceptions import ReminderLogCreateError
+
+class ReminderLogBuffer:
+    """
+    Accumulate reminder log rows and write them with bulk INSERTs.
+
+    Rows are flushed when `max_size` rows are pending, when the oldest pending
+    row is `max_interval` seconds old (checked on `add`) and when the buffer is
+    closed. Used as a context manager, it also flushes when the block exits
+    with an exception - including job timeouts and worker shutdown signals -
+    so reminders already sent in a job are never left unlogged.
+
+    Delivery is at-least-once: rows leave the buffer only after their INSERT
+    has been committed. A failed flush keeps the rows and the next flush
+    retries them, so a row can be written twice if a commit succeeds but is
+    reported as failed, but it is never silently dropped.
+
+    RQ runs every job in a forked work horse, so a buffer lives for a single
+    job; it pays off for batch jobs that produce many rows.
+    """
+
+    def __init__(self, max_size: int = 200, max_interval: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.max_interval = max_interval
+        self._clock = clock
+        self._rows: list[dict] = []
+        self._oldest_at: float | None = None
+
+    @classmethod
+    def from_config(cls) -> "ReminderLogBuffer":
+        return cls(
+            max_size=current_app.config["REMINDER_LOG_FLUSH_SIZE"],
+            max_interval=current_app.config["REMINDER_LOG_FLUSH_INTERVAL"],
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> "ReminderLogBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.flush()
+        except ReminderLogCreateError as log_err:
+            current_app.logger.error(
+                "Failed to flush buffered reminder logs",
+                extra={"error": str(log_err), "sub_ids": [row["subscription_id"] for row in self._rows]},
+            )
+
+    def add(self, sub_id: int, message: str, success: bool) -> None:
+        """Buffer one log row, flushing if a size or time threshold is reached."""
+        if not self._rows:
+            self._oldest_at = self._clock()
+        self._rows.append({"subscription_id": sub_id, "message": message, "success": success})
+
+        if len(self._rows) >= self.max_size or self._clock() - self._oldest_at >= self.max_interval:
+            try:
+                self.flush()
+            except ReminderLogCreateError as log_err:
+                # Rows stay buffered and are retried by the next flush.
+                current_app.logger.warning(
+                    "Failed to flush buffered reminder logs, will retry",
+                    extra={"error": str(log_err), "pending": len(self._rows)},
+                )
+
+    def flush(self) -> int:
+        """
+        Write all pending rows with a single bulk INSERT.
+
+        Returns:
+            int: Number of rows written.
+
+        Raises:
+            ReminderLogCreateError: If the insert fails; the rows stay buffered.
+        """
+        if not self._rows:
+            return 0
+
+        rows = self._rows
+        reminder_log_service.create_reminder_logs(rows)
+
+        self._rows = []
+        self._oldest_at = None
+        return len(rows)
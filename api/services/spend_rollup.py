@@ -0,0 +1,229 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable
+from sqlalchemy import delete, func, insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.extensions import db
+from api.models import MonthlySpendRollupModel, SubscriptionModel
+from api.exceptions import SpendRollupRebuildError
+
+UNCATEGORIZED = "uncategorized"
+
+def month_key(day: date) -> str:
+    """Return the YYYY-MM rollup month of a payment date."""
+    return day.strftime("%Y-%m")
+
+def rollup_category(category: str | None) -> str:
+    """Return the rollup category of a subscription; missing and empty categories are uncategorized."""
+    return category or UNCATEGORIZED
+
+def rollup_category_column():
+    """SQL counterpart of `rollup_category` over `subscriptions.category`."""
+    return func.coalesce(func.nullif(SubscriptionModel.category, ""), UNCATEGORIZED)
+
+def _rollup_key(subscription: SubscriptionModel) -> tuple[int, str, str]:
+    return (
+        subscription.user_id,
+        month_key(subscription.next_payment_date),
+        rollup_category(subscription.category),
+    )
+
+def snapshot(subscription: SubscriptionModel) -> tuple[int, str, str, Decimal]:
+    """Capture the rollup-relevant state of a subscription before it is modified."""
+    return (*_rollup_key(subscription), Decimal(subscription.price))
+
+def _apply_delta(user_id: int, month: str, category: str, amount: Decimal, count: int) -> None:
+    # A single upsert adds the delta atomically, so concurrent first writes of a
+    # key cannot both miss the row and collide on the unique constraint.
+    rollup = MonthlySpendRollupModel
+    values = {
+        "user_id": user_id,
+        "month": month,
+        "category": category,
+        "total": amount,
+        "subscription_count": count,
+    }
+    if db.engine.dialect.name == "mysql":
+        stmt = mysql.insert(rollup).values(**values)
+        stmt = stmt.on_duplicate_key_update(
+            total=rollup.total + stmt.inserted.total,
+            subscription_count=rollup.subscription_count + stmt.inserted.subscription_count,
+        )
+    else:
+        dialect = postgresql if db.engine.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(rollup).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup.user_id, rollup.month, rollup.category],
+            set_={
+                "total": rollup.total + stmt.excluded.total,
+                "subscription_count": rollup.subscription_count + stmt.excluded.subscription_count,
+            },
+        )
+    db.session.execute(stmt)
+
+    if count < 0:
+        db.session.execute(
+            delete(rollup)
+            .where(
+                rollup.user_id == user_id,
+                rollup.month == month,
+                rollup.category == category,
+                rollup.subscription_count <= 0,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+def add_subscription(subscription: SubscriptionModel) -> None:
+    """
+    Add a subscription's price to its month/category rollup.
+
+    Only stages changes in the current session; the caller commits them
+    together with the subscription itself.
+    """
+    _apply_delta(*_rollup_key(subscription), Decimal(subscription.price), 1)
+
+def add_subscription_rows(rows: Iterable[dict[str, Any]]) -> None:
+    """
+    Add bulk-inserted subscription rows to their rollups (no commit).
+
+    Rows are folded per (user_id, month, category) first, so a batch costs one
+    rollup update per distinct key rather than one per subscription.
+    """
+    deltas: dict[tuple[int, str, str], tuple[Decimal, int]] = {}
+    for row in rows:
+        key = (row["user_id"], month_key(row["next_payment_date"]), rollup_category(row.get("category")))
+        total, count = deltas.get(key, (Decimal("0.00"), 0))
+        deltas[key] = (total + Decimal(row["price"]), count + 1)
+
+    for key, (amount, count) in deltas.items():
+        _apply_delta(*key, amount, count)
+
+def remove_subscription(subscription: SubscriptionModel) -> None:
+    """Subtract a subscription's price from its month/category rollup (no commit)."""
+    _apply_delta(*_rollup_key(subscription), -Decimal(subscription.price), -1)
+
+def move_subscription(before: tuple[int, str, str, Decimal], subscription: SubscriptionModel) -> None:
+    """
+    Re-apply a modified subscription to the rollups (no commit).
+
+    Handles price and category changes as well as moves of next_payment_date
+    between months.
+
+    Args:
+        before: State captured with `snapshot` before the subscription was modified.
+        subscription: The subscription with its new values applied.
+    """
+    after = snapshot(subscription)
+    if before == after:
+        return
+
+    user_id, month, category, price = before
+    if before[:3] == after[:3]:
+        _apply_delta(user_id, month, category, after[3] - price, 0)
+        return
+
+    _apply_delta(user_id, month, category, -price, -1)
+    add_subscription(subscription)
+
+def get_rollup_by_category(user_id: int, month: str) -> dict[str, Decimal]:
+    """Return rolled-up spending per category for a user and month (YYYY-MM)."""
+    rows = (
+        db.session.query(MonthlySpendRollupModel.category, MonthlySpendRollupModel.total)
+        .filter(
+            MonthlySpendRollupModel.user_id == user_id,
+            MonthlySpendRollupModel.month == month,
+        )
+        .all()
+    )
+    return {row.category: Decimal(row.total) for row in rows}
+
+def _expected_rollups() -> dict[tuple[int, str, str], tuple[Decimal, int]]:
+    """Aggregate the rollups straight from the subscriptions table."""
+    category = rollup_category_column()
+    rows = (
+        db.session.query(
+            SubscriptionModel.user_id,
+            SubscriptionModel.next_payment_date,
+            category.label("category"),
+            func.sum(SubscriptionModel.price).label("total"),
+            func.count(SubscriptionModel.id).label("subscription_count"),
+        )
+        .group_by(SubscriptionModel.user_id, SubscriptionModel.next_payment_date, category)
+        .yield_per(1000)
+    )
+
+    # Months are folded in Python to keep the query portable across dialects.
+    expected: dict[tuple[int, str, str], tuple[Decimal, int]] = {}
+    for row in rows:
+        key = (row.user_id, month_key(row.next_payment_date), row.category)
+        total, count = expected.get(key, (Decimal("0.00"), 0))
+        expected[key] = (total + Decimal(row.total), count + row.subscription_count)
+    return expected
+
+def rebuild_rollups() -> int:
+    """
+    Recompute all rollups from the subscriptions table in a single transaction.
+
+    Used to backfill the table after the migration or to repair drift
+    reported by `find_rollup_inconsistencies`.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    expected = _expected_rollups()
+
+    try:
+        db.session.query(MonthlySpendRollupModel).delete()
+        if expected:
+            db.session.execute(insert(MonthlySpendRollupModel), [
+                {
+                    "user_id": user_id,
+                    "month": month,
+                    "category": category,
+                    "total": total,
+                    "subscription_count": count,
+                }
+                for (user_id, month, category), (total, count) in expected.items()
+            ])
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        raise SpendRollupRebuildError("An error occurred while rebuilding the spend rollups.")
+
+    return len(expected)
+
+def find_rollup_inconsistencies() -> list[dict[str, object]]:
+    """
+    Compare stored rollups with totals computed from the subscriptions table.
+
+    Returns:
+        list[dict[str, object]]: One entry per mismatching (user_id, month, category)
+        with the 'expected' and 'actual' totals and subscription counts.
+    """
+    expected = _expected_rollups()
+    actual = {
+        (row.user_id, row.month, row.category): (Decimal(row.total), row.subscription_count)
+        for row in db.session.query(MonthlySpendRollupModel).yield_per(1000)
+    }
+
+    missing = (None, 0)
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        want = expected.get(key, missing)
+        have = actual.get(key, missing)
+        if _normalize(want) != _normalize(have):
+            user_id, month, category = key
+            mismatches.append({
+                "user_id": user_id,
+                "month": month,
+                "category": category,
+                "expected": want,
+                "actual": have,
+            })
+    return mismatches
+
+def _normalize(value: tuple[Decimal | None, int]) -> tuple[Decimal, int]:
+    total, count = value
+    return (Decimal(total or 0).quantize(Decimal("0.01")), count)
@@ -1,10 +1,15 @@
 from datetime import datetime, timezone, timedelta, date
+from flask import current_app
+from sqlalchemy import and_, func, or_, update
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
+from sqlalchemy.orm import joinedload
+from typing import Any, Iterator, List, Sequence
 from decimal import Decimal
 
 from api.extensions import db
-from api.models import SubscriptionModel
+from api.infra import response_cache
+from api.models import SubscriptionModel, UserModel
+from api.services import spend_rollup
 from api.exceptions import (
     SubscriptionNotFoundError, 
     SubscriptionCreateError, 
@@ -17,22 +22,170 @@ def check_if_subscription_name_exists(user_id: int, name: str) -> None:
     if SubscriptionModel.query.filter_by(user_id=user_id, name=name).first():
         raise SubscriptionExistError("You already have a subscription with this name.")
 
+def bump_subscriptions_version(user_id: int) -> None:
+    """
+    Mark the user's subscriptions as changed (no commit).
+
+    Runs as a single atomic UPDATE in the caller's transaction, so the
+    version moves exactly when the write it describes is committed.
+    """
+    db.session.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        # Keep the profile's updated_at untouched by subscription writes.
+        .values(subscriptions_version=UserModel.subscriptions_version + 1, updated_at=UserModel.updated_at)
+    )
+
+def get_subscriptions_version(user_id: int) -> int:
+    """Return the user's subscriptions version, i.e. a counter of subscription writes."""
+    version = db.session.query(UserModel.subscriptions_version).filter(UserModel.id == user_id).scalar()
+    return version or 0
+
 def create_subscription(data: dict, user_id: int) -> SubscriptionModel:
     check_if_subscription_name_exists(user_id, data['name'])
 
     subscription = SubscriptionModel(**data, user_id=user_id)
     try:
         db.session.add(subscription)
+        spend_rollup.add_subscription(subscription)
+        bump_subscriptions_version(user_id)
         db.session.commit()
     except SQLAlchemyError:
         db.session.rollback()
         raise SubscriptionCreateError("An error occurred while creating the subscription.")
 
+    response_cache.invalidate_user(user_id)
+
     return subscription
   
 def get_user_subscriptions(user_id: int) -> List[SubscriptionModel]:
     return SubscriptionModel.query.filter_by(user_id=user_id).all()
 
+# Columns that can be requested through sparse fieldsets.
+SUBSCRIPTION_FIELDS = (
+    "id",
+    "user_id",
+    "name",
+    "price",
+    "billing_cycle",
+    "next_payment_date",
+    "category",
+    "created_at",
+    "updated_at",
+)
+
+# Columns the listing can be sorted by; each is backed by a `(user_id, column)` index.
+SUBSCRIPTION_SORT_FIELDS = ("next_payment_date", "name", "price")
+
+def _filter_predicates(filters: dict[str, Any]) -> list:
+    predicates = []
+    if filters.get("category") is not None:
+        predicates.append(SubscriptionModel.category == filters["category"])
+    if filters.get("billing_cycle") is not None:
+        predicates.append(SubscriptionModel.billing_cycle == filters["billing_cycle"])
+    if filters.get("min_price") is not None:
+        predicates.append(SubscriptionModel.price >= filters["min_price"])
+    if filters.get("max_price") is not None:
+        predicates.append(SubscriptionModel.price <= filters["max_price"])
+    if filters.get("due_after") is not None:
+        predicates.append(SubscriptionModel.next_payment_date >= filters["due_after"])
+    if filters.get("due_before") is not None:
+        predicates.append(SubscriptionModel.next_payment_date <= filters["due_before"])
+    return predicates
+
+def get_user_subscriptions_page(
+    user_id: int,
+    limit: int,
+    after: tuple[Any, int] | None = None,
+    fields: Sequence[str] | None = None,
+    filters: dict[str, Any] | None = None,
+    sort: str = "next_payment_date"
+) -> tuple[List[dict[str, Any]], tuple[Any, int] | None]:
+    """
+    Retrieve one keyset-paginated page of a user's subscriptions.
+
+    Subscriptions are ordered by `(sort column, id)`, which the matching
+    `(user_id, column)` index already provides, and a page starts strictly
+    after the `after` key, so deep pages cost the same as the first. Filters
+    are applied as SQL predicates, never on the fetched rows.
+
+    Args:
+        user_id (int): ID of the user whose subscriptions should be retrieved.
+        limit (int): Maximum number of subscriptions on the page.
+        after (tuple[Any, int] | None): `(sort column value, id)` of the last
+            subscription on the previous page.
+        fields (Sequence[str] | None): Columns to return (see
+            `SUBSCRIPTION_FIELDS`); only these and the sort key are selected.
+            Defaults to all of them.
+        filters (dict[str, Any] | None): Any of 'category', 'billing_cycle',
+            'min_price', 'max_price', 'due_after' and 'due_before'; all bounds
+            are inclusive.
+        sort (str): One of `SUBSCRIPTION_SORT_FIELDS`, prefixed with '-' for
+            descending order.
+
+    Returns:
+        tuple[List[dict[str, Any]], tuple[Any, int] | None]: The page as dicts
+        holding exactly `fields`, and the key to pass as `after` for the next
+        page, or None if this is the last one.
+    """
+    descending = sort.startswith("-")
+    sort_name = sort.lstrip("-")
+    if sort_name not in SUBSCRIPTION_SORT_FIELDS:
+        raise ValueError(f"Cannot sort subscriptions by '{sort_name}'.")
+
+    fields = list(fields or SUBSCRIPTION_FIELDS)
+    selected = list(dict.fromkeys([*fields, sort_name, "id"]))
+    sort_column = getattr(SubscriptionModel, sort_name)
+
+    query = (
+        db.session.query(*(getattr(SubscriptionModel, name) for name in selected))
+        .filter(SubscriptionModel.user_id == user_id, *_filter_predicates(filters or {}))
+    )
+    if after is not None:
+        after_value, after_id = after
+        if descending:
+            query = query.filter(or_(
+                sort_column < after_value,
+                and_(sort_column == after_value, SubscriptionModel.id < after_id),
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > after_value,
+                and_(sort_column == after_value, SubscriptionModel.id > after_id),
+            ))
+
+    # The id tie-breaker follows the sort direction so the index can be read backwards.
+    if descending:
+        order_by = (sort_column.desc(), SubscriptionModel.id.desc())
+    else:
+        order_by = (sort_column, SubscriptionModel.id)
+
+    # One extra row tells whether another page follows.
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_after = (rows[-1]._mapping[sort_name], rows[-1].id)
+
+    return [{name: row._mapping[name] for name in fields} for row in rows], next_after
+
+def iter_user_subscriptions_for_export(user_id: int, batch_size: int = 1000) -> Iterator[Any]:
+    """
+    Stream all of a user's subscriptions as rows of `SUBSCRIPTION_FIELDS`.
+
+    Rows come in listing order, `(next_payment_date, id)`, straight off the
+    `(user_id, next_payment_date)` index, and are fetched `batch_size` at a
+    time from a server-side cursor (`yield_per`), so no more than one batch
+    is held in memory.
+    """
+    return (
+        db.session.query(*(getattr(SubscriptionModel, name) for name in SUBSCRIPTION_FIELDS))
+        .filter(SubscriptionModel.user_id == user_id)
+        .order_by(SubscriptionModel.next_payment_date, SubscriptionModel.id)
+        .yield_per(batch_size)
+    )
+
 def get_user_subscription_by_id(sub_id: int, user_id: int) -> SubscriptionModel:
     subscription = SubscriptionModel.query.filter_by(
         id=sub_id,
@@ -50,27 +203,36 @@ def update_subscription(sub_id: int, user_id: int, data: dict) -> SubscriptionMo
     if "name" in data and data['name'] != subscription.name:
         check_if_subscription_name_exists(user_id, data['name'])
 
+    before = spend_rollup.snapshot(subscription)
     for key, value in data.items():
         setattr(subscription, key, value)
 
     try:
+        spend_rollup.move_subscription(before, subscription)
+        bump_subscriptions_version(user_id)
         db.session.commit()
     except SQLAlchemyError:
         db.session.rollback()
         raise SubscriptionUpdateError("An error occurred while updating the subscription.")
 
+    response_cache.invalidate_user(user_id)
+
     return subscription
 
 def delete_subscription(sub_id: int, user_id: int) -> None:
     subscription = get_user_subscription_by_id(sub_id, user_id)
     
     try:
+        spend_rollup.remove_subscription(subscription)
         db.session.delete(subscription)
+        bump_subscriptions_version(user_id)
         db.session.commit()
     except SQLAlchemyError:
         db.session.rollback()
         raise SubscriptionDeleteError("An error occurred while deleting the subscription.")
 
+    response_cache.invalidate_user(user_id)
+
 def get_subscriptions_due_in(days_list: list[int]) -> List[SubscriptionModel]:
     """
     Retrieve subscriptions with next_payment_date exactly N days from today.
@@ -91,6 +253,70 @@ def get_subscriptions_due_in(days_list: list[int]) -> List[SubscriptionModel]:
         .all()
     )
 
+def iter_subscription_id_chunks_due_in(days_list: List[int], chunk_size: int) -> Iterator[List[int]]:
+    """
+    Stream IDs of subscriptions with next_payment_date exactly N days from today
+    in keyset-ordered chunks.
+
+    Dates are read one at a time with
+    `WHERE next_payment_date = :date AND id > :last_id ORDER BY id LIMIT :n`,
+    a range read of the `(next_payment_date, id)` index, so each page costs
+    only its own rows and only a single chunk of IDs is held in memory.
+
+    Args:
+        days_list (List[int]): List of day offsets from today.
+        chunk_size (int): Maximum number of IDs per chunk.
+
+    Yields:
+        List[int]: Subscription IDs ordered by (next_payment_date, id),
+            `chunk_size` per chunk except for the last one.
+    """
+    today = datetime.now(timezone.utc).date()
+    target_dates = sorted({today + timedelta(days=d) for d in days_list})
+
+    chunk = []
+    for target_date in target_dates:
+        last_id = 0
+        while True:
+            limit = chunk_size - len(chunk)
+            rows = (
+                db.session.query(SubscriptionModel.id)
+                .filter(SubscriptionModel.next_payment_date == target_date)
+                .filter(SubscriptionModel.id > last_id)
+                .order_by(SubscriptionModel.id)
+                .limit(limit)
+                .all()
+            )
+            chunk.extend(row.id for row in rows)
+
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+            if len(rows) < limit:
+                break
+            last_id = rows[-1].id
+
+    if chunk:
+        yield chunk
+
+def iter_subscription_ids_due_in(days_list: List[int], page_size: int = 1000) -> Iterator[int]:
+    """
+    Stream IDs of subscriptions with next_payment_date exactly N days from today.
+
+    Generator counterpart of `get_subscriptions_due_in` for orchestrators:
+    only the `id` column is selected and rows are paged by
+    `(next_payment_date, id)`, so memory stays flat regardless of table size.
+
+    Args:
+        days_list (List[int]): List of day offsets from today.
+        page_size (int): Number of IDs fetched per query.
+
+    Yields:
+        int: Subscription IDs ordered by (next_payment_date, id).
+    """
+    for chunk in iter_subscription_id_chunks_due_in(days_list, page_size):
+        yield from chunk
+
 def get_user_upcoming_subscriptions(
     user_id: int,
     days_list: List[int] | None = None
@@ -150,6 +376,11 @@ def get_monthly_summary(user_id: int, month: str | None = None) -> dict[str, obj
     """
     Calculate monthly spending summary for a given user.
 
+    Totals are aggregated in the database with a single
+    `SUM(price) ... GROUP BY COALESCE(NULLIF(category, ''), 'uncategorized')` query, or
+    read from the `monthly_spend_rollups` table when `SPEND_ROLLUPS_ENABLED`
+    is set (after the rollups have been backfilled with `flask rollups rebuild`).
+
     Args:
         user_id (int): ID of the user whose subscriptions are aggregated.
         month (str, optional): Month in YYYY-MM format. Defaults to current month.
@@ -160,6 +391,22 @@ def get_monthly_summary(user_id: int, month: str | None = None) -> dict[str, obj
     if month is None:
         month = date.today().strftime("%Y-%m")
 
+    if current_app.config.get("SPEND_ROLLUPS_ENABLED"):
+        by_category = spend_rollup.get_rollup_by_category(user_id, month)
+    else:
+        by_category = _aggregate_month_by_category(user_id, month)
+
+    total_spent = sum(by_category.values(), Decimal("0.00"))
+
+    return {
+        "month": month,
+        "total_spent": total_spent.quantize(Decimal("0.01")),
+        "by_category": {
+            k: v.quantize(Decimal("0.01")) for k, v in by_category.items()
+        }
+    }
+
+def _aggregate_month_by_category(user_id: int, month: str) -> dict[str, Decimal]:
     year, month_num = map(int, month.split("-"))
     start_date = date(year, month_num, 1)
     if month_num == 12:
@@ -167,32 +414,22 @@ def get_monthly_summary(user_id: int, month: str | None = None) -> dict[str, obj
     else:
         end_date = date(year, month_num + 1, 1)
 
-    subs = (
-        SubscriptionModel.query
+    category = spend_rollup.rollup_category_column()
+    rows = (
+        db.session.query(
+            category.label("category"),
+            func.sum(SubscriptionModel.price).label("total")
+        )
         .filter(
             SubscriptionModel.user_id == user_id,
             SubscriptionModel.next_payment_date >= start_date,
             SubscriptionModel.next_payment_date < end_date,
         )
+        .group_by(category)
         .all()
     )
 
-    total_spent = Decimal("0.00")
-    by_category: dict[str, Decimal] = {}
-
-    for sub in subs:
-        amount = Decimal(sub.price)
-        total_spent += amount
-        category = sub.category or "uncategorized"
-        by_category[category] = by_category.get(category, Decimal("0.00")) + amount
-
-    return {
-        "month": month,
-        "total_spent": total_spent.quantize(Decimal("0.01")),
-        "by_category": {
-            k: v.quantize(Decimal("0.01")) for k, v in by_category.items()
-        }
-    }
+    return {row.category: Decimal(row.total) for row in rows}
 
 def get_subscription_by_id(sub_id: int) -> SubscriptionModel:
     """
@@ -201,4 +438,20 @@ def get_subscription_by_id(sub_id: int) -> SubscriptionModel:
     subscription = SubscriptionModel.query.filter_by(id=sub_id).first()
     if not subscription:
         raise SubscriptionNotFoundError("Subscription not found.")
-    return subscription
\ No newline at end of file
+    return subscription
+
+def get_subscriptions_by_ids(sub_ids: List[int]) -> List[SubscriptionModel]:
+    """
+    Retrieve subscriptions together with their owners by IDs in a single query - for batch tasks.
+    IDs that no longer exist are skipped.
+    """
+    if not sub_ids:
+        return []
+
+    return (
+        SubscriptionModel.query
+        .options(joinedload(SubscriptionModel.user))
+        .filter(SubscriptionModel.id.in_(sub_ids))
+        .order_by(SubscriptionModel.id)
+        .all()
+    )
@@ -0,0 +1,157 @@
+import io
+import csv
+import json
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator
+from marshmallow import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.extensions import db
+from api.infra import response_cache
+from api.models import SubscriptionModel
+from api.schemas import SubscriptionSchema
+from api.services import spend_rollup
+from api.services import subscription as subscription_service
+
+CREATE_ERROR = "An error occurred while creating the subscription."
+UNREADABLE_ERROR = "The body could not be read from this row on ({error}); the rest was not imported."
+
+_END = object()
+
+def iter_csv_rows(stream: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a UTF-8 CSV body with a header line, reading it incrementally."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    for row in csv.DictReader(text):
+        # Cells missing from short rows are left out; empty cells are kept, as in a JSON body.
+        yield {key: value for key, value in row.items() if key and value is not None}
+
+def iter_ndjson_rows(stream: IO[bytes]) -> Iterator[Any]:
+    """Yield one decoded value per non-empty NDJSON line, reading the body incrementally."""
+    for line in io.TextIOWrapper(stream, encoding="utf-8"):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # Left for the schema to reject, so the line gets its own row error.
+            yield line
+
+def _until_unreadable(rows: Iterable[Any], failure: list[str]) -> Iterator[Any]:
+    # Streamed bodies fail mid-way on bytes that are not UTF-8 or on malformed CSV.
+    try:
+        yield from rows
+    except (UnicodeDecodeError, csv.Error) as e:
+        failure.append(str(e))
+
+def import_subscriptions(
+    user_id: int,
+    rows: Iterable[Any],
+    batch_size: int = 1000,
+    max_rows: int | None = None
+) -> dict[str, Any]:
+    """
+    Create many subscriptions for a user, reporting errors per row.
+
+    `rows` is consumed lazily, `batch_size` rows at a time. Each batch is
+    validated with `SubscriptionSchema(many=True)`, checked for name conflicts
+    with a single `IN` query, and inserted with one multi-row INSERT in its
+    own transaction together with its spend rollup updates. A batch that
+    fails to commit is reported row by row and does not stop later batches.
+
+    Args:
+        user_id (int): ID of the user the subscriptions are created for.
+        rows (Iterable[Any]): Raw subscription payloads, as accepted by
+            `POST /subscriptions`.
+        batch_size (int): Rows validated and committed together.
+        max_rows (int | None): Rows processed at most; the first row past the
+            limit is reported as an error and the rest is not read.
+
+    A streamed body that stops decoding (not UTF-8, malformed CSV) is
+    reported as an error on the first row that could not be read; the
+    rows before it are still imported.
+
+    Returns:
+        dict[str, Any]: 'created' and 'failed' counts and 'errors', a list of
+        {'row': 1-based row number, 'errors': field messages}.
+    """
+    schema = SubscriptionSchema(many=True)
+    seen_names: set[str] = set()
+    created = 0
+    errors: list[dict[str, Any]] = []
+
+    unreadable: list[str] = []
+    rows = _until_unreadable(rows, unreadable)
+    row_number = 0
+    while True:
+        limit = batch_size if max_rows is None else min(batch_size, max_rows - row_number)
+        batch = list(islice(rows, limit)) if limit > 0 else []
+        if not batch:
+            break
+        numbers = range(row_number + 1, row_number + len(batch) + 1)
+        row_number += len(batch)
+
+        try:
+            loaded = schema.load(batch)
+            invalid = {}
+        except ValidationError as e:
+            loaded = e.valid_data
+            invalid = e.messages
+
+        valid = []
+        for index, (number, data) in enumerate(zip(numbers, loaded)):
+            if index in invalid:
+                errors.append({"row": number, "errors": invalid[index]})
+            elif data['name'] in seen_names:
+                errors.append({"row": number, "errors": {"name": ["Duplicate name in this import."]}})
+            else:
+                seen_names.add(data['name'])
+                valid.append((number, data))
+
+        created += _insert_batch(user_id, valid, errors)
+
+    if max_rows is not None and row_number >= max_rows and next(rows, _END) is not _END:
+        errors.append({"row": max_rows + 1, "errors": {"_schema": [f"Imports are limited to {max_rows} rows."]}})
+    if unreadable:
+        errors.append({"row": row_number + 1, "errors": {"_schema": [UNREADABLE_ERROR.format(error=unreadable[0])]}})
+
+    if created:
+        response_cache.invalidate_user(user_id)
+
+    errors.sort(key=lambda error: error['row'])
+    return {"created": created, "failed": len(errors), "errors": errors}
+
+def _insert_batch(user_id: int, batch: list[tuple[int, dict[str, Any]]], errors: list[dict[str, Any]]) -> int:
+    if not batch:
+        return 0
+
+    # One IN query finds every name that would violate unique_user_subscription_name.
+    existing = {
+        name for (name,) in
+        db.session.query(SubscriptionModel.name)
+        .filter(
+            SubscriptionModel.user_id == user_id,
+            SubscriptionModel.name.in_([data['name'] for _, data in batch]),
+        )
+    }
+
+    new_rows = []
+    for number, data in batch:
+        if data['name'] in existing:
+            errors.append({"row": number, "errors": {"name": ["You already have a subscription with this name."]}})
+        else:
+            new_rows.append((number, {**data, "user_id": user_id}))
+    if not new_rows:
+        return 0
+
+    try:
+        db.session.execute(insert(SubscriptionModel), [data for _, data in new_rows])
+        spend_rollup.add_subscription_rows(data for _, data in new_rows)
+        subscription_service.bump_subscriptions_version(user_id)
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        errors.extend({"row": number, "errors": {"_schema": [CREATE_ERROR]}} for number, _ in new_rows)
+        return 0
+
+    return len(new_rows)
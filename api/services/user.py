@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from api.extensions import db
 from api.models import UserModel
@@ -7,6 +7,32 @@ from api.exceptions import UserNotFoundError
 def get_all_users() -> List[UserModel]:
     return db.session.query(UserModel).all()
 
+def iter_user_ids(page_size: int = 1000) -> Iterator[int]:
+    """
+    Stream IDs of all users, paging by primary key (`WHERE id > :last ORDER BY id LIMIT n`).
+
+    Only the `id` column is selected, so no ORM objects are materialized and
+    memory stays flat regardless of the number of users.
+    """
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(UserModel.id)
+            .filter(UserModel.id > last_id)
+            .order_by(UserModel.id)
+            .limit(page_size)
+            .all()
+        )
+        if not rows:
+            return
+
+        for row in rows:
+            yield row.id
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1].id
+
 def get_user_by_id(user_id: int) -> UserModel:
     user = db.session.get(UserModel, user_id)
     if not user:
@@ -0,0 +1,115 @@
+import os
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from redis.exceptions import RedisError
+
+from api.extensions import db
+from api.infra.db_routing import primary_reads
+from api.infra.redis import get_redis
+from api.models import UserModel
+from api.utils.ttl_cache import TTLCache
+
+# How long a record may be served from this process without asking Redis.
+# Deleting or changing a user only clears other processes' copies once this passes.
+CACHE_TTL = float(os.getenv("USER_CACHE_TTL", 5))
+CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 10000))
+# How long a record is shared through Redis before it is read from the database again.
+REDIS_TTL = int(os.getenv("USER_CACHE_REDIS_TTL", 300))
+
+logger = logging.getLogger(__name__)
+
+_cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+
+@dataclass(frozen=True)
+class UserRecord:
+    """The profile fields of a user that request handlers need, detached from the session."""
+    id: int
+    username: str
+    email: str
+    created_at: datetime
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "id": self.id,
+            "username": self.username,
+            "email": self.email,
+            "created_at": self.created_at.isoformat(),
+        })
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "UserRecord":
+        values = json.loads(data)
+        return cls(
+            id=values['id'],
+            username=values['username'],
+            email=values['email'],
+            created_at=datetime.fromisoformat(values['created_at']),
+        )
+
+def _key(user_id: int) -> str:
+    return f"user:record:{user_id}"
+
+def get_user_record(user_id: int) -> UserRecord | None:
+    """
+    Return a user's record, or None if the user does not exist.
+
+    Looks in this process's cache first, then in Redis, and only then
+    selects the user's profile columns from the primary, storing the result
+    in both caches. When Redis fails the database answers instead. Missing
+    users are not cached.
+    """
+    user_id = int(user_id)
+    if CACHE_TTL > 0:
+        record = _cache.get(user_id)
+        if record is not None:
+            return record
+
+    record = None
+    try:
+        data = get_redis().get(_key(user_id))
+        if data is not None:
+            record = UserRecord.from_json(data)
+    except RedisError as e:
+        logger.warning("Could not read cached user.", extra={"user_id": user_id, "error": str(e)})
+
+    if record is None:
+        # A user who just registered must be found even if the replica lags.
+        with primary_reads():
+            row = (
+                db.session.query(UserModel.id, UserModel.username, UserModel.email, UserModel.created_at)
+                .filter(UserModel.id == user_id)
+                .first()
+            )
+        if row is None:
+            return None
+
+        record = UserRecord(id=row.id, username=row.username, email=row.email, created_at=row.created_at)
+        try:
+            get_redis().set(_key(user_id), record.to_json(), ex=REDIS_TTL)
+        except RedisError as e:
+            logger.warning("Could not cache user.", extra={"user_id": user_id, "error": str(e)})
+
+    if CACHE_TTL > 0:
+        _cache.set(user_id, record)
+    return record
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop a user's cached record after the user was deleted or their profile changed.
+
+    Call after the change is committed. Clears Redis and this process's
+    copy; other processes keep theirs for at most `USER_CACHE_TTL` seconds.
+    """
+    user_id = int(user_id)
+    _cache.pop(user_id)
+    try:
+        get_redis().delete(_key(user_id))
+    except RedisError as e:
+        # The stale record is bounded by USER_CACHE_REDIS_TTL even if this fails.
+        logger.error("Could not invalidate cached user.", extra={"user_id": user_id, "error": str(e)})
+
+def reset_cache() -> None:
+    """Drop every record cached in this process."""
+    _cache.clear()
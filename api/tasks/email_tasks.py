@@ -1,35 +1,60 @@
 import os
+import json
 import requests
-import jinja2
 import logging
 from typing import Any
 from datetime import date
 
+from api.infra.http import get_http_session
+from api.infra.templates import get_template
 from api.exceptions import EmailTemporaryError, EmailPermanentError
 
 DOMAIN = os.getenv("MAILGUN_DOMAIN")
-template_loader = jinja2.FileSystemLoader("api/templates")
-template_env = jinja2.Environment(loader=template_loader)
+API_BASE_URL = os.getenv("MAILGUN_API_BASE_URL", "https://api.mailgun.net/v3")
+MAX_BATCH_RECIPIENTS = 1000  # Mailgun limit for batch sending
 logger = logging.getLogger(__name__)
 
 def render_template(template_filename: str, **context: Any) -> str:
     """Render a Jinja2 template with the given context."""
-    return template_env.get_template(template_filename).render(**context)
+    return get_template(template_filename).render(**context)
     
-def send_mailgun_message(to: str, subject: str, body: str, html: str) -> None:
-    """Send an email using the Mailgun API."""
+def send_mailgun_message(
+    to: str | list[str],
+    subject: str,
+    body: str,
+    html: str,
+    session: requests.Session | None = None,
+    recipient_variables: dict[str, dict[str, Any]] | None = None
+) -> None:
+    """
+    Send an email using the Mailgun API.
+
+    Requests go through the pooled keep-alive session from `get_http_session`
+    unless another `session` is injected (e.g. a stub in tests).
+
+    When `recipient_variables` are given, Mailgun batch sending is used: each
+    address in `to` receives its own copy with `%recipient.<name>%`
+    placeholders substituted from its variables.
+    """
+    if session is None:
+        session = get_http_session()
+
+    data = {"from": f"SubTracker Team <postmaster@{DOMAIN}>",
+        "to": to if isinstance(to, list) else [to],
+        "subject": subject,
+        "text": body,
+        "html": html,
+    }
+    if recipient_variables is not None:
+        data["recipient-variables"] = json.dumps(recipient_variables)
+
     try:
-        response = requests.post(
-  	    f"https://api.mailgun.net/v3/{DOMAIN}/messages",
-  		auth=("api", os.getenv("MAILGUN_API_KEY")),
-  		data={"from": f"SubTracker Team <postmaster@{DOMAIN}>",
-			"to": [to],
-  			"subject": subject,
-  			"text": body,
-            "html": html,
-        },
-        timeout=(5, 10),
-    )
+        response = session.post(
+            f"{API_BASE_URL}/{DOMAIN}/messages",
+            auth=("api", os.getenv("MAILGUN_API_KEY")),
+            data=data,
+            timeout=(5, 10),
+        )
     except requests.RequestException as e:
         raise EmailTemporaryError("Network error while sending email") from e
     
@@ -90,6 +115,45 @@ def send_email_reminder(user_email: str, subscription_name: str, next_payment_da
         html=html,
     )
 
+def send_email_reminders_batch(reminders: list[dict[str, Any]]) -> None:
+    """
+    Send upcoming payment reminders to many recipients with a single Mailgun request.
+
+    The reminder template is rendered once with `%recipient.*%` placeholders
+    and Mailgun fills them in per recipient from the recipient-variables.
+
+    Args:
+        reminders: Items with 'user_email', 'subscription_name' and
+            'next_payment_date'. Each email address may appear only once and
+            at most `MAX_BATCH_RECIPIENTS` items may be sent at a time.
+    """
+    if len(reminders) > MAX_BATCH_RECIPIENTS:
+        raise ValueError(f"Mailgun accepts at most {MAX_BATCH_RECIPIENTS} recipients per batch.")
+
+    recipient_variables = {
+        reminder['user_email']: {
+            "subscription_name": reminder['subscription_name'],
+            "next_payment_date": reminder['next_payment_date'].strftime("%Y-%m-%d"),
+        }
+        for reminder in reminders
+    }
+    if len(recipient_variables) != len(reminders):
+        raise ValueError("Each recipient may appear only once per batch.")
+
+    html = render_template(
+        "email/reminder.html",
+        subscription_name="%recipient.subscription_name%",
+        next_payment_date="%recipient.next_payment_date%",
+    )
+
+    send_mailgun_message(
+        to=list(recipient_variables),
+        subject="Upcoming payment reminder: %recipient.subscription_name%",
+        body="Your next payment for %recipient.subscription_name% is due on %recipient.next_payment_date%.",
+        html=html,
+        recipient_variables=recipient_variables,
+    )
+
 def send_monthly_summary_email(user_email: str, summary: dict[str, Any]) -> None:
     """Send a monthly subscription spending summary email to the user."""
     body = f"Your spending summary for {summary['month']} is {summary['total_spent']}."
@@ -1,11 +1,13 @@
-from flask import Flask, current_app
-from rq import Retry
+from flask import current_app
+from typing import Iterator
 from redis import RedisError
 
 from api.services import reminder_log as reminder_log_service
 from api.services import subscription as subscription_service
+from api.services.reminder_log_buffer import ReminderLogBuffer
 from api.tasks import email_tasks
-from api.infra.queues import get_reminder_queue
+from api.infra.db_routing import replica_reads
+from api.infra.queues import get_reminder_queue, enqueue, enqueue_many, prepare_job
 from api.exceptions import (
     SubscriptionNotFoundError, 
     ReminderLogCreateError, 
@@ -13,34 +15,65 @@ from api.exceptions import (
     EmailPermanentError
 )
 
+@replica_reads()
 def check_upcoming_payments() -> None:
     """
     Enqueue reminder jobs for subscriptions with upcoming payments.
 
-    This task retrieves subscriptions with payments due soon (e.g. in 1 or 7 days)
+    This task streams IDs of subscriptions with payments due soon (e.g. in 1 or 7 days)
     and enqueues a separate background job per subscription to handle email
     sending and logging. The task itself does not send emails directly.
-    """
-    subs = subscription_service.get_subscriptions_due_in([1, 7])
 
-    if not subs:
-        current_app.logger.info("No upcoming payments found")
+    When `REMINDER_FANOUT_MODE` is set to "batch", due subscription IDs are
+    streamed in keyset-ordered chunks of `REMINDER_BATCH_SIZE` and one
+    `send_subscription_reminders_batch` job is enqueued per chunk instead.
+
+    The scan reads from the replica, if one is configured.
+    """
+    if current_app.config.get("REMINDER_FANOUT_MODE") == "batch":
+        _enqueue_reminder_batches(current_app.config["REMINDER_BATCH_SIZE"])
         return
 
-    for sub in subs:
+    queue = get_reminder_queue()
+    found = False
+
+    for sub_id in subscription_service.iter_subscription_ids_due_in([1, 7]):
+        found = True
         try:
-            get_reminder_queue().enqueue(
-                send_single_subscription_reminder,
-                sub.id,
-                retry=Retry(max=3, interval=[30, 60, 120]),
-                job_timeout=60
-            )
+            enqueue(queue, send_single_subscription_reminder, sub_id)
         except RedisError as e:
             current_app.logger.error(
                 "Failed to enqueue reminder task",
-                extra={"error": str(e), "sub_id": sub.id}
+                extra={"error": str(e), "sub_id": sub_id}
+            )
+
+    if not found:
+        current_app.logger.info("No upcoming payments found")
+
+def _enqueue_reminder_batches(chunk_size: int) -> None:
+    """
+    Enqueue one `send_subscription_reminders_batch` job per chunk of due subscription IDs.
+
+    Prepared jobs are pushed with `enqueue_many`, which writes them through
+    a single Redis pipeline per flush. Batch jobs are never retried: a retry
+    would re-send every reminder of the chunk that was already delivered.
+    """
+    queue = get_reminder_queue()
+    batches = 0
+
+    def job_datas():
+        nonlocal batches
+        for chunk in subscription_service.iter_subscription_id_chunks_due_in([1, 7], chunk_size):
+            batches += 1
+            yield prepare_job(
+                queue, send_subscription_reminders_batch, chunk, timeout=max(60, len(chunk) * 2), retry=None
             )
 
+    enqueue_many(queue, job_datas())
+
+    if not batches:
+        current_app.logger.info("No upcoming payments found")
+
 def send_single_subscription_reminder(sub_id: int) -> None:
     """
     Send a reminder email for a single subscription.
@@ -88,4 +121,99 @@ def send_single_subscription_reminder(sub_id: int) -> None:
         current_app.logger.error(
             "Failed to log successful reminder",
             extra={"error": str(log_err), "sub_id": sub.id},
-        )
\ No newline at end of file
+        )
+
+def send_subscription_reminders_batch(sub_ids: list[int]) -> None:
+    """
+    Send reminder emails for a chunk of subscriptions.
+
+    Batch sibling of `send_single_subscription_reminder`: the whole chunk is
+    loaded with a single query and outcomes are written through a
+    `ReminderLogBuffer`, i.e. as bulk inserts into `reminder_logs` flushed on
+    size/time thresholds and when the job ends or raises.
+
+    Reminders are grouped into Mailgun batch sends of up to
+    `REMINDER_EMAIL_BATCH_SIZE` distinct recipients. A group rejected with a
+    permanent error falls back to single sends, so every subscription gets
+    its own log entry. Subscriptions that hit a temporary email error are
+    re-enqueued as single-subscription jobs, so the chunk itself is never
+    retried and already delivered reminders are not sent twice.
+
+    Args:
+        sub_ids (list[int]): Identifiers of the subscriptions in the chunk.
+    """
+    subs = subscription_service.get_subscriptions_by_ids(sub_ids)
+    batch_size = min(current_app.config["REMINDER_EMAIL_BATCH_SIZE"], email_tasks.MAX_BATCH_RECIPIENTS)
+    retry_ids = []
+
+    with ReminderLogBuffer.from_config() as logs:
+        for group in _group_by_recipient(subs, batch_size):
+            if len(group) > 1:
+                try:
+                    email_tasks.send_email_reminders_batch([
+                        {
+                            "user_email": sub.user.email,
+                            "subscription_name": sub.name,
+                            "next_payment_date": sub.next_payment_date,
+                        }
+                        for sub in group
+                    ])
+                except EmailTemporaryError:
+                    retry_ids.extend(sub.id for sub in group)
+                    continue
+                except EmailPermanentError as e:
+                    current_app.logger.warning(
+                        "Batch reminder rejected, falling back to single sends",
+                        extra={"error": str(e), "sub_ids": [sub.id for sub in group]},
+                    )
+                else:
+                    for sub in group:
+                        logs.add(sub.id, f"Reminder sent for {sub.name}", success=True)
+                    continue
+
+            for sub in group:
+                try:
+                    email_tasks.send_email_reminder(
+                        user_email=sub.user.email,
+                        subscription_name=sub.name,
+                        next_payment_date=sub.next_payment_date,
+                    )
+                except EmailTemporaryError:
+                    retry_ids.append(sub.id)
+                    continue
+                except EmailPermanentError as e:
+                    logs.add(sub.id, str(e), success=False)
+                    continue
+                logs.add(sub.id, f"Reminder sent for {sub.name}", success=True)
+
+    queue = get_reminder_queue()
+    for sub_id in retry_ids:
+        try:
+            enqueue(queue, send_single_subscription_reminder, sub_id)
+        except RedisError as e:
+            current_app.logger.error(
+                "Failed to re-enqueue reminder task",
+                extra={"error": str(e), "sub_id": sub_id}
+            )
+
+def _group_by_recipient(subs: list, batch_size: int) -> Iterator[list]:
+    """
+    Split subscriptions into groups of at most `batch_size` distinct recipients.
+
+    Mailgun keys recipient-variables by address, so a user owning several
+    due subscriptions gets one per group: their n-th subscription goes into
+    the n-th round of groups.
+    """
+    rounds: list[list] = []
+    seen: dict[str, int] = {}
+
+    for sub in subs:
+        occurrence = seen.get(sub.user.email, 0)
+        seen[sub.user.email] = occurrence + 1
+        if occurrence == len(rounds):
+            rounds.append([])
+        rounds[occurrence].append(sub)
+
+    for round_subs in rounds:
+        for i in range(0, len(round_subs), batch_size):
+            yield round_subs[i:i + batch_size]
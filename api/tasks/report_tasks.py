@@ -1,5 +1,4 @@
 from flask import current_app
-from rq import Retry
 from redis import RedisError
 from datetime import datetime, timezone
 
@@ -7,41 +6,37 @@ from api.services import subscription as subscription_service
 from api.services import user as user_service
 from api.utils import date_helpers
 from api.tasks import email_tasks
-from api.infra.queues import get_report_queue
+from api.infra.db_routing import replica_reads
+from api.infra.queues import get_report_queue, enqueue
 from api.exceptions import (
     EmailPermanentError, 
     EmailTemporaryError, 
     UserNotFoundError
 )
 
+@replica_reads()
 def generate_monthly_report() -> None:
     """
     Enqueue monthly summary report jobs for all users.
 
     This task is responsible only for orchestration:
     - Determines the target month.
-    - Fetches all users.
+    - Streams user IDs page by page (from the replica, if one is configured).
     - Enqueues a separate background job per user.
 
     Each user report is processed independently to ensure
     fault isolation and retry capability.
     """
     month = date_helpers.get_previous_month(datetime.now(timezone.utc))
-    users = user_service.get_all_users()
+    queue = get_report_queue()
 
-    for user in users:
+    for user_id in user_service.iter_user_ids():
         try:
-            get_report_queue().enqueue(
-                send_single_user_monthly_report,
-                user.id,
-                month,
-                retry=Retry(max=3, interval=[30, 60, 120]),
-                job_timeout=60
-            )
+            enqueue(queue, send_single_user_monthly_report, user_id, month)
         except RedisError as e:
             current_app.logger.error(
                 "Failed to enqueue report task",
-                extra={"error": str(e), "user_id": user.id}
+                extra={"error": str(e), "user_id": user_id}
             )
 
 def send_single_user_monthly_report(user_id: int, month: str) -> None:
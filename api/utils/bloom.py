@@ -0,0 +1,39 @@
+import hashlib
+import math
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over a bit array.
+
+    Bits are numbered like Redis bitmaps (bit 0 is the most significant bit
+    of byte 0), so a filter can be written with SETBIT and loaded back from
+    the bytes returned by GET.
+    """
+
+    def __init__(self, size: int, hash_count: int, bits: bytes | None = None):
+        self.size = size
+        self.hash_count = hash_count
+        self.bits = bytearray((size + 7) // 8)
+        if bits:
+            self.bits[:len(bits)] = bits[:len(self.bits)]
+
+    @staticmethod
+    def parameters_for(capacity: int, error_rate: float) -> tuple[int, int]:
+        """Return the (size in bits, hash count) giving `error_rate` at `capacity` items."""
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hash_count = max(1, round(size / capacity * math.log(2)))
+        return size, hash_count
+
+    def positions(self, item: str) -> list[int]:
+        # Double hashing: k positions from two independent 64-bit hashes.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (0x80 >> (position & 7)) for position in self.positions(item))
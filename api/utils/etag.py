@@ -0,0 +1,27 @@
+import hashlib
+import json
+from typing import Any
+from flask import Response, abort, request
+from werkzeug.http import quote_etag
+
+def conditional_get(*version: Any) -> dict[str, str]:
+    """
+    Answer a GET with 304 Not Modified if the client's copy is still current.
+
+    Call this before loading or serializing anything: `version` only has to
+    identify the state of the data behind the response (e.g. the user's
+    subscriptions version), not the response itself. The resulting weak
+    ETag is compared with `If-None-Match`.
+
+    Returns:
+        dict[str, str]: Headers to send with the full 200 response.
+    """
+    tag = hashlib.sha1(json.dumps(version, default=str).encode()).hexdigest()
+    headers = {
+        "ETag": quote_etag(tag, weak=True),
+        # Responses are per user: revalidate every time, never store in shared caches.
+        "Cache-Control": "private, no-cache",
+    }
+    if request.if_none_match.contains_weak(tag):
+        abort(Response(status=304, headers=headers))
+    return headers
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import enum
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
+from flask import Response, stream_with_context
+
+# Rows written per response chunk.
+EXPORT_CHUNK_ROWS = 500
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to its JSON/CSV representation."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+def _chunks(rows: Iterable[Any]) -> Iterator[list[Any]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, EXPORT_CHUNK_ROWS)):
+        yield chunk
+
+def ndjson_chunks(columns: Sequence[str], rows: Iterable[Any]) -> Iterator[str]:
+    """Yield NDJSON text, one object per row, `EXPORT_CHUNK_ROWS` rows per chunk."""
+    for chunk in _chunks(rows):
+        yield "".join(
+            json.dumps({name: _plain(value) for name, value in zip(columns, row)}) + "\n"
+            for row in chunk
+        )
+
+def csv_chunks(columns: Sequence[str], rows: Iterable[Any]) -> Iterator[str]:
+    """Yield CSV text with a header line, `EXPORT_CHUNK_ROWS` rows per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in _chunks(rows):
+        writer.writerows([_plain(value) for value in row] for row in chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header of an empty export.
+    if buffer.tell():
+        yield buffer.getvalue()
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", ndjson_chunks),
+    "csv": ("text/csv", csv_chunks),
+}
+
+def stream_export(filename: str, columns: Sequence[str], rows: Iterable[Any], export_format: str) -> Response:
+    """
+    Build a streaming download of `rows` in one of `EXPORT_FORMATS`.
+
+    The body is generated while it is sent, inside the request context, so
+    `rows` may be a lazily fetched query result and only one chunk of it is
+    in memory at a time.
+    """
+    mimetype, formatter = EXPORT_FORMATS[export_format]
+    return Response(
+        stream_with_context(formatter(columns, rows)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
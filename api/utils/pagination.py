@@ -0,0 +1,25 @@
+import base64
+import json
+from typing import Any, Sequence
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    payload = json.dumps(list(key), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decode a cursor created by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(payload)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Malformed cursor.") from e
+
+    if not isinstance(key, list):
+        raise ValueError("Malformed cursor.")
+    return key
@@ -0,0 +1,63 @@
+"""
+Measure blocklist lookups/second with and without the Bloom filter front.
+
+Revokes `--revoked` tokens, then checks `--lookups` never-revoked JTIs with
+the local answer cache disabled, so every lookup either goes to Redis
+("exact") or is answered by the local Bloom filter copy ("bloom"). Redis is
+an in-memory fake that adds `--redis-latency-ms` per command. Also reports
+the observed false positive rate of a filter sized for exactly `--revoked`
+tokens, i.e. filled to capacity.
+
+Usage:
+    python -m benchmarks.blocklist_bloom --revoked 10000 --lookups 20000
+"""
+import argparse
+import time
+import uuid
+from unittest import mock
+
+from api.services import blocklist
+from benchmarks.blocklist_cache import SlowFakeRedis
+
+def lookups_per_second(jtis: list[str]) -> float:
+    started = time.perf_counter()
+    for jti in jtis:
+        assert blocklist.is_jti_blocked(jti) is False
+    return len(jtis) / (time.perf_counter() - started)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revoked", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--redis-latency-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    redis_conn = SlowFakeRedis()
+    jtis = [str(uuid.uuid4()) for _ in range(args.lookups)]
+    size, hash_count = blocklist.BloomFilter.parameters_for(args.revoked, blocklist.BLOOM_ERROR_RATE)
+
+    with mock.patch.object(blocklist, "get_redis", return_value=redis_conn), \
+            mock.patch.object(blocklist, "CACHE_TTL", 0), \
+            mock.patch.object(blocklist, "BLOOM_ENABLED", True), \
+            mock.patch.object(blocklist, "_bloom_size", size), \
+            mock.patch.object(blocklist, "_bloom_hash_count", hash_count):
+        for _ in range(args.revoked):
+            blocklist.add_jti_to_blocklist(str(uuid.uuid4()), exp=60)
+
+        SlowFakeRedis.latency = args.redis_latency_ms / 1000
+        blocklist._sync_bloom_filters()
+
+        false_positives = sum(blocklist._bloom_might_contain(jti) for jti in jtis)
+        print(f"false positive rate: {false_positives / len(jtis):.4%} "
+              f"(target {blocklist.BLOOM_ERROR_RATE:.2%}, {size} bits, {hash_count} hashes)")
+        print()
+
+        print(f"{'lookup':<8}{'lookups':>10}{'lookups/s':>12}")
+        with mock.patch.object(blocklist, "BLOOM_ENABLED", False):
+            print(f"{'exact':<8}{len(jtis):>10}{lookups_per_second(jtis):>12.0f}")
+        print(f"{'bloom':<8}{len(jtis):>10}{lookups_per_second(jtis):>12.0f}")
+
+        blocklist.reset_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Load-test GET /subscriptions with and without the local JWT blocklist cache.
+
+Issues authenticated requests through the Flask test client against a
+throwaway SQLite database and reports p50/p99 latency. The blocklist talks
+to the Redis at REDIS_URL when `--real-redis` is given; otherwise an
+in-memory fake Redis adds `--redis-latency-ms` to every command to stand in
+for the network round trip.
+
+Usage:
+    python -m benchmarks.blocklist_cache --requests 2000 --redis-latency-ms 0.5
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+import fakeredis
+from flask_jwt_extended import create_access_token
+
+from api import create_app
+from api.extensions import db
+from api.infra.redis import get_redis
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.services import blocklist
+
+class SlowFakeRedis(fakeredis.FakeRedis):
+    latency = 0.0
+
+    def execute_command(self, *args, **options):
+        time.sleep(self.latency)
+        return super().execute_command(*args, **options)
+
+def seed() -> int:
+    user = UserModel(username="bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    db.session.add_all([
+        SubscriptionModel(
+            user_id=user.id,
+            name=f"Sub {i}",
+            price=Decimal("9.99"),
+            billing_cycle=BillingCycleEnum.monthly,
+            next_payment_date=date(2030, 1, i + 1),
+        )
+        for i in range(20)
+    ])
+    db.session.commit()
+    return user.id
+
+def run(client, token: str, count: int) -> list[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = client.get("/subscriptions", headers=headers)
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200
+    return samples
+
+def percentile(samples: list[float], pct: int) -> float:
+    return statistics.quantiles(samples, n=100)[pct - 1] * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--redis-latency-ms", type=float, default=0.5)
+    parser.add_argument("--real-redis", action="store_true")
+    args = parser.parse_args()
+
+    if args.real_redis:
+        redis_conn = get_redis()
+    else:
+        SlowFakeRedis.latency = args.redis_latency_ms / 1000
+        redis_conn = SlowFakeRedis()
+
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.object(blocklist, "get_redis", return_value=redis_conn):
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+        })
+        with app.app_context():
+            db.create_all()
+            token = create_access_token(identity=str(seed()))
+            client = app.test_client()
+
+            print(f"{'blocklist':<10}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}")
+            for label, ttl in (("redis", 0), ("cached", blocklist.CACHE_TTL or 5)):
+                blocklist.reset_cache()
+                with mock.patch.object(blocklist, "CACHE_TTL", ttl):
+                    run(client, token, 50)  # warm up
+                    samples = run(client, token, args.requests)
+                print(f"{label:<10}{args.requests:>10}{percentile(samples, 50):>10.3f}{percentile(samples, 99):>10.3f}")
+
+            blocklist.reset_cache()
+            db.session.remove()
+            db.engine.dispose()
+
+if __name__ == "__main__":
+    main()
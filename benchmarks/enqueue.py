@@ -0,0 +1,62 @@
+"""
+Micro-benchmark enqueueing N reminder jobs three ways:
+
+- "rebuild": a new `rq.Queue` and `Retry` per job, as the task modules did.
+- "registry": the cached queue and `enqueue` helper from `api.infra.queues`.
+- "batched": `prepare_job` + `enqueue_many`, one pipeline per 100 jobs.
+
+Usage:
+    python -m benchmarks.enqueue --count 100000
+    python -m benchmarks.enqueue --redis-url redis://localhost:6379/15
+
+Without --redis-url FakeRedis is used, which hides network round trips; with
+a real Redis (use a scratch DB, it is flushed) the batched path also saves
+one round trip per job.
+"""
+import argparse
+import time
+from unittest import mock
+
+import fakeredis
+import redis
+from rq import Queue, Retry
+
+from api.infra import queues
+from api.tasks.reminder_tasks import send_single_subscription_reminder as task
+
+def rebuild(count: int) -> None:
+    for i in range(count):
+        Queue("reminders", connection=queues.get_redis()).enqueue(
+            task, i, retry=Retry(max=3, interval=[30, 60, 120]), job_timeout=60
+        )
+
+def registry(count: int) -> None:
+    for i in range(count):
+        queues.enqueue(queues.get_reminder_queue(), task, i)
+
+def batched(count: int) -> None:
+    queue = queues.get_reminder_queue()
+    queues.enqueue_many(queue, (queues.prepare_job(queue, task, i) for i in range(count)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    connection = redis.from_url(args.redis_url) if args.redis_url else fakeredis.FakeRedis()
+
+    with mock.patch.object(queues, "get_redis", return_value=connection):
+        print(f"{'enqueue':<10}{'jobs':>8}{'seconds':>10}{'jobs/s':>10}")
+        for label, run in (("rebuild", rebuild), ("registry", registry), ("batched", batched)):
+            connection.flushdb()
+            queues.reset_queues()
+            started = time.perf_counter()
+            run(args.count)
+            elapsed = time.perf_counter() - started
+            assert queues.get_reminder_queue().count == args.count
+            print(f"{label:<10}{args.count:>8}{elapsed:>10.2f}{args.count / elapsed:>10.0f}")
+        connection.flushdb()
+
+if __name__ == "__main__":
+    main()
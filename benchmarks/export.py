@@ -0,0 +1,117 @@
+"""
+Measure peak memory of the streaming reminder log export vs materializing it.
+
+Seeds one user with `--logs` reminder logs spread over 100 subscriptions
+into a throwaway SQLite database. The baseline loads every log with
+`.all()` and dumps it with `ReminderLogResponseSchema` in one go, which is
+what a non-streaming endpoint would do. The export streams
+GET /reminder_logs/export through the test client and discards each chunk.
+
+Usage:
+    python -m benchmarks.export --logs 100000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+import fakeredis
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from api import create_app
+from api.extensions import db
+from api.models import ReminderLogModel, SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.schemas import ReminderLogResponseSchema
+from api.services import blocklist
+
+SUBSCRIPTIONS = 100
+
+def seed(logs: int) -> int:
+    user = UserModel(username="bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    db.session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": user.id,
+            "name": f"Sub {i}",
+            "price": Decimal("9.99"),
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": date(2025, 1, i % 28 + 1),
+            "category": "bench",
+        }
+        for i in range(SUBSCRIPTIONS)
+    ])
+    sub_ids = [row.id for row in db.session.query(SubscriptionModel.id).filter_by(user_id=user.id)]
+    for start in range(0, logs, 10000):
+        db.session.execute(insert(ReminderLogModel), [
+            {"subscription_id": sub_ids[i % len(sub_ids)], "message": f"Reminder {i} sent", "success": True}
+            for i in range(start, min(start + 10000, logs))
+        ])
+    db.session.commit()
+    return user.id
+
+def measure(fn) -> tuple[float, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, size
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logs", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(blocklist, "get_redis", return_value=fakeredis.FakeRedis()):
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+        })
+        with app.app_context():
+            db.create_all()
+            user_id = seed(args.logs)
+            headers = {"Authorization": f"Bearer {create_access_token(identity=str(user_id))}"}
+            client = app.test_client()
+
+            def materialized() -> int:
+                logs = (
+                    ReminderLogModel.query
+                    .join(SubscriptionModel)
+                    .filter(SubscriptionModel.user_id == user_id)
+                    .all()
+                )
+                body = json.dumps(ReminderLogResponseSchema(many=True).dump(logs))
+                db.session.expunge_all()
+                return len(body)
+
+            def streamed(export_format: str) -> int:
+                response = client.get(f"/reminder_logs/export?format={export_format}", headers=headers, buffered=False)
+                size = sum(len(chunk) for chunk in response.response)
+                response.close()
+                return size
+
+            print(f"{'variant':<22}{'seconds':>10}{'peak MiB':>10}{'body MiB':>10}")
+            for name, fn in (
+                ("materialized json", materialized),
+                ("streamed ndjson", lambda: streamed("ndjson")),
+                ("streamed csv", lambda: streamed("csv")),
+            ):
+                elapsed, peak, size = measure(fn)
+                print(f"{name:<22}{elapsed:>10.2f}{peak:>10.1f}{size / 1024 / 1024:>10.1f}")
+
+            db.session.remove()
+            db.engine.dispose()
+        blocklist.reset_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Measure emails/second of `send_mailgun_message` against a local HTTPS stand-in.
+
+Starts a threaded HTTP/1.1 server with a throwaway self-signed certificate
+that answers every POST with 200, then sends N messages:
+
+- "per-request": a new connection (TCP + TLS handshake) for every email,
+  which is what the module-level `requests.post` did.
+- "pooled": the shared keep-alive session from `api.infra.http`.
+
+Usage:
+    python -m benchmarks.mailgun_client --count 500
+"""
+import argparse
+import datetime
+import ipaddress
+import os
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+class MailgunStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"message": "Queued. Thank you."}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def write_self_signed_cert(directory: str) -> tuple[str, str]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    with open(cert_file, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_file, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ))
+    return cert_file, key_file
+
+def start_stub(cert_file: str, key_file: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MailgunStub)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_file, key_file = write_self_signed_cert(tmp)
+        server = start_stub(cert_file, key_file)
+
+        os.environ["MAILGUN_API_BASE_URL"] = f"https://127.0.0.1:{server.server_port}/v3"
+        os.environ["MAILGUN_DOMAIN"] = "example.org"
+        from api.infra.http import get_http_session
+        from api.tasks import email_tasks
+
+        def per_request_session() -> requests.Session:
+            session = requests.Session()
+            session.verify = cert_file
+            session.trust_env = False
+            return session
+
+        pooled = get_http_session()
+        pooled.verify = cert_file
+        pooled.trust_env = False
+
+        print(f"{'client':<14}{'emails':>8}{'seconds':>10}{'emails/s':>10}")
+        for label, session_for in (("per-request", lambda: per_request_session()), ("pooled", lambda: pooled)):
+            started = time.perf_counter()
+            for i in range(args.count):
+                session = session_for()
+                email_tasks.send_mailgun_message(f"user{i}@example.com", "Subject", "Body", "<p>Body</p>", session=session)
+                if session is not pooled:
+                    session.close()
+            elapsed = time.perf_counter() - started
+            print(f"{label:<14}{args.count:>8}{elapsed:>10.2f}{args.count / elapsed:>10.0f}")
+
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compare `get_monthly_summary` latency with Python-side vs SQL-side aggregation.
+
+Seeds users owning 10, 100 and 1,000 subscriptions in one month into a
+throwaway SQLite database and times both implementations per user.
+
+Usage:
+    python -m benchmarks.monthly_summary --repeat 200
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import insert
+
+from api import create_app
+from api.extensions import db
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.services import subscription as subscription_service
+
+SIZES = (10, 100, 1000)
+MONTH = "2025-10"
+
+def python_side_summary(user_id: int, month: str) -> dict[str, object]:
+    """The previous implementation: hydrate every row and aggregate in Python."""
+    year, month_num = map(int, month.split("-"))
+    start_date = date(year, month_num, 1)
+    end_date = date(year + 1, 1, 1) if month_num == 12 else date(year, month_num + 1, 1)
+
+    subs = SubscriptionModel.query.filter(
+        SubscriptionModel.user_id == user_id,
+        SubscriptionModel.next_payment_date >= start_date,
+        SubscriptionModel.next_payment_date < end_date,
+    ).all()
+
+    total_spent = Decimal("0.00")
+    by_category: dict[str, Decimal] = {}
+    for sub in subs:
+        amount = Decimal(sub.price)
+        total_spent += amount
+        category = sub.category or "uncategorized"
+        by_category[category] = by_category.get(category, Decimal("0.00")) + amount
+
+    return {
+        "month": month,
+        "total_spent": total_spent.quantize(Decimal("0.01")),
+        "by_category": {k: v.quantize(Decimal("0.01")) for k, v in by_category.items()},
+    }
+
+def seed() -> dict[int, int]:
+    user_ids = {}
+    for size in SIZES:
+        user = UserModel(username=f"user{size}", email=f"user{size}@example.com", password="x")
+        db.session.add(user)
+        db.session.flush()
+        user_ids[size] = user.id
+        db.session.execute(insert(SubscriptionModel), [
+            {
+                "user_id": user.id,
+                "name": f"Sub {i}",
+                "price": Decimal("9.99"),
+                "billing_cycle": BillingCycleEnum.monthly,
+                "next_payment_date": date(2025, 10, i % 28 + 1),
+                "category": f"category{i % 8}",
+            }
+            for i in range(size)
+        ])
+    db.session.commit()
+    return user_ids
+
+def timed(fn, user_id: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        fn(user_id, MONTH)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}"})
+        with app.app_context():
+            db.create_all()
+            user_ids = seed()
+
+            print(f"{'subscriptions':>14}{'python ms':>12}{'sql ms':>10}{'speedup':>10}")
+            for size, user_id in user_ids.items():
+                assert python_side_summary(user_id, MONTH) == subscription_service.get_monthly_summary(user_id, MONTH)
+                before = timed(python_side_summary, user_id, args.repeat)
+                after = timed(subscription_service.get_monthly_summary, user_id, args.repeat)
+                print(f"{size:>14}{before:>12.3f}{after:>10.3f}{before / after:>9.1f}x")
+
+            db.session.remove()
+            db.engine.dispose()
+
+if __name__ == "__main__":
+    main()
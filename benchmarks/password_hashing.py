@@ -0,0 +1,108 @@
+"""
+Measure logins/second and GET /subscriptions latency under a login storm.
+
+Serves the app from a threaded WSGI server on a throwaway SQLite database.
+`--login-threads` clients log in as fast as they can while one client
+calls /subscriptions and records its latency. This runs once with hashing
+in the request thread and once with `--workers` hashing processes
+(PASSWORD_HASH_WORKERS).
+
+Usage:
+    python -m benchmarks.password_hashing --seconds 5 --login-threads 8 --workers 2
+"""
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import fakeredis
+import requests
+from flask_jwt_extended import create_access_token
+from werkzeug.serving import make_server
+
+from api import create_app
+from api.extensions import db
+from api.models import UserModel
+from api.services import blocklist, password
+
+EMAIL = "bench@example.com"
+PASSWORD = "benchmark-password"
+
+def run_load(base_url: str, token: str, seconds: float, login_threads: int) -> tuple[float, list[float]]:
+    stop = threading.Event()
+    logins = []
+
+    def login() -> None:
+        session = requests.Session()
+        session.trust_env = False
+        count = 0
+        while not stop.is_set():
+            response = session.post(f"{base_url}/login", json={"email": EMAIL, "password": PASSWORD})
+            assert response.status_code == 200
+            count += 1
+        logins.append(count)
+
+    threads = [threading.Thread(target=login) for _ in range(login_threads)]
+    for thread in threads:
+        thread.start()
+
+    session = requests.Session()
+    session.trust_env = False
+    samples = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = session.get(f"{base_url}/subscriptions", headers={"Authorization": f"Bearer {token}"})
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(logins) / seconds, samples
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--login-threads", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(blocklist, "get_redis", return_value=fakeredis.FakeRedis()):
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+        })
+        with app.app_context():
+            db.create_all()
+            user = UserModel(username="bench", email=EMAIL, password=password.hash_password(PASSWORD))
+            db.session.add(user)
+            db.session.commit()
+            token = create_access_token(identity=str(user.id))
+
+        server = make_server("127.0.0.1", 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        print(f"{'hashing':<14}{'logins/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for label, workers in (("in-thread", 0), (f"{args.workers} processes", args.workers)):
+            with mock.patch.object(password, "HASH_WORKERS", workers):
+                password.reset()
+                if workers:
+                    password.verify_password(PASSWORD, password.hash_password(PASSWORD))  # start the pool
+                rate, samples = run_load(base_url, token, args.seconds, args.login_threads)
+                password.reset()
+            quantiles = statistics.quantiles(samples, n=100)
+            print(f"{label:<14}{rate:>10.1f}{quantiles[49] * 1000:>10.2f}{quantiles[98] * 1000:>10.2f}")
+
+        server.shutdown()
+        blocklist.reset_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compare enqueue time and Redis memory of the reminder fan-out modes.
+
+Seeds N subscriptions due tomorrow into a throwaway SQLite database and runs
+`check_upcoming_payments` once in "single" and once in "batch" mode.
+
+Usage:
+    python -m benchmarks.reminder_fanout --count 100000 --batch-size 500
+    python -m benchmarks.reminder_fanout --redis-url redis://localhost:6379/15
+
+Without --redis-url the run uses FakeRedis and reports the serialized size of
+all keys (DUMP) as the memory figure; with a real Redis (use a scratch DB, it
+is flushed) `used_memory` from INFO is reported instead.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+import fakeredis
+import redis
+from rq import Queue
+from sqlalchemy import insert
+
+from api import create_app
+from api.extensions import db
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.tasks import reminder_tasks
+
+def seed(count: int) -> None:
+    due = date.today() + timedelta(days=1)
+    users = max(1, count // 10)
+    db.session.execute(insert(UserModel), [
+        {"username": f"user{i}", "email": f"user{i}@example.com", "password": "x"}
+        for i in range(users)
+    ])
+    db.session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": i % users + 1,
+            "name": f"Sub {i}",
+            "price": "9.99",
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": due,
+            "category": "bench",
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+
+def redis_memory(conn) -> int:
+    if isinstance(conn, fakeredis.FakeRedis):
+        return sum(len(conn.dump(key) or b"") for key in conn.scan_iter(count=10000))
+    return conn.info("memory")["used_memory"]
+
+def run(app, conn, mode: str, batch_size: int) -> tuple[float, int, int]:
+    conn.flushdb()
+    baseline = redis_memory(conn)
+    queue = Queue("reminders", connection=conn)
+    app.config['REMINDER_FANOUT_MODE'] = mode
+    app.config['REMINDER_BATCH_SIZE'] = batch_size
+
+    with mock.patch("api.tasks.reminder_tasks.get_reminder_queue", return_value=queue):
+        started = time.perf_counter()
+        reminder_tasks.check_upcoming_payments()
+        elapsed = time.perf_counter() - started
+
+    return elapsed, queue.count, redis_memory(conn) - baseline
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    conn = redis.from_url(args.redis_url) if args.redis_url else fakeredis.FakeRedis()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}"})
+        with app.app_context():
+            db.create_all()
+            seed(args.count)
+
+            print(f"{args.count} due subscriptions, batch size {args.batch_size}")
+            print(f"{'mode':<8}{'jobs':>10}{'enqueue s':>12}{'redis bytes':>16}")
+            for mode in ("single", "batch"):
+                elapsed, jobs, memory = run(app, conn, mode, args.batch_size)
+                print(f"{mode:<8}{jobs:>10}{elapsed:>12.2f}{memory:>16,}")
+
+            db.session.remove()
+            db.engine.dispose()
+
+if __name__ == "__main__":
+    main()
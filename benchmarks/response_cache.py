@@ -0,0 +1,99 @@
+"""
+Compare read endpoint latency with the response cache off and on.
+
+Seeds one user with `--subscriptions` subscriptions into a throwaway SQLite
+database and times repeated GETs of each cached endpoint through the test
+client, first with RESPONSE_CACHE_ENABLED off and then on. Redis is an
+in-process fakeredis, so the cached numbers leave out the network round trip.
+
+Usage:
+    python -m benchmarks.response_cache --subscriptions 200 --repeat 500
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+import fakeredis
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from api import create_app
+from api.extensions import db
+from api.infra import response_cache
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.services import blocklist
+
+ENDPOINTS = (
+    "/subscriptions?limit=100",
+    "/reminders/upcoming?days=30",
+    f"/stats/summary?month={date.today():%Y-%m}",
+)
+
+def seed(count: int) -> int:
+    user = UserModel(username="bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    db.session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": user.id,
+            "name": f"Sub {i}",
+            "price": Decimal("9.99"),
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": date.today() + timedelta(days=i % 60),
+            "category": f"category{i % 8}",
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+    return user.id
+
+def timed(client, url: str, headers: dict[str, str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200
+    return statistics.median(samples) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscriptions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    fake_redis = fakeredis.FakeRedis()
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(blocklist, "get_redis", return_value=fake_redis), \
+            mock.patch.object(response_cache, "get_redis", return_value=fake_redis):
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+        })
+        with app.app_context():
+            db.create_all()
+            user_id = seed(args.subscriptions)
+            headers = {"Authorization": f"Bearer {create_access_token(identity=str(user_id))}"}
+            client = app.test_client()
+
+            print(f"{'endpoint':<40}{'off ms':>10}{'on ms':>10}{'speedup':>10}")
+            for url in ENDPOINTS:
+                app.config["RESPONSE_CACHE_ENABLED"] = False
+                before = timed(client, url, headers, args.repeat)
+                app.config["RESPONSE_CACHE_ENABLED"] = True
+                after = timed(client, url, headers, args.repeat)
+                print(f"{url:<40}{before:>10.3f}{after:>10.3f}{before / after:>9.1f}x")
+
+            print(response_cache.get_stats())
+            db.session.remove()
+            db.engine.dispose()
+        blocklist.reset_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Time importing subscriptions in bulk vs one POST /subscriptions per row.
+
+Each body format is imported through the test client into a fresh user on a
+throwaway SQLite database. The one-at-a-time baseline posts `--baseline-rows`
+rows and extrapolates to `--rows`.
+
+Usage:
+    python -m benchmarks.subscription_import --rows 10000 --baseline-rows 500
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+import fakeredis
+from flask_jwt_extended import create_access_token
+
+from api import create_app
+from api.extensions import db
+from api.infra import response_cache
+from api.models import UserModel
+from api.services import blocklist
+
+FIELDS = ("name", "price", "billing_cycle", "next_payment_date", "category")
+
+def make_rows(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "name": f"Sub {i}",
+            "price": f"{i % 50 + 1}.99",
+            "billing_cycle": "monthly",
+            "next_payment_date": (date(2025, 1, 1) + timedelta(days=i % 365)).isoformat(),
+            "category": f"category{i % 8}",
+        }
+        for i in range(count)
+    ]
+
+def encode(rows: list[dict[str, str]], fmt: str) -> tuple[str, str]:
+    if fmt == "json":
+        return "application/json", json.dumps(rows)
+    if fmt == "ndjson":
+        return "application/x-ndjson", "".join(json.dumps(row) + "\n" for row in rows)
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return "text/csv", buffer.getvalue()
+
+def new_user_headers(name: str) -> dict[str, str]:
+    user = UserModel(username=name, email=f"{name}@example.com", password="x")
+    db.session.add(user)
+    db.session.commit()
+    return {"Authorization": f"Bearer {create_access_token(identity=str(user.id))}"}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--baseline-rows", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    fake_redis = fakeredis.FakeRedis()
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(blocklist, "get_redis", return_value=fake_redis), \
+            mock.patch.object(response_cache, "get_redis", return_value=fake_redis):
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+            "SUBSCRIPTION_IMPORT_MAX_ROWS": args.rows,
+        })
+        with app.app_context():
+            db.create_all()
+            client = app.test_client()
+
+            headers = new_user_headers("baseline")
+            started = time.perf_counter()
+            for row in rows[:args.baseline_rows]:
+                assert client.post("/subscriptions", json=row, headers=headers).status_code == 201
+            per_row = (time.perf_counter() - started) / args.baseline_rows
+            print(f"{'one POST per row':<20}{per_row * args.rows:>10.2f} s  (extrapolated from {args.baseline_rows} rows)")
+
+            for fmt in ("json", "csv", "ndjson"):
+                content_type, body = encode(rows, fmt)
+                headers = {**new_user_headers(fmt), "Content-Type": content_type}
+                started = time.perf_counter()
+                response = client.post("/subscriptions/import", data=body, headers=headers)
+                elapsed = time.perf_counter() - started
+                assert response.json['created'] == args.rows, response.json['errors'][:3]
+                print(f"{'import ' + fmt:<20}{elapsed:>10.2f} s")
+
+            db.session.remove()
+            db.engine.dispose()
+        blocklist.reset_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure renders/second of the reminder email template.
+
+Compares the previous setup - a CWD-relative `FileSystemLoader` with
+auto-reload on, which stats the template source on every lookup - with the
+environment from `api.infra.templates`. Also reports the cold start of a new
+process's environment with an empty and with a warm bytecode cache.
+
+Usage:
+    python -m benchmarks.template_render --count 10000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+import jinja2
+
+from api.infra import templates
+
+REMINDER = "email/reminder.html"
+
+def render_many(env: jinja2.Environment, count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        env.get_template(REMINDER).render(
+            subscription_name=f"Subscription {i}",
+            next_payment_date=date(2025, 1, 1).strftime("%Y-%m-%d"),
+        )
+    return time.perf_counter() - started
+
+def cold_start() -> float:
+    templates._env = None
+    started = time.perf_counter()
+    templates.precompile_templates()
+    return time.perf_counter() - started
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TEMPLATE_CACHE_DIR"] = tmp
+        os.environ.pop("TEMPLATE_AUTO_RELOAD", None)
+
+        empty_cache = cold_start()
+        warm_cache = cold_start()
+        print(f"{'startup':<22}{'ms':>8}")
+        print(f"{'empty bytecode cache':<22}{empty_cache * 1000:>8.2f}")
+        print(f"{'warm bytecode cache':<22}{warm_cache * 1000:>8.2f}")
+        print()
+
+        baseline = jinja2.Environment(loader=jinja2.FileSystemLoader(templates.TEMPLATE_DIR))
+        print(f"{'environment':<22}{'renders':>8}{'seconds':>10}{'renders/s':>11}")
+        for label, env in (("auto-reload", baseline), ("precompiled", templates.get_template_env())):
+            elapsed = render_many(env, args.count)
+            print(f"{label:<22}{args.count:>8}{elapsed:>10.2f}{args.count / elapsed:>11.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Compare GET /subscriptions requests/second under the dev server and gunicorn.
+
+Seeds one user with `--subscriptions` subscriptions into a throwaway SQLite
+database, then starts each server in turn on a local port and drives it
+with `--clients` load generator processes for `--duration` seconds each.
+The dev server is `flask run` as the old Dockerfile ran it, minus the
+reloader and debugger that `.flaskenv` turns on; the gunicorn variants use
+gunicorn_config.py with the worker class overridden. Redis is an in-process
+fakeredis in every server process.
+
+Usage:
+    python -m benchmarks.wsgi_server --clients 8 --duration 10
+"""
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+import fakeredis
+import requests
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from api import create_app
+from api.extensions import db
+from api.infra import response_cache
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.services import blocklist, user_cache
+
+APP_FACTORY = "benchmarks.wsgi_server:create_bench_app()"
+URL = "/subscriptions?limit=20"
+PORT = 5123
+
+def create_bench_app():
+    """App factory run inside each server process, with Redis replaced by fakeredis."""
+    fake_redis = fakeredis.FakeRedis()
+    for module in (blocklist, user_cache, response_cache):
+        mock.patch.object(module, "get_redis", return_value=fake_redis).start()
+    return create_app()
+
+def seed(count: int) -> str:
+    user = UserModel(username="bench", email="bench@example.com", password="x")
+    db.session.add(user)
+    db.session.flush()
+    db.session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": user.id,
+            "name": f"Sub {i}",
+            "price": Decimal("9.99"),
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": date.today() + timedelta(days=i % 60),
+            "category": f"category{i % 8}",
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+    return create_access_token(identity=str(user.id), expires_delta=timedelta(hours=1))
+
+def wait_until_ready(base_url: str, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Server exited before it started listening.")
+        try:
+            requests.get(f"{base_url}/guest", timeout=5)
+            return
+        except requests.RequestException:
+            time.sleep(0.1)
+    raise RuntimeError("Server did not start listening.")
+
+def drive(base_url: str, token: str, duration: float) -> tuple[int, int]:
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    done = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        if session.get(f"{base_url}{URL}", timeout=10).status_code == 200:
+            done += 1
+        else:
+            errors += 1
+    return done, errors
+
+def measure(command: list[str], env: dict[str, str], token: str, clients: int, duration: float) -> tuple[float, int]:
+    base_url = f"http://127.0.0.1:{PORT}"
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(base_url, server)
+        drive(base_url, token, 1)
+        with multiprocessing.Pool(clients) as pool:
+            results = pool.starmap(drive, [(base_url, token, duration)] * clients)
+    finally:
+        server.terminate()
+        server.wait()
+    return sum(done for done, _ in results) / duration, sum(errors for _, errors in results)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscriptions", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "JWT_SECRET_KEY": "benchmark-secret-key-of-sufficient-length",
+            "GUNICORN_BIND": f"127.0.0.1:{PORT}",
+            "GUNICORN_ACCESS_LOG": "",
+        }
+        app = create_app({"SQLALCHEMY_DATABASE_URI": env["DATABASE_URL"], "JWT_SECRET_KEY": env["JWT_SECRET_KEY"]})
+        with app.app_context():
+            db.create_all()
+            token = seed(args.subscriptions)
+            db.session.remove()
+            db.engine.dispose()
+
+        gunicorn = [sys.executable, "-m", "gunicorn", "-c", "gunicorn_config.py", APP_FACTORY]
+        variants = [
+            ("flask run", [sys.executable, "-m", "flask", "--app", APP_FACTORY, "run", "--port", str(PORT), "--no-reload", "--no-debugger"], {}),
+            ("gunicorn sync", gunicorn, {"GUNICORN_WORKER_CLASS": "sync"}),
+            ("gunicorn gthread", gunicorn, {"GUNICORN_WORKER_CLASS": "gthread"}),
+        ]
+        if importlib.util.find_spec("gevent"):
+            variants.append(("gunicorn gevent", gunicorn, {"GUNICORN_WORKER_CLASS": "gevent"}))
+
+        print(f"{os.cpu_count()} CPUs, {args.clients} clients, {args.duration:.0f} s per server")
+        print(f"{'server':<20}{'req/s':>10}{'errors':>10}")
+        for name, command, overrides in variants:
+            rate, errors = measure(command, {**env, **overrides}, token, args.clients, args.duration)
+            print(f"{name:<20}{rate:>10.1f}{errors:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Gunicorn settings for the web tier.
+
+    gunicorn -c gunicorn_config.py wsgi:app
+
+Every setting can be overridden through the environment (see `.env.example`).
+The app is imported once in the master and the workers are forked from it,
+so `post_fork` drops every connection, pool and cache a worker would
+otherwise share with its siblings.
+"""
+import os
+import multiprocessing
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# "gthread" serves `threads` requests per worker; "gevent" needs the gevent
+# package and serves up to `worker_connections` per worker; "sync" serves one.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+preload_app = os.getenv("GUNICORN_PRELOAD_APP", "true").lower() == "true"
+# Recycle workers after roughly this many requests; the jitter keeps them
+# from all restarting at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# An empty GUNICORN_ACCESS_LOG turns the access log off.
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-") or None
+errorlog = "-"
+
+if worker_class == "gevent":
+    # Patch before the app (and with it socket, ssl and threading users) is preloaded.
+    from gevent import monkey
+    monkey.patch_all()
+
+def post_fork(server, worker):
+    """Give the new worker its own database, Redis and hashing resources instead of the master's."""
+    from api.extensions import db
+    from api.infra import db_pool, db_routing, response_cache
+    from api.infra.queues import reset_queues
+    from api.infra.redis import reset_redis
+    from api.services import blocklist, password, user_cache
+
+    if server.cfg.preload_app:
+        with server.app.wsgi().app_context():
+            # close=False leaves the master's connections open for the master;
+            # the worker starts with empty pools, the replica's included.
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+    reset_redis()
+    reset_queues()
+    blocklist.reset_cache()
+    user_cache.reset_cache()
+    response_cache.reset_stats()
+    db_pool.reset_stats()
+    db_routing.reset_cache()
+    password.reset()
@@ -6,6 +6,8 @@ from flask_jwt_extended import create_access_token
 
 from api import create_app
 from api.extensions import db
+from api.services import blocklist, user_cache
+from api.infra import db_pool, response_cache
 from api.models import UserModel, SubscriptionModel
 from api.models.subscription import BillingCycleEnum
 
@@ -36,12 +38,20 @@ def db_session(app):
 @pytest.fixture(autouse=True)
 def mock_auth_redis(mocker):
     """
-    Global fake Redis for JWT blocklist.
+    Global fake Redis for JWT blocklist, the user cache, the response cache
+    and replica routing.
     Prevents real Redis connections during tests.
     """
     fake_redis = fakeredis.FakeRedis()
     mocker.patch("api.services.blocklist.get_redis", return_value=fake_redis)
+    mocker.patch("api.services.user_cache.get_redis", return_value=fake_redis)
+    mocker.patch("api.infra.response_cache.get_redis", return_value=fake_redis)
+    mocker.patch("api.infra.db_routing.get_redis", return_value=fake_redis)
     yield fake_redis
+    blocklist.reset_cache()
+    user_cache.reset_cache()
+    response_cache.reset_stats()
+    db_pool.reset_stats()
 
 @pytest.fixture
 def sample_user(db_session):
@@ -0,0 +1,201 @@
+import sqlite3
+import datetime
+import pytest
+from decimal import Decimal
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+
+from api import create_app
+from api.extensions import db
+from api.infra import db_routing
+from api.models import SubscriptionModel, UserModel
+from api.models.enums import BillingCycleEnum
+from api.services import user as user_service
+
+@pytest.fixture
+def replica_paths(tmp_path):
+    return tmp_path / "primary.db", tmp_path / "replica.db"
+
+@pytest.fixture
+def replica_app(replica_paths):
+    primary, replica = replica_paths
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{primary}",
+        "SQLALCHEMY_REPLICA_URI": f"sqlite:///{replica}",
+        "JWT_SECRET_KEY": "test-secret",
+    })
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(bind=db.engines[db_routing.REPLICA_BIND])
+        yield app
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registered an (empty) metadata for the bind on the shared `db`;
+    # apps of other tests have no such bind.
+    db.metadatas.pop(db_routing.REPLICA_BIND, None)
+    db_routing.reset_cache()
+
+@pytest.fixture
+def replicate(replica_app, replica_paths):
+    """Copy the primary into the replica, as replication would."""
+    def _replicate():
+        primary, replica = (sqlite3.connect(path) for path in replica_paths)
+        with replica:
+            primary.backup(replica)
+        primary.close()
+        replica.close()
+    return _replicate
+
+@pytest.fixture
+def replica_user(replica_app, replicate):
+    user = UserModel(username="test", email="test@example.com", password="secret")
+    db.session.add(user)
+    db.session.commit()
+    user_id = user.id
+    # A new session, as the next request would get; this one has written.
+    db.session.remove()
+    replicate()
+    return user_id
+
+@pytest.fixture
+def auth_headers(replica_user):
+    return {"Authorization": f"Bearer {create_access_token(identity=str(replica_user))}"}
+
+def add_subscription(engine, user_id, name):
+    with engine.begin() as conn:
+        conn.execute(insert(SubscriptionModel), {
+            "user_id": user_id,
+            "name": name,
+            "price": Decimal("9.99"),
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": datetime.date(2025, 1, 15),
+            "category": "entertainment",
+        })
+
+def subscription_names(engine):
+    with engine.connect() as conn:
+        return set(conn.scalars(select(SubscriptionModel.name)))
+
+def listed_names(client, headers):
+    response = client.get("/subscriptions", headers=headers)
+    assert response.status_code == 200
+    return {subscription['name'] for subscription in response.json}
+
+def test_get_requests_read_from_replica(replica_app, replica_user, auth_headers):
+    add_subscription(db.engines[db_routing.REPLICA_BIND], replica_user, "Replica only")
+    add_subscription(db.engine, replica_user, "Primary only")
+
+    assert listed_names(replica_app.test_client(), auth_headers) == {"Replica only"}
+
+def test_writes_go_to_primary(replica_app, auth_headers):
+    response = replica_app.test_client().post("/subscriptions", headers=auth_headers, json={
+        "name": "Spotify",
+        "price": "19.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-02-01",
+        "category": "music",
+    })
+
+    assert response.status_code == 201
+    assert subscription_names(db.engine) == {"Spotify"}
+    assert subscription_names(db.engines[db_routing.REPLICA_BIND]) == set()
+
+def test_reads_right_after_a_write_use_primary(replica_app, replica_user, auth_headers, mock_auth_redis):
+    client = replica_app.test_client()
+    response = client.post("/subscriptions", headers=auth_headers, json={
+        "name": "Spotify",
+        "price": "19.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-02-01",
+        "category": "music",
+    })
+    assert response.status_code == 201
+
+    # The replica has not caught up yet, but the user sees their write.
+    assert listed_names(client, auth_headers) == {"Spotify"}
+
+    mock_auth_redis.delete(f"db:recent_write:{replica_user}")
+    assert listed_names(client, auth_headers) == set()
+
+def test_recent_write_marker_covers_the_lag_window(replica_app, replica_user, auth_headers, mock_auth_redis):
+    replica_app.test_client().post("/subscriptions", headers=auth_headers, json={
+        "name": "Spotify",
+        "price": "19.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-02-01",
+        "category": "music",
+    })
+
+    ttl = mock_auth_redis.ttl(f"db:recent_write:{replica_user}")
+    assert replica_app.config["REPLICA_MAX_LAG"] < ttl <= (
+        replica_app.config["REPLICA_MAX_LAG"] + replica_app.config["REPLICA_LAG_CHECK_INTERVAL"] + 1
+    )
+
+@pytest.mark.parametrize("lag", [60.0, None])
+def test_lagging_replica_falls_back_to_primary(replica_app, replica_user, auth_headers, mocker, lag):
+    mocker.patch.object(db_routing, "replica_lag", return_value=lag)
+    add_subscription(db.engine, replica_user, "Primary only")
+
+    assert listed_names(replica_app.test_client(), auth_headers) == {"Primary only"}
+
+def test_unreachable_replica_falls_back_to_primary(replica_app, replica_user, auth_headers, mocker):
+    mocker.patch.object(db_routing, "replica_lag", side_effect=OperationalError("SELECT 1", {}, Exception("down")))
+    add_subscription(db.engine, replica_user, "Primary only")
+
+    assert listed_names(replica_app.test_client(), auth_headers) == {"Primary only"}
+
+def test_replica_health_is_cached(replica_app, replica_user, auth_headers, mocker):
+    lag = mocker.patch.object(db_routing, "replica_lag", return_value=0.0)
+    client = replica_app.test_client()
+
+    listed_names(client, auth_headers)
+    listed_names(client, auth_headers)
+
+    lag.assert_called_once()
+
+def test_user_lookup_reads_primary(replica_app, replica_user):
+    # Registered after the last replication.
+    user = UserModel(username="new", email="new@example.com", password="secret")
+    db.session.add(user)
+    db.session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(identity=str(user.id))}"}
+    db.session.remove()
+
+    response = replica_app.test_client().get("/users/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json['email'] == "new@example.com"
+
+def test_scans_read_from_replica_inside_replica_reads(replica_app, replica_user):
+    db.session.add(UserModel(username="new", email="new@example.com", password="secret"))
+    db.session.commit()
+    db.session.remove()
+
+    with db_routing.replica_reads():
+        replica_ids = list(user_service.iter_user_ids())
+    primary_ids = list(user_service.iter_user_ids())
+
+    assert replica_ids == [replica_user]
+    assert len(primary_ids) == 2
+
+def test_reads_after_a_write_in_the_same_session_use_primary(replica_app, replica_user):
+    with db_routing.replica_reads():
+        db.session.add(UserModel(username="new", email="new@example.com", password="secret"))
+        db.session.flush()
+
+        assert len(list(user_service.iter_user_ids())) == 2
+    db.session.rollback()
+
+def test_pool_stats_report_primary_and_replica(replica_app, replica_user, auth_headers):
+    client = replica_app.test_client()
+    listed_names(client, auth_headers)
+
+    response = client.get("/db/pool-stats")
+
+    assert response.status_code == 200
+    assert set(response.json) == {"primary", db_routing.REPLICA_BIND}
+    assert response.json[db_routing.REPLICA_BIND]['checkouts'] >= 1
@@ -1,3 +1,6 @@
+import json
+import datetime
+
 from api.models import ReminderLogModel
 
 def test_get_reminder_logs_by_subscription(client, db_session, jwt, sample_subscription):
@@ -60,4 +63,40 @@ def test_delete_reminder_log_not_found(client, jwt):
     response = client.delete("/reminder_logs/999", headers={"Authorization": f"Bearer {jwt}"})
 
     assert response.status_code == 404
-    assert response.json['message'] == "Reminder log not found."
\ No newline at end of file
+    assert response.json['message'] == "Reminder log not found."
+
+def test_export_reminder_logs_ndjson(client, db_session, jwt, sample_user, subscription_factory, user_factory):
+    spotify = subscription_factory(user_id=sample_user.id, name="Spotify", next_payment_date=datetime.date(2025, 1, 5))
+    netflix = subscription_factory(user_id=sample_user.id, name="Netflix", next_payment_date=datetime.date(2025, 1, 1))
+    other = user_factory(email="other@example.com")
+    foreign = subscription_factory(user_id=other.id, name="Foreign", next_payment_date=datetime.date(2025, 1, 1))
+    db_session.add_all([
+        ReminderLogModel(message="Spotify 1", success=True, subscription_id=spotify.id),
+        ReminderLogModel(message="Netflix 1", success=False, subscription_id=netflix.id),
+        ReminderLogModel(message="Foreign 1", success=True, subscription_id=foreign.id),
+    ])
+    db_session.commit()
+
+    response = client.get("/reminder_logs/export", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [(row['subscription_name'], row['message'], row['success']) for row in rows] == [
+        ("Netflix", "Netflix 1", False),
+        ("Spotify", "Spotify 1", True),
+    ]
+    assert set(rows[0]) == {"id", "subscription_id", "subscription_name", "message", "success", "sent_at"}
+
+def test_export_reminder_logs_csv(client, db_session, jwt, sample_subscription):
+    db_session.add(ReminderLogModel(message="Sent", success=True, subscription_id=sample_subscription.id))
+    db_session.commit()
+
+    response = client.get("/reminder_logs/export?format=csv", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Disposition"] == 'attachment; filename="reminder_logs.csv"'
+    header, row = response.get_data(as_text=True).splitlines()
+    assert header == "id,subscription_id,subscription_name,message,success,sent_at"
+    assert row.startswith(f"1,{sample_subscription.id},Netflix,Sent,True,")
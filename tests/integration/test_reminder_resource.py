@@ -34,4 +34,22 @@ def test_reminders_upcoming_endpoint_empty(client, jwt):
     response = client.get("/reminders/upcoming?days=7", headers={"Authorization": f"Bearer {jwt}"})
 
     assert response.status_code == 200
-    assert response.json == []
\ No newline at end of file
+    assert response.json == []
+
+def test_reminders_upcoming_not_modified_until_subscription_created(client, jwt):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get("/reminders/upcoming?days=7", headers=headers).headers["ETag"]
+
+    not_modified = client.get("/reminders/upcoming?days=7", headers={**headers, "If-None-Match": etag})
+    client.post("/subscriptions", json={
+        "name": "Spotify",
+        "price": "9.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": (date.today() + timedelta(days=2)).isoformat(),
+        "category": "music",
+    }, headers=headers)
+    modified = client.get("/reminders/upcoming?days=7", headers={**headers, "If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+    assert [sub['name'] for sub in modified.json] == ["Spotify"]
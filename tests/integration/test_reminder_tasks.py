@@ -1,6 +1,6 @@
 import pytest
 import fakeredis
-from datetime import date
+from datetime import date, timedelta
 from rq import Queue
 
 from api.models import ReminderLogModel
@@ -35,21 +35,22 @@ def test_check_upcoming_payments_enqueues_job_per_subscription(
     per subscription with an upcoming payment.
     """
     user = user_factory(email="user@example.com")
+    today = date.today()
 
     sub1 = subscription_factory(
         user_id=user.id, 
-        next_payment_date=date(2025, 11, 10), 
+        next_payment_date=today + timedelta(days=1), 
         name="Hulu"
     )
     sub2 = subscription_factory(
         user_id=user.id, 
-        next_payment_date=date(2025, 11, 11), 
+        next_payment_date=today + timedelta(days=7), 
         name="Disney+"
     )
-
-    mocker.patch(
-        "api.tasks.reminder_tasks.subscription_service.get_subscriptions_due_in",
-        return_value=[sub1, sub2]
+    subscription_factory(
+        user_id=user.id, 
+        next_payment_date=today + timedelta(days=3), 
+        name="Netflix"
     )
 
     reminder_tasks.check_upcoming_payments()
@@ -105,4 +106,89 @@ def test_send_single_subscription_reminder_skips_when_subscription_not_found(
 
     mock_send.assert_not_called()
     logs = ReminderLogModel.query.all()
-    assert len(logs) == 0
\ No newline at end of file
+    assert len(logs) == 0
+
+def test_check_upcoming_payments_batch_mode_enqueues_job_per_chunk(
+    app,
+    app_ctx,
+    mock_reminder_queue,
+    user_factory,
+    subscription_factory
+):
+    """
+    Verifies that in batch fan-out mode `check_upcoming_payments` enqueues one
+    job per chunk of due subscription IDs instead of one job per subscription.
+    """
+    app.config['REMINDER_FANOUT_MODE'] = "batch"
+    app.config['REMINDER_BATCH_SIZE'] = 2
+
+    user = user_factory(email="user@example.com")
+    tomorrow = date.today() + timedelta(days=1)
+    subs = [
+        subscription_factory(user_id=user.id, next_payment_date=tomorrow, name=f"Sub {i}")
+        for i in range(5)
+    ]
+
+    reminder_tasks.check_upcoming_payments()
+
+    assert mock_reminder_queue.count == 3
+
+    jobs = mock_reminder_queue.jobs
+    assert all(job.func_name.endswith("send_subscription_reminders_batch") for job in jobs)
+    assert [job.args[0] for job in jobs] == [
+        [subs[0].id, subs[1].id],
+        [subs[2].id, subs[3].id],
+        [subs[4].id],
+    ]
+
+def test_send_subscription_reminders_batch_sends_emails_and_logs(
+    app_ctx,
+    user_factory,
+    subscription_factory,
+    mocker
+):
+    user = user_factory(email="user@example.com")
+    sub1 = subscription_factory(user_id=user.id, next_payment_date=date(2025, 11, 10), name="Hulu")
+    sub2 = subscription_factory(user_id=user.id, next_payment_date=date(2025, 11, 10), name="Disney+")
+
+    mock_send = mocker.patch(
+        "api.tasks.reminder_tasks.email_tasks.send_email_reminder"
+    )
+
+    reminder_tasks.send_subscription_reminders_batch([sub1.id, sub2.id, 999])
+
+    assert mock_send.call_count == 2
+    logs = ReminderLogModel.query.order_by(ReminderLogModel.subscription_id).all()
+    assert [log.subscription_id for log in logs] == [sub1.id, sub2.id]
+    assert all(log.success for log in logs)
+
+def test_send_subscription_reminders_batch_keeps_logs_when_job_raises_mid_batch(
+    app,
+    app_ctx,
+    user_factory,
+    subscription_factory,
+    mocker
+):
+    """
+    Verifies that reminders sent before an unexpected failure in the middle of
+    a batch are still logged: buffered rows are flushed while the exception
+    propagates, including rows flushed earlier by the size threshold.
+    """
+    app.config['REMINDER_LOG_FLUSH_SIZE'] = 2
+
+    user = user_factory(email="user@example.com")
+    subs = [
+        subscription_factory(user_id=user.id, next_payment_date=date(2025, 11, 10), name=f"Sub {i}")
+        for i in range(5)
+    ]
+
+    mocker.patch(
+        "api.tasks.reminder_tasks.email_tasks.send_email_reminder",
+        side_effect=[None, None, None, RuntimeError("Worker crashed"), None]
+    )
+
+    with pytest.raises(RuntimeError):
+        reminder_tasks.send_subscription_reminders_batch([sub.id for sub in subs])
+
+    logs = ReminderLogModel.query.order_by(ReminderLogModel.subscription_id).all()
+    assert [log.subscription_id for log in logs] == [subs[0].id, subs[1].id, subs[2].id]
@@ -0,0 +1,108 @@
+import pytest
+from datetime import date
+from flask_jwt_extended import create_access_token
+from redis.exceptions import ConnectionError
+
+@pytest.fixture
+def cache_enabled(app):
+    app.config['RESPONSE_CACHE_ENABLED'] = True
+    yield
+    app.config['RESPONSE_CACHE_ENABLED'] = False
+
+def _cached_keys(fake_redis):
+    return fake_redis.keys("cache:response:*")
+
+def test_response_cache_is_disabled_by_default(client, jwt, sample_subscription, mock_auth_redis):
+    response = client.get("/subscriptions", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert _cached_keys(mock_auth_redis) == []
+
+def test_cached_response_skips_view(client, jwt, sample_subscription, cache_enabled, mocker):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    first = client.get("/subscriptions?limit=1", headers=headers)
+    get_page = mocker.patch("api.resources.subscription.subscription_service.get_user_subscriptions_page")
+
+    second = client.get("/subscriptions?limit=1", headers=headers)
+
+    get_page.assert_not_called()
+    assert second.status_code == 200
+    assert second.json == first.json
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Content-Type"] == "application/json"
+    assert client.get("/cache/stats").json == {"hits": 1, "misses": 1, "stores": 1, "too_large": 0, "errors": 0}
+
+def test_cached_response_honors_if_none_match(client, jwt, sample_subscription, cache_enabled):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get("/stats/summary?month=2025-01", headers=headers).headers["ETag"]
+
+    response = client.get("/stats/summary?month=2025-01", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert client.get("/cache/stats").json['hits'] == 1
+
+@pytest.mark.parametrize("write", [
+    lambda client, headers, sub_id: client.post("/subscriptions", headers=headers, json={
+        "name": "Spotify",
+        "price": "9.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-01-20",
+        "category": "music",
+    }),
+    lambda client, headers, sub_id: client.put(f"/subscriptions/{sub_id}", headers=headers, json={"price": "39.99"}),
+    lambda client, headers, sub_id: client.delete(f"/subscriptions/{sub_id}", headers=headers),
+], ids=["create", "update", "delete"])
+def test_subscription_writes_invalidate_cached_responses(client, jwt, sample_subscription, cache_enabled, write):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    before = client.get("/stats/summary?month=2025-01", headers=headers).json
+
+    write(client, headers, sample_subscription.id)
+    after = client.get("/stats/summary?month=2025-01", headers=headers).json
+
+    assert after != before
+    assert client.get("/cache/stats").json['hits'] == 0
+
+def test_cache_is_keyed_by_user_and_args(client, jwt, sample_subscription, user_factory, cache_enabled):
+    other = user_factory(email="other@example.com")
+    other_jwt = create_access_token(identity=str(other.id))
+
+    client.get("/reminders/upcoming?days=7", headers={"Authorization": f"Bearer {jwt}"})
+    client.get("/reminders/upcoming?days=30", headers={"Authorization": f"Bearer {jwt}"})
+    response = client.get("/reminders/upcoming?days=7", headers={"Authorization": f"Bearer {other_jwt}"})
+
+    assert response.json == []
+    assert client.get("/cache/stats").json['misses'] == 3
+
+def test_lost_version_key_does_not_revive_entries(client, jwt, sample_subscription, cache_enabled, mock_auth_redis):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    client.get("/subscriptions", headers=headers)
+
+    mock_auth_redis.delete(*mock_auth_redis.keys("cache:version:*"))
+    client.get("/subscriptions", headers=headers)
+
+    assert client.get("/cache/stats").json['hits'] == 0
+
+def test_large_responses_are_not_stored(app, client, jwt, sample_subscription, cache_enabled, mock_auth_redis):
+    app.config['RESPONSE_CACHE_MAX_ENTRY_BYTES'] = 10
+
+    response = client.get("/subscriptions", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert _cached_keys(mock_auth_redis) == []
+    assert client.get("/cache/stats").json['too_large'] == 1
+
+def test_entries_expire_after_ttl(app, client, jwt, sample_subscription, cache_enabled, mock_auth_redis):
+    app.config['RESPONSE_CACHE_TTL'] = 30
+
+    client.get("/subscriptions", headers={"Authorization": f"Bearer {jwt}"})
+
+    [key] = _cached_keys(mock_auth_redis)
+    assert 0 < mock_auth_redis.ttl(key) <= 30
+
+def test_redis_failure_falls_back_to_view(client, jwt, sample_subscription, cache_enabled, mocker):
+    mocker.patch("api.infra.response_cache.get_redis", side_effect=ConnectionError("down"))
+
+    response = client.get(f"/stats/summary?month={date.today():%Y-%m}", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert client.get("/cache/stats").json['errors'] == 1
@@ -0,0 +1,28 @@
+from datetime import date
+from decimal import Decimal
+
+from api.models import MonthlySpendRollupModel
+
+def test_rollups_rebuild_command(app, sample_user, subscription_factory):
+    subscription_factory(user_id=sample_user.id, next_payment_date=date(2025, 10, 1), price=Decimal("9.99"))
+
+    result = app.test_cli_runner().invoke(args=["rollups", "rebuild"])
+
+    assert result.exit_code == 0
+    assert "Rebuilt 1 rollup row(s)." in result.output
+    assert MonthlySpendRollupModel.query.count() == 1
+
+def test_rollups_check_command_reports_consistent(app, sample_user):
+    result = app.test_cli_runner().invoke(args=["rollups", "check"])
+
+    assert result.exit_code == 0
+    assert "Rollups are consistent." in result.output
+
+def test_rollups_check_command_fails_on_drift(app, sample_user, subscription_factory):
+    subscription_factory(user_id=sample_user.id, next_payment_date=date(2025, 10, 1), price=Decimal("9.99"))
+
+    result = app.test_cli_runner().invoke(args=["rollups", "check"])
+
+    assert result.exit_code != 0
+    assert "month=2025-10" in result.output
+    assert "Found 1 inconsistent rollup(s)." in result.output
@@ -86,4 +86,24 @@ def test_stats_summary_validates_month_format(client, jwt):
     assert response.status_code == 422
     data = response.get_json()
     assert "month" in data['errors']['query']
-    assert data['errors']['query']['month'] == ["Month must be between 01 and 12."]
\ No newline at end of file
+    assert data['errors']['query']['month'] == ["Month must be between 01 and 12."]
+
+def test_stats_summary_not_modified(client, jwt, sample_subscription, mocker):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get("/stats/summary?month=2025-11", headers=headers).headers["ETag"]
+    get_summary = mocker.patch("api.resources.statistic.subscription_service.get_monthly_summary")
+
+    response = client.get("/stats/summary?month=2025-11", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    get_summary.assert_not_called()
+
+def test_stats_summary_etag_depends_on_month(client, jwt):
+    headers = {"Authorization": f"Bearer {jwt}"}
+
+    november = client.get("/stats/summary?month=2025-11", headers=headers).headers["ETag"]
+    current = client.get("/stats/summary", headers=headers).headers["ETag"]
+    current_explicit = client.get(f"/stats/summary?month={date.today():%Y-%m}", headers=headers).headers["ETag"]
+
+    assert november != current
+    assert current == current_explicit
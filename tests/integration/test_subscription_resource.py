@@ -1,3 +1,5 @@
+import json
+import pytest
 import datetime
 from decimal import Decimal
 
@@ -125,4 +127,333 @@ def test_delete_subscription_not_found(client, jwt):
     response = client.delete("/subscriptions/999", headers={"Authorization": f"Bearer {jwt}"})
 
     assert response.status_code == 404
-    assert response.json['message'] == "Subscription not found."
\ No newline at end of file
+    assert response.json['message'] == "Subscription not found."
+
+def _seed_subscriptions(subscription_factory, user_id, count):
+    # Two subscriptions per payment date, so pages split inside a date.
+    return [
+        subscription_factory(
+            user_id=user_id,
+            name=f"Sub {i}",
+            next_payment_date=datetime.date(2025, 1, 1) + datetime.timedelta(days=i // 2),
+        )
+        for i in range(count)
+    ]
+
+def test_get_user_subscriptions_paginates_with_cursor(client, jwt, sample_user, subscription_factory):
+    subs = _seed_subscriptions(subscription_factory, sample_user.id, 5)
+    headers = {"Authorization": f"Bearer {jwt}"}
+
+    names = []
+    url = "/subscriptions?limit=2"
+    pages = 0
+    while url:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        names.extend(sub['name'] for sub in response.json)
+        pages += 1
+
+        link = response.headers.get("Link")
+        if link is None:
+            assert "X-Next-Cursor" not in response.headers
+            url = None
+        else:
+            assert response.headers["X-Next-Cursor"] in link
+            assert link.endswith('>; rel="next"')
+            url = link[1:link.index(">")]
+
+    assert pages == 3
+    assert names == [sub.name for sub in subs]
+
+def test_get_user_subscriptions_cursor_parameter(client, jwt, sample_user, subscription_factory):
+    _seed_subscriptions(subscription_factory, sample_user.id, 3)
+    headers = {"Authorization": f"Bearer {jwt}"}
+
+    first = client.get("/subscriptions?limit=2", headers=headers)
+    second = client.get(f"/subscriptions?limit=2&cursor={first.headers['X-Next-Cursor']}", headers=headers)
+
+    assert [sub['name'] for sub in second.json] == ["Sub 2"]
+    assert "X-Next-Cursor" not in second.headers
+
+def test_get_user_subscriptions_sparse_fields(client, jwt, sample_subscription):
+    response = client.get(
+        "/subscriptions?fields=id,name,price,billing_cycle",
+        headers={"Authorization": f"Bearer {jwt}"}
+    )
+
+    assert response.status_code == 200
+    assert response.json == [{
+        "id": sample_subscription.id,
+        "name": "Netflix",
+        "price": "29.99",
+        "billing_cycle": "monthly",
+    }]
+
+def test_get_user_subscriptions_sparse_fields_without_billing_cycle(client, jwt, sample_subscription):
+    response = client.get("/subscriptions?fields=name", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.json == [{"name": "Netflix"}]
+
+def test_get_user_subscriptions_rejects_unknown_field(client, jwt):
+    response = client.get("/subscriptions?fields=name,password", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 422
+    assert "fields" in response.json['errors']['query']
+
+def test_get_user_subscriptions_rejects_invalid_cursor(client, jwt):
+    response = client.get("/subscriptions?cursor=not-a-cursor", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 422
+    assert "cursor" in response.json['errors']['query']
+
+def test_get_user_subscriptions_rejects_limit_out_of_range(client, jwt):
+    response = client.get("/subscriptions?limit=0", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 422
+
+def test_subscriptions_pagination_is_documented(client):
+    spec = client.get("/openapi.json").json
+
+    operation = spec['paths']['/subscriptions']['get']
+    assert {param['name'] for param in operation['parameters']} >= {"limit", "cursor", "fields"}
+    assert set(operation['responses']['200']['headers']) == {"X-Next-Cursor", "Link", "ETag", "Cache-Control"}
+
+def _seed_filterable_subscriptions(subscription_factory, user_id):
+    rows = [
+        ("Netflix", "15.99", BillingCycleEnum.monthly, "entertainment", 3),
+        ("Spotify", "9.99", BillingCycleEnum.monthly, "music", 1),
+        ("Tidal", "99.00", BillingCycleEnum.yearly, "music", 10),
+        ("Gym", "25.00", BillingCycleEnum.monthly, "health", 5),
+        ("Newspaper", "4.50", BillingCycleEnum.weekly, "news", 2),
+    ]
+    for name, price, billing_cycle, category, day in rows:
+        subscription_factory(
+            user_id=user_id,
+            name=name,
+            price=Decimal(price),
+            billing_cycle=billing_cycle,
+            category=category,
+            next_payment_date=datetime.date(2025, 1, day),
+        )
+
+@pytest.mark.parametrize("query, expected", [
+    ("category=music", ["Spotify", "Tidal"]),
+    ("billing_cycle=monthly", ["Spotify", "Netflix", "Gym"]),
+    ("min_price=10&max_price=25", ["Netflix", "Gym"]),
+    ("due_after=2025-01-02&due_before=2025-01-05", ["Newspaper", "Netflix", "Gym"]),
+    ("category=music&billing_cycle=yearly", ["Tidal"]),
+    ("sort=name", ["Gym", "Netflix", "Newspaper", "Spotify", "Tidal"]),
+    ("sort=-price", ["Tidal", "Gym", "Netflix", "Spotify", "Newspaper"]),
+    ("sort=-next_payment_date&max_price=20", ["Netflix", "Newspaper", "Spotify"]),
+])
+def test_get_user_subscriptions_filters_and_sorts(client, jwt, sample_user, subscription_factory, query, expected):
+    _seed_filterable_subscriptions(subscription_factory, sample_user.id)
+
+    response = client.get(f"/subscriptions?{query}", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert [sub['name'] for sub in response.json] == expected
+
+@pytest.mark.parametrize("sort", ["name", "-name", "price", "-price", "-next_payment_date"])
+def test_get_user_subscriptions_paginates_sorted_results(client, jwt, sample_user, subscription_factory, sort):
+    _seed_filterable_subscriptions(subscription_factory, sample_user.id)
+    headers = {"Authorization": f"Bearer {jwt}"}
+    expected = [sub['name'] for sub in client.get(f"/subscriptions?sort={sort}", headers=headers).json]
+
+    names = []
+    url = f"/subscriptions?sort={sort}&limit=2"
+    while url:
+        response = client.get(url, headers=headers)
+        names.extend(sub['name'] for sub in response.json)
+        link = response.headers.get("Link")
+        url = link[1:link.index(">")] if link else None
+
+    assert names == expected
+
+def test_get_user_subscriptions_rejects_cursor_from_another_sort(client, jwt, sample_user, subscription_factory):
+    _seed_subscriptions(subscription_factory, sample_user.id, 3)
+    headers = {"Authorization": f"Bearer {jwt}"}
+
+    first = client.get("/subscriptions?limit=2&sort=name", headers=headers)
+    response = client.get(f"/subscriptions?limit=2&sort=price&cursor={first.headers['X-Next-Cursor']}", headers=headers)
+
+    assert response.status_code == 422
+    assert "cursor" in response.json['errors']['query']
+
+@pytest.mark.parametrize("query, field", [
+    ("sort=category", "sort"),
+    ("billing_cycle=daily", "billing_cycle"),
+    ("min_price=abc", "min_price"),
+    ("min_price=20&max_price=10", "min_price"),
+    ("due_after=2025-02-01&due_before=2025-01-01", "due_after"),
+])
+def test_get_user_subscriptions_rejects_invalid_filters(client, jwt, query, field):
+    response = client.get(f"/subscriptions?{query}", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 422
+    assert field in response.json['errors']['query']
+
+def test_get_user_subscriptions_sets_weak_etag(client, jwt, sample_subscription):
+    response = client.get("/subscriptions", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+def test_get_user_subscriptions_not_modified_skips_query(client, jwt, sample_subscription, mocker):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get("/subscriptions", headers=headers).headers["ETag"]
+    get_page = mocker.patch("api.resources.subscription.subscription_service.get_user_subscriptions_page")
+
+    response = client.get("/subscriptions", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    get_page.assert_not_called()
+
+def test_get_user_subscriptions_etag_changes_on_write(client, jwt, sample_subscription):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get("/subscriptions", headers=headers).headers["ETag"]
+
+    client.put(f"/subscriptions/{sample_subscription.id}", json={"price": "39.99"}, headers=headers)
+    response = client.get("/subscriptions", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json[0]['price'] == "39.99"
+
+def test_get_subscription_not_modified(client, jwt, sample_subscription):
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get(f"/subscriptions/{sample_subscription.id}", headers=headers).headers["ETag"]
+
+    response = client.get(f"/subscriptions/{sample_subscription.id}", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+
+def test_get_subscription_etag_changes_on_delete(client, jwt, sample_user, sample_subscription, subscription_factory):
+    other = subscription_factory(user_id=sample_user.id, name="Other", next_payment_date=datetime.date(2025, 2, 1))
+    headers = {"Authorization": f"Bearer {jwt}"}
+    etag = client.get(f"/subscriptions/{sample_subscription.id}", headers=headers).headers["ETag"]
+
+    client.delete(f"/subscriptions/{other.id}", headers=headers)
+    response = client.get(f"/subscriptions/{sample_subscription.id}", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+
+IMPORT_CSV = (
+    "name,price,billing_cycle,next_payment_date,category\n"
+    "Spotify,9.99,monthly,2025-01-05,music\n"
+    "Netflix,15.99,monthly,2025-01-06,entertainment\n"
+    "Tidal,abc,monthly,2025-01-07,music\n"
+)
+
+def test_import_subscriptions_json_array(client, jwt):
+    response = client.post("/subscriptions/import", headers={"Authorization": f"Bearer {jwt}"}, json=[
+        {"name": "Spotify", "price": "9.99", "billing_cycle": "monthly", "next_payment_date": "2025-01-05", "category": "music"},
+        {"name": "Tidal", "price": "9.99", "billing_cycle": "daily", "next_payment_date": "2025-01-05", "category": "music"},
+    ])
+
+    assert response.status_code == 200
+    assert response.json['created'] == 1
+    assert response.json['failed'] == 1
+    assert response.json['errors'][0]['row'] == 2
+    assert "billing_cycle" in response.json['errors'][0]['errors']
+
+def test_import_subscriptions_csv(client, jwt, sample_subscription):
+    response = client.post(
+        "/subscriptions/import",
+        headers={"Authorization": f"Bearer {jwt}", "Content-Type": "text/csv"},
+        data=IMPORT_CSV,
+    )
+
+    assert response.status_code == 200
+    assert response.json['created'] == 1
+    assert [error['row'] for error in response.json['errors']] == [2, 3]
+    assert [sub['name'] for sub in client.get("/subscriptions?sort=name", headers={"Authorization": f"Bearer {jwt}"}).json] == [
+        "Netflix", "Spotify"
+    ]
+
+def test_import_subscriptions_ndjson(client, jwt):
+    body = (
+        '{"name": "Spotify", "price": "9.99", "billing_cycle": "monthly", "next_payment_date": "2025-01-05", "category": "music"}\n'
+        "not json\n"
+    )
+
+    response = client.post(
+        "/subscriptions/import",
+        headers={"Authorization": f"Bearer {jwt}", "Content-Type": "application/x-ndjson"},
+        data=body,
+    )
+
+    assert response.json == {
+        "created": 1,
+        "failed": 1,
+        "errors": [{"row": 2, "errors": {"_schema": ["Invalid input type."]}}],
+    }
+
+def test_import_subscriptions_reports_body_that_is_not_utf8(client, jwt):
+    response = client.post(
+        "/subscriptions/import",
+        headers={"Authorization": f"Bearer {jwt}", "Content-Type": "application/x-ndjson"},
+        data=b'{"name": "Caf\xe9", "price": "9.99"}\n',
+    )
+
+    assert response.status_code == 200
+    assert response.json['created'] == 0
+    assert response.json['errors'][0]['row'] == 1
+
+def test_import_subscriptions_rejects_json_object(client, jwt):
+    response = client.post("/subscriptions/import", headers={"Authorization": f"Bearer {jwt}"}, json={"name": "Spotify"})
+
+    assert response.status_code == 400
+
+def test_import_subscriptions_rejects_unsupported_content_type(client, jwt):
+    response = client.post(
+        "/subscriptions/import",
+        headers={"Authorization": f"Bearer {jwt}", "Content-Type": "text/plain"},
+        data="Spotify",
+    )
+
+    assert response.status_code == 415
+
+def test_import_subscriptions_requires_auth(client):
+    response = client.post("/subscriptions/import", json=[])
+
+    assert response.status_code == 401
+
+def test_export_subscriptions_ndjson(client, jwt, sample_user, subscription_factory, user_factory):
+    _seed_subscriptions(subscription_factory, sample_user.id, 3)
+    other = user_factory(email="other@example.com")
+    subscription_factory(user_id=other.id, name="Foreign", next_payment_date=datetime.date(2025, 1, 1))
+
+    response = client.get("/subscriptions/export", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.headers["Content-Disposition"] == 'attachment; filename="subscriptions.ndjson"'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['name'] for row in rows] == ["Sub 0", "Sub 1", "Sub 2"]
+    assert rows[0]['price'] == "29.99"
+    assert rows[0]['billing_cycle'] == "monthly"
+    assert rows[0]['next_payment_date'] == "2025-01-01"
+
+def test_export_subscriptions_csv(client, jwt, sample_subscription):
+    response = client.get("/subscriptions/export?format=csv", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.mimetype == "text/csv"
+    header, row = response.get_data(as_text=True).splitlines()
+    assert header == "id,user_id,name,price,billing_cycle,next_payment_date,category,created_at,updated_at"
+    assert row.startswith(f"{sample_subscription.id},{sample_subscription.user_id},Netflix,29.99,monthly,2025-01-15,entertainment,")
+
+def test_export_subscriptions_empty_csv_has_header(client, jwt):
+    response = client.get("/subscriptions/export?format=csv", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.get_data(as_text=True).splitlines() == [
+        "id,user_id,name,price,billing_cycle,next_payment_date,category,created_at,updated_at"
+    ]
+
+def test_export_subscriptions_rejects_unknown_format(client, jwt):
+    response = client.get("/subscriptions/export?format=xml", headers={"Authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == 422
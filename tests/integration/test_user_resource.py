@@ -1,6 +1,11 @@
 import pytest
 from flask_jwt_extended import create_access_token
 from datetime import timedelta
+from sqlalchemy import event
+
+from api.extensions import db
+from api.models import UserModel
+from api.services import password as password_service
 
 @pytest.fixture
 def mock_email_queue(mocker):
@@ -86,6 +91,21 @@ def test_login_user(client, create_user_details):
     assert response.status_code == 200
     assert response.json['access_token']
 
+def test_login_upgrades_outdated_password_hash(client, app, create_user_details, monkeypatch):
+    _, email, password = create_user_details
+    monkeypatch.setattr(password_service, "PBKDF2_ROUNDS", 1000)
+    password_service.reset()
+
+    response = client.post(
+        "/login",
+        json={"email": email, "password": password},
+    )
+    password_service.reset()
+
+    assert response.status_code == 200
+    user = UserModel.query.filter_by(email=email).first()
+    assert user.password.startswith("$pbkdf2-sha256$1000$")
+
 def test_login_user_bad_password(client, create_user_details):
     _, email, _ = create_user_details
     response = client.post(
@@ -131,6 +151,45 @@ def test_logout_user_twice(client, create_user_jwts):
         "error": "token_revoked",
     }
 
+def test_logout_all_revokes_every_session(client, create_user_details, create_user_jwts):
+    _, email, password = create_user_details
+    other_access, other_refresh = client.post(
+        "/login",
+        json={"email": email, "password": password},
+    ).json.values()
+
+    response = client.post(
+        "/logout/all",
+        headers={"Authorization": f"Bearer {create_user_jwts[1]}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json['message'] == "Successfully logged out on all devices."
+    for path, token in (("/users/me", create_user_jwts[0]), ("/users/me", other_access), ("/refresh", other_refresh)):
+        method = client.get if path == "/users/me" else client.post
+        response = method(path, headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+        assert response.json['error'] == "token_revoked"
+
+def test_login_right_after_logout_all_is_not_revoked(client, create_user_details, create_user_jwts):
+    _, email, password = create_user_details
+    client.post("/logout/all", headers={"Authorization": f"Bearer {create_user_jwts[1]}"})
+
+    # Issued within the same second as the revocation in practically every run.
+    response = client.post("/login", json={"email": email, "password": password})
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {response.json['access_token']}"})
+
+    assert response.status_code == 200
+
+def test_logout_all_requires_refresh_token(client, create_user_jwts):
+    response = client.post(
+        "/logout/all",
+        headers={"Authorization": f"Bearer {create_user_jwts[0]}"},
+    )
+
+    assert response.status_code == 401
+    assert response.json['error'] == "invalid_token"
+
 def test_logout_user_no_token(client):
     response = client.post(
         "/logout",
@@ -184,6 +243,35 @@ def test_get_users_me_returns_authenticated_user_profile(
     assert "email" in response.json
     assert "created_at" in response.json
     
+def test_get_users_me_is_served_from_cache(client, create_user_jwts):
+    headers = {"Authorization": f"Bearer {create_user_jwts[0]}"}
+    first = client.get("/users/me", headers=headers)
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "after_cursor_execute", capture)
+    try:
+        response = client.get("/users/me", headers=headers)
+    finally:
+        event.remove(db.engine, "after_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert response.json == first.json
+    assert statements == []
+
+def test_token_of_deleted_user_is_rejected(client, create_user_jwts):
+    headers = {"Authorization": f"Bearer {create_user_jwts[0]}"}
+    user_id = client.get("/users/me", headers=headers).json['id']
+
+    assert client.delete(f"/users/{user_id}").status_code == 200
+
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json == {"message": "User not found.", "error": "user_not_found"}
+
 def test_get_users_me_requires_authentication(client):
     response = client.get("/users/me")
 
@@ -260,4 +348,18 @@ def test_fresh_protected_with_fresh_token(client, create_user_jwts):
     )
 
     assert response.status_code == 200
-    assert response.json['message'] == "This is a protected endpoint. You used a fresh token to access it."
\ No newline at end of file
+    assert response.json['message'] == "This is a protected endpoint. You used a fresh token to access it."
+
+def test_redis_pool_stats(client):
+    response = client.get("/redis/pool-stats")
+
+    assert response.status_code == 200
+    assert set(response.json) == {"max_connections", "created", "in_use", "idle"}
+
+def test_db_pool_stats(client):
+    response = client.get("/db/pool-stats")
+
+    assert response.status_code == 200
+    assert set(response.json) == {"primary"}
+    assert response.json['primary']['pool'] == "StaticPool"
+    assert response.json['primary']['checkouts'] >= 1
@@ -0,0 +1,183 @@
+"""
+EXPLAIN-based guard against service queries regressing to full table scans.
+
+Every statement a service function executes is captured and re-run through
+SQLite's `EXPLAIN QUERY PLAN` on the seeded schema. A plan step that reads
+`subscriptions` or `reminder_logs` with a plain `SCAN` (i.e. without
+searching an index), or that walks a rowid range of the table (the whole
+table from a keyset cursor on, filtering rows as it goes), fails the test.
+"""
+import re
+import pytest
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from sqlalchemy import event, insert, text
+
+from api.extensions import db
+from api.models import SubscriptionModel, ReminderLogModel
+from api.models.enums import BillingCycleEnum
+from api.services import subscription as subscription_service
+from api.services import reminder_log as reminder_log_service
+
+GUARDED_TABLES = ("subscriptions", "reminder_logs")
+
+@contextmanager
+def captured_statements():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+def plan_details(statement, parameters) -> list[str]:
+    with db.engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [step[-1] for step in plan]
+
+def full_scans(statements) -> list[str]:
+    """Return plan steps that scan a guarded table without an index or walk a rowid range of it."""
+    offenders = []
+    for statement, parameters in statements:
+        for detail in plan_details(statement, parameters):
+            for table in GUARDED_TABLES:
+                if re.match(rf"SCAN {table}\b", detail) or re.match(
+                    rf"SEARCH {table} USING INTEGER PRIMARY KEY \(rowid[<>]", detail
+                ):
+                    offenders.append(f"{detail}  <-  {statement}")
+    return offenders
+
+@pytest.fixture
+def seeded_schema(db_session, user_factory):
+    """Seed enough rows that the planner prefers indexes and collect statistics."""
+    users = [user_factory(email=f"user{i}@example.com") for i in range(5)]
+    today = date.today()
+
+    db_session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": users[i % len(users)].id,
+            "name": f"Sub {i}",
+            "price": Decimal("9.99") + i % 40,
+            "billing_cycle": list(BillingCycleEnum)[i % 3],
+            "next_payment_date": today + timedelta(days=i % 60),
+            "category": f"category {i % 8}",
+        }
+        for i in range(500)
+    ])
+    db_session.execute(insert(ReminderLogModel), [
+        {"subscription_id": i % 500 + 1, "message": "Sent", "success": True}
+        for i in range(1000)
+    ])
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    return users[0]
+
+@pytest.mark.parametrize("call", [
+    lambda user: subscription_service.get_subscriptions_due_in([1, 7]),
+    lambda user: list(subscription_service.iter_subscription_ids_due_in([1, 7], page_size=50)),
+    lambda user: subscription_service.get_user_upcoming_subscriptions(user.id),
+    lambda user: subscription_service.get_user_upcoming_within(user.id, 7),
+    lambda user: subscription_service.get_monthly_summary(user.id, date.today().strftime("%Y-%m")),
+    lambda user: subscription_service.get_user_subscriptions_page(user.id, 20, after=(date.today(), 1)),
+    lambda user: reminder_log_service.get_user_reminder_logs_by_subscription(1, user.id),
+    lambda user: list(subscription_service.iter_user_subscriptions_for_export(user.id)),
+    lambda user: list(reminder_log_service.iter_user_reminder_logs_for_export(user.id)),
+], ids=[
+    "get_subscriptions_due_in",
+    "iter_subscription_ids_due_in",
+    "get_user_upcoming_subscriptions",
+    "get_user_upcoming_within",
+    "get_monthly_summary",
+    "get_user_subscriptions_page",
+    "get_user_reminder_logs_by_subscription",
+    "iter_user_subscriptions_for_export",
+    "iter_user_reminder_logs_for_export",
+])
+def test_service_queries_use_indexes(seeded_schema, call):
+    with captured_statements() as statements:
+        call(seeded_schema)
+
+    assert statements
+    assert full_scans(statements) == []
+
+def test_subscription_pages_are_read_in_index_order(seeded_schema):
+    with captured_statements() as statements:
+        subscription_service.get_user_subscriptions_page(seeded_schema.id, 20, after=(date.today(), 1))
+
+    details = plan_details(*statements[0])
+    assert not any("TEMP B-TREE" in detail for detail in details), details
+
+def test_due_in_scan_pages_the_date_id_index(seeded_schema):
+    with captured_statements() as statements:
+        list(subscription_service.iter_subscription_ids_due_in([1, 7], page_size=5))
+
+    assert len(statements) > 2
+    for statement, parameters in statements:
+        details = plan_details(statement, parameters)
+        assert any("ix_subscriptions_next_payment_date_id" in detail for detail in details), details
+        assert not any("USE TEMP B-TREE FOR ORDER BY" in detail for detail in details), details
+
+LISTING_CASES = {
+    "sort by next_payment_date": ({}, "next_payment_date"),
+    "sort by -next_payment_date": ({}, "-next_payment_date"),
+    "sort by name": ({}, "name"),
+    "sort by -name": ({}, "-name"),
+    "sort by price": ({}, "price"),
+    "sort by -price": ({}, "-price"),
+    "category": ({"category": "category 1"}, "next_payment_date"),
+    "billing_cycle": ({"billing_cycle": BillingCycleEnum.yearly}, "next_payment_date"),
+    "price range": ({"min_price": Decimal("10"), "max_price": Decimal("20")}, "price"),
+    "due date range": ({"due_after": date.today(), "due_before": date.today() + timedelta(days=7)}, "next_payment_date"),
+    "category and due date range": ({"category": "category 1", "due_before": date.today() + timedelta(days=7)}, "next_payment_date"),
+}
+
+def first_key(sort: str):
+    values = {"next_payment_date": date.today(), "name": "Sub 1", "price": Decimal("10")}
+    return (values[sort.lstrip("-")], 1)
+
+def listing_plan(user_id: int, filters: dict, sort: str):
+    """Run the first and a later page of a listing; return the statements and their plan steps."""
+    with captured_statements() as statements:
+        subscription_service.get_user_subscriptions_page(user_id, 20, after=None, filters=filters, sort=sort)
+        subscription_service.get_user_subscriptions_page(user_id, 20, after=first_key(sort), filters=filters, sort=sort)
+
+    details = []
+    for statement, parameters in statements:
+        details.extend(plan_details(statement, parameters))
+    return statements, details
+
+@pytest.mark.parametrize("filters, sort", LISTING_CASES.values(), ids=LISTING_CASES.keys())
+def test_subscription_listing_filters_and_sorts_use_indexes(seeded_schema, filters, sort):
+    statements, details = listing_plan(seeded_schema.id, filters, sort)
+
+    assert full_scans(statements) == []
+    if not filters:
+        # Every sort order is read straight off an index, forwards or backwards.
+        assert not any("TEMP B-TREE" in detail for detail in details), details
+
+@pytest.mark.parametrize("filters, sort, index", [
+    ({"category": "category 1"}, "next_payment_date", "ix_subscriptions_user_id_category_next_payment_date"),
+    ({}, "price", "ix_subscriptions_user_id_price"),
+    ({"min_price": Decimal("10"), "max_price": Decimal("20")}, "-price", "ix_subscriptions_user_id_price"),
+], ids=["category", "sort by price", "price range"])
+def test_subscription_listing_uses_dedicated_index(seeded_schema, filters, sort, index):
+    _, details = listing_plan(seeded_schema.id, filters, sort)
+
+    assert all(index in detail for detail in details if "subscriptions" in detail), details
+
+@pytest.mark.parametrize("call", [
+    lambda user: list(subscription_service.iter_user_subscriptions_for_export(user.id)),
+    lambda user: list(reminder_log_service.iter_user_reminder_logs_for_export(user.id)),
+], ids=["subscriptions", "reminder_logs"])
+def test_exports_are_read_in_index_order(seeded_schema, call):
+    with captured_statements() as statements:
+        call(seeded_schema)
+
+    details = plan_details(*statements[0])
+    assert not any("TEMP B-TREE" in detail for detail in details), details
@@ -68,4 +68,18 @@ def test_delete_reminder_log_not_found(db_session):
     with pytest.raises(ReminderLogNotFoundError) as exc_info:
         service.delete_reminder_log(999, 1)
 
-    assert str(exc_info.value) == "Reminder log not found."
\ No newline at end of file
+    assert str(exc_info.value) == "Reminder log not found."
+
+def test_create_reminder_logs_bulk_inserts(sample_subscription):
+    service.create_reminder_logs([
+        {"subscription_id": sample_subscription.id, "message": "Sent", "success": True},
+        {"subscription_id": sample_subscription.id, "message": "Failed", "success": False},
+    ])
+
+    logs = ReminderLogModel.query.filter_by(subscription_id=sample_subscription.id).all()
+    assert sorted(log.message for log in logs) == ["Failed", "Sent"]
+
+def test_create_reminder_logs_with_no_rows_is_noop(db_session):
+    service.create_reminder_logs([])
+
+    assert ReminderLogModel.query.count() == 0
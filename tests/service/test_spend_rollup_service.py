@@ -0,0 +1,140 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import event, insert
+
+from api.extensions import db
+
+from api.models import MonthlySpendRollupModel
+from api.models.enums import BillingCycleEnum
+from api.services import spend_rollup
+from api.services import subscription as subscription_service
+
+def _create(user_id, name="Netflix", price="10.00", category="entertainment", day=date(2025, 10, 5)):
+    return subscription_service.create_subscription({
+        "name": name,
+        "price": Decimal(price),
+        "billing_cycle": BillingCycleEnum.monthly,
+        "next_payment_date": day,
+        "category": category,
+    }, user_id)
+
+def _rollups(user_id):
+    return {
+        (row.month, row.category): (row.total, row.subscription_count)
+        for row in MonthlySpendRollupModel.query.filter_by(user_id=user_id)
+    }
+
+def test_create_subscription_updates_rollup(sample_user):
+    _create(sample_user.id, name="Netflix", price="10.00")
+    _create(sample_user.id, name="Hulu", price="5.50")
+    _create(sample_user.id, name="VPN", price="3.00", category=None)
+
+    assert _rollups(sample_user.id) == {
+        ("2025-10", "entertainment"): (Decimal("15.50"), 2),
+        ("2025-10", "uncategorized"): (Decimal("3.00"), 1),
+    }
+
+def test_update_subscription_price_change_adjusts_rollup(sample_user):
+    sub = _create(sample_user.id, price="10.00")
+
+    subscription_service.update_subscription(sub.id, sample_user.id, {"price": Decimal("12.00")})
+
+    assert _rollups(sample_user.id) == {("2025-10", "entertainment"): (Decimal("12.00"), 1)}
+
+def test_update_subscription_moves_between_months_and_categories(sample_user):
+    sub = _create(sample_user.id, price="10.00")
+    _create(sample_user.id, name="Hulu", price="5.00")
+
+    subscription_service.update_subscription(sub.id, sample_user.id, {
+        "next_payment_date": date(2025, 11, 5),
+        "category": "video",
+    })
+
+    assert _rollups(sample_user.id) == {
+        ("2025-10", "entertainment"): (Decimal("5.00"), 1),
+        ("2025-11", "video"): (Decimal("10.00"), 1),
+    }
+
+def test_delete_subscription_removes_empty_rollup(sample_user):
+    sub = _create(sample_user.id)
+
+    subscription_service.delete_subscription(sub.id, sample_user.id)
+
+    assert _rollups(sample_user.id) == {}
+
+def test_rebuild_rollups_backfills_from_subscriptions(sample_user, subscription_factory):
+    subscription_factory(user_id=sample_user.id, name="A", next_payment_date=date(2025, 10, 1), price=Decimal("1.00"))
+    subscription_factory(user_id=sample_user.id, name="B", next_payment_date=date(2025, 10, 20), price=Decimal("2.00"))
+    subscription_factory(user_id=sample_user.id, name="C", next_payment_date=date(2025, 11, 1), price=Decimal("4.00"))
+
+    written = spend_rollup.rebuild_rollups()
+
+    assert written == 2
+    assert _rollups(sample_user.id) == {
+        ("2025-10", "entertainment"): (Decimal("3.00"), 2),
+        ("2025-11", "entertainment"): (Decimal("4.00"), 1),
+    }
+    assert spend_rollup.find_rollup_inconsistencies() == []
+
+def test_find_rollup_inconsistencies_reports_drift(sample_user, subscription_factory):
+    _create(sample_user.id, price="10.00")
+    # Written behind the service's back, so the rollup is not maintained.
+    subscription_factory(user_id=sample_user.id, name="Hulu", next_payment_date=date(2025, 10, 7), price=Decimal("5.00"))
+
+    mismatches = spend_rollup.find_rollup_inconsistencies()
+
+    assert mismatches == [{
+        "user_id": sample_user.id,
+        "month": "2025-10",
+        "category": "entertainment",
+        "expected": (Decimal("15.00"), 2),
+        "actual": (Decimal("10.00"), 1),
+    }]
+
+def test_rollup_delta_is_a_single_upsert(sample_user):
+    user_id = sample_user.id
+    # Inserted by a concurrent first write after this one would have looked the row up.
+    db.session.execute(insert(MonthlySpendRollupModel), {
+        "user_id": user_id, "month": "2025-10", "category": "entertainment",
+        "total": Decimal("5.00"), "subscription_count": 1,
+    })
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "monthly_spend_rollups" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        _create(user_id, price="10.00")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    assert "ON CONFLICT" in statements[0]
+    assert _rollups(user_id) == {("2025-10", "entertainment"): (Decimal("15.00"), 2)}
+
+def test_empty_category_is_uncategorized_everywhere(sample_user):
+    _create(sample_user.id, name="VPN", price="3.00", category="")
+    _create(sample_user.id, name="DNS", price="1.00", category=None)
+
+    assert _rollups(sample_user.id) == {("2025-10", "uncategorized"): (Decimal("4.00"), 2)}
+    assert spend_rollup.find_rollup_inconsistencies() == []
+    assert subscription_service.get_monthly_summary(sample_user.id, "2025-10")["by_category"] == {
+        "uncategorized": Decimal("4.00"),
+    }
+
+def test_get_monthly_summary_reads_rollups_when_enabled(app, sample_user, subscription_factory):
+    app.config['SPEND_ROLLUPS_ENABLED'] = True
+    _create(sample_user.id, price="10.00")
+    _create(sample_user.id, name="VPN", price="3.00", category=None)
+    # Not reflected in the rollups, proving the summary is read from them.
+    subscription_factory(user_id=sample_user.id, name="Hulu", next_payment_date=date(2025, 10, 7), price=Decimal("5.00"))
+
+    summary = subscription_service.get_monthly_summary(sample_user.id, "2025-10")
+
+    assert summary == {
+        "month": "2025-10",
+        "total_spent": Decimal("13.00"),
+        "by_category": {"entertainment": Decimal("10.00"), "uncategorized": Decimal("3.00")},
+    }
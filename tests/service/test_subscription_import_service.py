@@ -0,0 +1,180 @@
+import io
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.extensions import db
+from api.models import SubscriptionModel
+from api.services import spend_rollup
+from api.services import subscription as subscription_service
+from api.services import subscription_import
+
+def _row(name, price="10.00", category="music", next_payment_date="2025-10-05"):
+    return {
+        "name": name,
+        "price": price,
+        "billing_cycle": "monthly",
+        "next_payment_date": next_payment_date,
+        "category": category,
+    }
+
+def test_import_subscriptions_creates_rows(sample_user):
+    result = subscription_import.import_subscriptions(sample_user.id, [_row("Spotify"), _row("Tidal")])
+
+    assert result == {"created": 2, "failed": 0, "errors": []}
+    names = {sub.name for sub in SubscriptionModel.query.filter_by(user_id=sample_user.id)}
+    assert names == {"Spotify", "Tidal"}
+
+def test_import_subscriptions_reports_errors_per_row(sample_user, sample_subscription):
+    rows = [
+        _row("Spotify"),
+        {"name": "Broken"},
+        _row("Netflix"),
+        _row("Spotify"),
+        "not an object",
+        _row("Tidal"),
+    ]
+
+    result = subscription_import.import_subscriptions(sample_user.id, rows, batch_size=2)
+
+    assert result['created'] == 2
+    assert result['failed'] == 4
+    assert [error['row'] for error in result['errors']] == [2, 3, 4, 5]
+    assert "price" in result['errors'][0]['errors']
+    assert result['errors'][1]['errors'] == {"name": ["You already have a subscription with this name."]}
+    assert result['errors'][2]['errors'] == {"name": ["Duplicate name in this import."]}
+    assert result['errors'][3]['errors'] == {"_schema": ["Invalid input type."]}
+
+def test_import_subscriptions_checks_conflicts_with_one_query_per_batch(sample_user):
+    user_id = sample_user.id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "subscriptions.name" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        result = subscription_import.import_subscriptions(user_id, [_row(f"Sub {i}") for i in range(250)], batch_size=100)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert result['created'] == 250
+    assert len(statements) == 3
+    assert all(" IN " in statement for statement in statements)
+
+def test_import_subscriptions_maintains_rollups(sample_user):
+    subscription_import.import_subscriptions(sample_user.id, [
+        _row("Spotify", price="9.99"),
+        _row("Tidal", price="10.01"),
+        _row("Gym", price="30.00", category="health", next_payment_date="2025-11-01"),
+    ])
+
+    assert spend_rollup.get_rollup_by_category(sample_user.id, "2025-10") == {"music": Decimal("20.00")}
+    assert spend_rollup.get_rollup_by_category(sample_user.id, "2025-11") == {"health": Decimal("30.00")}
+    assert spend_rollup.find_rollup_inconsistencies() == []
+
+def test_import_subscriptions_bumps_version_and_invalidates_cache(sample_user, mocker):
+    invalidate = mocker.patch("api.services.subscription_import.response_cache.invalidate_user")
+
+    subscription_import.import_subscriptions(sample_user.id, [_row(f"Sub {i}") for i in range(5)], batch_size=2)
+
+    assert subscription_service.get_subscriptions_version(sample_user.id) == 3
+    invalidate.assert_called_once_with(sample_user.id)
+
+def test_import_subscriptions_failed_batch_does_not_stop_import(sample_user, mocker):
+    commit = mocker.patch(
+        "api.services.subscription_import.db.session.commit",
+        side_effect=[SQLAlchemyError("DB Error"), None],
+    )
+
+    result = subscription_import.import_subscriptions(sample_user.id, [_row(f"Sub {i}") for i in range(4)], batch_size=2)
+
+    assert commit.call_count == 2
+    assert result['created'] == 2
+    assert result['errors'] == [
+        {"row": 1, "errors": {"_schema": [subscription_import.CREATE_ERROR]}},
+        {"row": 2, "errors": {"_schema": [subscription_import.CREATE_ERROR]}},
+    ]
+
+def test_import_subscriptions_stops_at_max_rows(sample_user):
+    consumed = []
+
+    def rows():
+        for i in range(10):
+            consumed.append(i)
+            yield _row(f"Sub {i}")
+
+    result = subscription_import.import_subscriptions(sample_user.id, rows(), batch_size=2, max_rows=3)
+
+    assert result['created'] == 3
+    assert result['errors'] == [{"row": 4, "errors": {"_schema": ["Imports are limited to 3 rows."]}}]
+    assert len(consumed) == 4
+
+def test_iter_csv_rows_keeps_empty_cells():
+    body = io.BytesIO(
+        "﻿name,price,billing_cycle,next_payment_date,category\n"
+        "Spotify,9.99,monthly,2025-10-05,\n".encode()
+    )
+
+    assert list(subscription_import.iter_csv_rows(body)) == [{
+        "name": "Spotify",
+        "price": "9.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-10-05",
+        "category": "",
+    }]
+
+def test_iter_ndjson_rows_skips_blank_lines_and_keeps_bad_lines():
+    body = io.BytesIO(b'{"name": "Spotify"}\n\n{broken\n')
+
+    assert list(subscription_import.iter_ndjson_rows(body)) == [{"name": "Spotify"}, "{broken\n"]
+
+def test_import_subscriptions_reports_body_that_is_not_utf8(sample_user):
+    body = io.BytesIO(
+        b'{"name": "Spotify", "price": "9.99", "billing_cycle": "monthly", '
+        b'"next_payment_date": "2025-01-05", "category": "music"}\n'
+        # Past the first decoded block, so the row above is read before the bad byte.
+        + b"\n" * 10_000
+        + b'{"name": "Caf\xe9"}\n'
+    )
+
+    result = subscription_import.import_subscriptions(sample_user.id, subscription_import.iter_ndjson_rows(body))
+
+    assert result['created'] == 1
+    assert result['failed'] == 1
+    assert result['errors'][0]['row'] == 2
+    assert "can't decode byte 0xe9" in result['errors'][0]['errors']['_schema'][0]
+
+def test_import_subscriptions_reports_malformed_csv(sample_user):
+    body = io.BytesIO(
+        b"name,price,billing_cycle,next_payment_date,category\n"
+        b"Spotify,9.99,monthly,2025-01-05,music\n"
+        + b"x" * 200_000 + b",9.99,monthly,2025-01-05,music\n"
+        + b"Tidal,9.99,monthly,2025-01-05,music\n"
+    )
+
+    result = subscription_import.import_subscriptions(sample_user.id, subscription_import.iter_csv_rows(body))
+
+    assert result['created'] == 1
+    assert result['errors'] == [{"row": 2, "errors": {"_schema": [
+        subscription_import.UNREADABLE_ERROR.format(error="field larger than field limit (131072)")
+    ]}}]
+
+def test_import_subscriptions_csv_accepts_empty_category_like_json(sample_user):
+    body = io.BytesIO(
+        b"name,price,billing_cycle,next_payment_date,category\n"
+        b"Spotify,9.99,monthly,2025-01-05,\n"
+    )
+
+    csv_result = subscription_import.import_subscriptions(sample_user.id, subscription_import.iter_csv_rows(body))
+    json_result = subscription_import.import_subscriptions(sample_user.id, [_row("Tidal", category="")])
+
+    assert csv_result == json_result == {"created": 1, "failed": 0, "errors": []}
+    assert {sub.category for sub in SubscriptionModel.query.filter_by(user_id=sample_user.id)} == {""}
+
+def test_iter_csv_rows_leaves_out_cells_missing_from_short_rows():
+    body = io.BytesIO(b"name,price,category\nSpotify,\n")
+
+    assert list(subscription_import.iter_csv_rows(body)) == [{"name": "Spotify", "price": ""}]
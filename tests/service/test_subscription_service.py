@@ -1,15 +1,18 @@
 import pytest
 from datetime import timedelta, date
 from decimal import Decimal
+from sqlalchemy import event, insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from api.models import SubscriptionModel
+from api.extensions import db
+from api.models import SubscriptionModel, UserModel
 from api.models.enums import BillingCycleEnum
 from api.services import subscription as service
 from api.exceptions import (
     SubscriptionExistError,
     SubscriptionNotFoundError,
-    SubscriptionCreateError
+    SubscriptionCreateError,
+    SubscriptionUpdateError
 )
 
 def test_create_subscription_success(sample_user):
@@ -397,4 +400,207 @@ def test_get_monthly_summary_rounds_to_two_decimal_places(sample_user, subscript
     summary = service.get_monthly_summary(sample_user.id, "2025-07")
 
     assert summary['total_spent'] == Decimal("10.01")
-    assert summary['by_category']['test'] == Decimal("10.01")
\ No newline at end of file
+    assert summary['by_category']['test'] == Decimal("10.01")
+
+def test_iter_subscription_id_chunks_due_in_pages_by_date_and_id(sample_user, subscription_factory):
+    today = date.today()
+    due = [
+        subscription_factory(user_id=sample_user.id, next_payment_date=today + timedelta(days=1), name=f"Due {i}")
+        for i in range(3)
+    ]
+    due.append(
+        subscription_factory(user_id=sample_user.id, next_payment_date=today + timedelta(days=7), name="Due in 7 Days")
+    )
+    subscription_factory(user_id=sample_user.id, next_payment_date=today + timedelta(days=3), name="Due in 3 Days")
+
+    chunks = list(service.iter_subscription_id_chunks_due_in([1, 7], chunk_size=2))
+
+    assert chunks == [[due[0].id, due[1].id], [due[2].id, due[3].id]]
+
+def test_iter_subscription_id_chunks_due_in_orders_by_date_then_id(sample_user, subscription_factory):
+    today = date.today()
+    in_7_days = subscription_factory(user_id=sample_user.id, next_payment_date=today + timedelta(days=7), name="In 7 Days")
+    tomorrow = [
+        subscription_factory(user_id=sample_user.id, next_payment_date=today + timedelta(days=1), name=f"Tomorrow {i}")
+        for i in range(2)
+    ]
+
+    chunks = list(service.iter_subscription_id_chunks_due_in([7, 1, 1], chunk_size=2))
+
+    assert chunks == [[tomorrow[0].id, tomorrow[1].id], [in_7_days.id]]
+
+def test_iter_subscription_id_chunks_due_in_returns_nothing_when_no_matches(sample_user):
+    assert list(service.iter_subscription_id_chunks_due_in([1, 7], chunk_size=2)) == []
+
+def test_get_subscriptions_by_ids_skips_missing(sample_user, sample_subscription):
+    result = service.get_subscriptions_by_ids([sample_subscription.id, 999])
+
+    assert [sub.id for sub in result] == [sample_subscription.id]
+    assert result[0].user.email == sample_user.email
+
+def test_get_subscriptions_by_ids_empty():
+    assert service.get_subscriptions_by_ids([]) == []
+
+def test_iter_subscription_ids_due_in_streams_ids_without_orm_objects(db_session, sample_user):
+    tomorrow = date.today() + timedelta(days=1)
+    db_session.execute(insert(SubscriptionModel), [
+        {
+            "user_id": sample_user.id,
+            "name": f"Sub {i}",
+            "price": Decimal("9.99"),
+            "billing_cycle": BillingCycleEnum.monthly,
+            "next_payment_date": tomorrow,
+            "category": "bench",
+        }
+        for i in range(120)
+    ])
+    db_session.commit()
+    db_session.expunge_all()
+
+    ids = []
+    for sub_id in service.iter_subscription_ids_due_in([1, 7], page_size=50):
+        assert len(db_session.identity_map) == 0
+        ids.append(sub_id)
+
+    assert len(ids) == 120
+    assert ids == sorted(ids)
+
+def test_get_monthly_summary_aggregates_in_single_query(db_session, sample_user, subscription_factory):
+    user_id = sample_user.id
+    for i in range(3):
+        subscription_factory(
+            user_id=user_id,
+            name=f"Sub {i}",
+            price=Decimal("10.00"),
+            category="music" if i else None,
+            next_payment_date=date(2025, 10, 5)
+        )
+    db_session.expunge_all()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        summary = service.get_monthly_summary(user_id, "2025-10")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+    assert len(db_session.identity_map) == 0
+    assert summary['total_spent'] == Decimal("30.00")
+    assert summary['by_category'] == {"music": Decimal("20.00"), "uncategorized": Decimal("10.00")}
+
+def test_get_user_subscriptions_page_orders_by_payment_date_and_id(sample_user, subscription_factory):
+    later = subscription_factory(user_id=sample_user.id, name="Later", next_payment_date=date(2025, 3, 1))
+    first = subscription_factory(user_id=sample_user.id, name="First", next_payment_date=date(2025, 2, 1))
+    second = subscription_factory(user_id=sample_user.id, name="Second", next_payment_date=date(2025, 2, 1))
+
+    page, next_after = service.get_user_subscriptions_page(sample_user.id, limit=2, fields=["id"])
+    assert page == [{"id": first.id}, {"id": second.id}]
+    assert next_after == (date(2025, 2, 1), second.id)
+
+    page, next_after = service.get_user_subscriptions_page(sample_user.id, limit=2, after=next_after, fields=["id"])
+    assert page == [{"id": later.id}]
+    assert next_after is None
+
+def test_get_user_subscriptions_page_selects_only_requested_columns(sample_user, sample_subscription):
+    user_id = sample_user.id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        page, _ = service.get_user_subscriptions_page(user_id, limit=10, fields=["name", "price"])
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert page == [{"name": "Netflix", "price": Decimal("29.99")}]
+    assert len(statements) == 1
+    select_list = statements[0].split("FROM")[0]
+    assert "subscriptions.name" in select_list
+    assert "subscriptions.category" not in select_list
+    assert "subscriptions.created_at" not in select_list
+
+def test_get_user_subscriptions_page_excludes_other_users(sample_user, user_factory, subscription_factory):
+    other = user_factory(email="other@example.com")
+    subscription_factory(user_id=other.id, next_payment_date=date(2025, 2, 1))
+
+    page, next_after = service.get_user_subscriptions_page(sample_user.id, limit=10)
+
+    assert page == []
+    assert next_after is None
+
+def test_get_user_subscriptions_page_sorts_descending_with_id_tiebreak(sample_user, subscription_factory):
+    cheap = subscription_factory(user_id=sample_user.id, name="Cheap", price=Decimal("5.00"), next_payment_date=date(2025, 2, 1))
+    first = subscription_factory(user_id=sample_user.id, name="First", price=Decimal("10.00"), next_payment_date=date(2025, 2, 1))
+    second = subscription_factory(user_id=sample_user.id, name="Second", price=Decimal("10.00"), next_payment_date=date(2025, 2, 1))
+
+    page, next_after = service.get_user_subscriptions_page(sample_user.id, limit=2, fields=["id"], sort="-price")
+    assert page == [{"id": second.id}, {"id": first.id}]
+    assert next_after == (Decimal("10.00"), first.id)
+
+    page, next_after = service.get_user_subscriptions_page(
+        sample_user.id, limit=2, after=next_after, fields=["id"], sort="-price"
+    )
+    assert page == [{"id": cheap.id}]
+    assert next_after is None
+
+def test_get_user_subscriptions_page_filters_in_sql(sample_user, subscription_factory):
+    subscription_factory(user_id=sample_user.id, name="Music", category="music", next_payment_date=date(2025, 2, 1))
+    subscription_factory(user_id=sample_user.id, name="Video", category="video", next_payment_date=date(2025, 2, 1))
+    user_id = sample_user.id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        page, _ = service.get_user_subscriptions_page(user_id, limit=10, fields=["name"], filters={"category": "music"})
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    assert page == [{"name": "Music"}]
+    assert len(statements) == 1
+    assert "subscriptions.category = " in statements[0]
+
+def test_get_user_subscriptions_page_rejects_unknown_sort(sample_user):
+    with pytest.raises(ValueError):
+        service.get_user_subscriptions_page(sample_user.id, limit=10, sort="category")
+
+def test_subscription_writes_bump_subscriptions_version(db_session, sample_user):
+    user_id = sample_user.id
+    updated_at = sample_user.updated_at
+    assert service.get_subscriptions_version(user_id) == 0
+
+    subscription = service.create_subscription({
+        "name": "Spotify",
+        "price": Decimal("9.99"),
+        "billing_cycle": BillingCycleEnum.monthly,
+        "next_payment_date": date(2025, 2, 1),
+        "category": "music",
+    }, user_id)
+    assert service.get_subscriptions_version(user_id) == 1
+
+    service.update_subscription(subscription.id, user_id, {"price": Decimal("11.99")})
+    assert service.get_subscriptions_version(user_id) == 2
+
+    service.delete_subscription(subscription.id, user_id)
+    assert service.get_subscriptions_version(user_id) == 3
+
+    db_session.expire_all()
+    assert db_session.get(UserModel, user_id).updated_at == updated_at
+
+def test_failed_subscription_write_keeps_version(sample_user, sample_subscription, mocker):
+    mocker.patch(
+        "api.services.subscription.db.session.commit",
+        side_effect=SQLAlchemyError("DB Error"),
+    )
+
+    with pytest.raises(SubscriptionUpdateError):
+        service.update_subscription(sample_subscription.id, sample_user.id, {"price": Decimal("11.99")})
+
+    assert service.get_subscriptions_version(sample_user.id) == 0
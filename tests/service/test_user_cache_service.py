@@ -0,0 +1,82 @@
+import pytest
+from dataclasses import FrozenInstanceError
+from redis.exceptions import RedisError
+from sqlalchemy import event
+
+from api.extensions import db
+from api.services import user_cache
+
+@pytest.fixture
+def user_queries(sample_user):
+    # Load the id now, so refreshing the expired instance is not counted.
+    sample_user.id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "after_cursor_execute", capture)
+    yield statements
+    event.remove(db.engine, "after_cursor_execute", capture)
+
+def test_get_user_record_returns_profile_fields(sample_user):
+    record = user_cache.get_user_record(sample_user.id)
+
+    assert record == user_cache.UserRecord(
+        id=sample_user.id,
+        username="test",
+        email="test@example.com",
+        created_at=sample_user.created_at,
+    )
+    with pytest.raises(FrozenInstanceError):
+        record.email = "other@example.com"
+
+def test_get_user_record_missing_user_is_not_cached(db_session, mock_auth_redis):
+    assert user_cache.get_user_record(42) is None
+    assert mock_auth_redis.get("user:record:42") is None
+
+def test_cached_record_skips_database_and_redis(sample_user, user_queries, mock_auth_redis, mocker):
+    user_id = sample_user.id
+    user_cache.get_user_record(user_id)
+    get_spy = mocker.spy(mock_auth_redis, "get")
+
+    assert user_cache.get_user_record(user_id).id == user_id
+
+    assert len(user_queries) == 1
+    get_spy.assert_not_called()
+
+def test_record_is_shared_through_redis(sample_user, user_queries, mock_auth_redis):
+    user_id = sample_user.id
+    expected = user_cache.get_user_record(user_id)
+    # Another process: nothing cached locally, but Redis has the record.
+    user_cache.reset_cache()
+
+    assert user_cache.get_user_record(user_id) == expected
+    assert len(user_queries) == 1
+    assert 0 < mock_auth_redis.ttl(f"user:record:{user_id}") <= user_cache.REDIS_TTL
+
+def test_invalidate_user_drops_cached_record(sample_user, db_session):
+    user_id = sample_user.id
+    user_cache.get_user_record(user_id)
+
+    db_session.delete(sample_user)
+    db_session.commit()
+    user_cache.invalidate_user(user_id)
+
+    assert user_cache.get_user_record(user_id) is None
+
+def test_redis_failure_falls_back_to_database(sample_user, mock_auth_redis, mocker):
+    mocker.patch.object(mock_auth_redis, "get", side_effect=RedisError("down"))
+    mocker.patch.object(mock_auth_redis, "set", side_effect=RedisError("down"))
+
+    assert user_cache.get_user_record(sample_user.id).email == "test@example.com"
+
+def test_local_cache_disabled_reads_redis_every_time(sample_user, mock_auth_redis, mocker, monkeypatch):
+    monkeypatch.setattr(user_cache, "CACHE_TTL", 0)
+    get_spy = mocker.spy(mock_auth_redis, "get")
+
+    user_cache.get_user_record(sample_user.id)
+    user_cache.get_user_record(sample_user.id)
+
+    assert get_spy.call_count == 2
@@ -0,0 +1,41 @@
+from sqlalchemy import event, insert
+
+from api.extensions import db
+from api.models import UserModel
+from api.services import user as service
+
+def test_iter_user_ids_yields_all_ids_in_order(user_factory):
+    users = [user_factory(email=f"user{i}@example.com") for i in range(5)]
+
+    assert list(service.iter_user_ids(page_size=2)) == [user.id for user in users]
+
+def test_iter_user_ids_empty(db_session):
+    assert list(service.iter_user_ids(page_size=2)) == []
+
+def test_iter_user_ids_keeps_memory_bounded(db_session):
+    db_session.execute(insert(UserModel), [
+        {"username": "user", "email": f"user{i}@example.com", "password": "secret"}
+        for i in range(250)
+    ])
+    db_session.commit()
+
+    page_queries = []
+
+    def count_queries(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            page_queries.append(statement)
+
+    event.listen(db.engine, "after_cursor_execute", count_queries)
+    try:
+        ids = []
+        for user_id in service.iter_user_ids(page_size=100):
+            # No ORM objects are hydrated while streaming.
+            assert len(db_session.identity_map) == 0
+            ids.append(user_id)
+    finally:
+        event.remove(db.engine, "after_cursor_execute", count_queries)
+
+    assert len(ids) == 250
+    assert all(isinstance(user_id, int) for user_id in ids)
+    # 100 + 100 + 50 -> three keyset pages
+    assert len(page_queries) == 3
@@ -1,3 +1,7 @@
+import time
+import pytest
+from redis.exceptions import RedisError
+
 from api.services import blocklist
 
 def test_add_and_check_blocklist():
@@ -16,4 +20,152 @@ def test_adding_same_jti_twice_is_safe():
     assert blocklist.is_jti_blocked(jti) is True
 
 def test_is_jti_blocked_returns_false():
-    assert blocklist.is_jti_blocked("non_existing_jti") is False
\ No newline at end of file
+    assert blocklist.is_jti_blocked("non_existing_jti") is False
+
+def test_cached_answer_skips_redis(mock_auth_redis, mocker):
+    blocklist.is_jti_blocked("cached_jti")
+    pttl_spy = mocker.spy(mock_auth_redis, "pttl")
+
+    assert blocklist.is_jti_blocked("cached_jti") is False
+
+    pttl_spy.assert_not_called()
+
+def test_revocation_is_visible_immediately_in_same_process():
+    assert blocklist.is_jti_blocked("revoked_jti") is False
+
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+
+    assert blocklist.is_jti_blocked("revoked_jti") is True
+
+def test_revocation_in_other_process_invalidates_cached_answer(mock_auth_redis):
+    assert blocklist.is_jti_blocked("other_jti") is False
+
+    # Another worker revokes the token: only Redis and the channel see it.
+    mock_auth_redis.setex("blocklist:other_jti", 60, "true")
+    mock_auth_redis.publish(blocklist.BLOCKLIST_CHANNEL, "other_jti")
+
+    deadline = time.monotonic() + 2
+    while blocklist.is_jti_blocked("other_jti") is False and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert blocklist.is_jti_blocked("other_jti") is True
+
+def test_cache_disabled_queries_redis_every_time(mock_auth_redis, mocker, monkeypatch):
+    monkeypatch.setattr(blocklist, "CACHE_TTL", 0)
+    exists_spy = mocker.spy(mock_auth_redis, "exists")
+
+    blocklist.is_jti_blocked("jti")
+    blocklist.is_jti_blocked("jti")
+
+    assert exists_spy.call_count == 2
+
+def test_tokens_issued_up_to_epoch_are_revoked():
+    epoch = blocklist.revoke_user_tokens("1")
+    iat = epoch // 1000
+
+    assert blocklist.is_token_revoked({"sub": "1", "iat": iat, "iat_ms": epoch - 60000, "jti": "old"}) is True
+    assert blocklist.is_token_revoked({"sub": "1", "iat": iat, "iat_ms": epoch, "jti": "same_ms"}) is True
+    assert blocklist.is_token_revoked({"sub": "1", "iat": iat, "iat_ms": epoch + 1, "jti": "new"}) is False
+    assert blocklist.is_token_revoked({"sub": "2", "iat": iat, "iat_ms": epoch - 60000, "jti": "other_user"}) is False
+
+def test_tokens_without_iat_ms_are_compared_by_iat():
+    epoch = blocklist.revoke_user_tokens("1")
+
+    assert blocklist.is_token_revoked({"sub": "1", "iat": epoch // 1000, "jti": "same_second"}) is True
+    assert blocklist.is_token_revoked({"sub": "1", "iat": epoch // 1000 + 1, "jti": "next_second"}) is False
+
+def test_epoch_key_expires_with_refresh_tokens(mock_auth_redis):
+    blocklist.revoke_user_tokens("1")
+
+    assert 0 < mock_auth_redis.ttl("blocklist:epoch:1") <= blocklist.EPOCH_TTL
+
+def test_cached_epoch_skips_redis(mock_auth_redis, mocker):
+    blocklist.get_revocation_epoch("1")
+    get_spy = mocker.spy(mock_auth_redis, "get")
+
+    assert blocklist.get_revocation_epoch("1") == 0
+
+    get_spy.assert_not_called()
+
+def test_epoch_in_other_process_updates_cached_epoch(mock_auth_redis):
+    assert blocklist.get_revocation_epoch("1") == 0
+
+    # Another worker logs the user out everywhere: only Redis and the channel see it.
+    mock_auth_redis.set("blocklist:epoch:1", 1700000000000)
+    mock_auth_redis.publish(blocklist.EPOCH_CHANNEL, "1:1700000000000")
+
+    deadline = time.monotonic() + 2
+    while blocklist.get_revocation_epoch("1") == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert blocklist.get_revocation_epoch("1") == 1700000000000
+
+def test_epoch_cache_disabled_queries_redis_every_time(mock_auth_redis, mocker, monkeypatch):
+    monkeypatch.setattr(blocklist, "EPOCH_CACHE_TTL", 0)
+    get_spy = mocker.spy(mock_auth_redis, "get")
+
+    blocklist.get_revocation_epoch("1")
+    blocklist.get_revocation_epoch("1")
+
+    assert get_spy.call_count == 2
+
+@pytest.fixture
+def bloom_enabled(monkeypatch):
+    monkeypatch.setattr(blocklist, "BLOOM_ENABLED", True)
+
+def test_bloom_negative_skips_exact_lookup(bloom_enabled, mock_auth_redis, mocker):
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+    blocklist.reset_cache()
+    pttl_spy = mocker.spy(mock_auth_redis, "pttl")
+
+    assert blocklist.is_jti_blocked("unknown_jti") is False
+
+    pttl_spy.assert_not_called()
+
+def test_bloom_positive_is_confirmed_by_exact_key(bloom_enabled, mock_auth_redis):
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+    blocklist.reset_cache()
+
+    assert blocklist.is_jti_blocked("revoked_jti") is True
+
+def test_bloom_false_positive_falls_back_to_exact_key(bloom_enabled, mock_auth_redis, mocker):
+    mocker.patch.object(blocklist, "_bloom_might_contain", return_value=True)
+
+    assert blocklist.is_jti_blocked("unknown_jti") is False
+
+def test_bloom_sync_downloads_only_changed_generations(bloom_enabled, mock_auth_redis, mocker):
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+    blocklist._sync_bloom_filters()
+    get_spy = mocker.spy(mock_auth_redis, "get")
+
+    blocklist._sync_bloom_filters()
+    get_spy.assert_not_called()
+
+    blocklist.add_jti_to_blocklist("another_jti", exp=60)
+    blocklist._sync_bloom_filters()
+    get_spy.assert_called_once()
+
+def test_bloom_keeps_previous_generation_until_it_rotates_out(bloom_enabled, mock_auth_redis, monkeypatch):
+    now = 1_000_000 * blocklist.BLOOM_PERIOD
+    monkeypatch.setattr(blocklist.time, "time", lambda: now)
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+
+    now += blocklist.BLOOM_PERIOD
+    blocklist._sync_bloom_filters()
+    assert blocklist._bloom_might_contain("revoked_jti") is True
+
+    now += blocklist.BLOOM_PERIOD
+    blocklist._sync_bloom_filters()
+    assert blocklist._bloom_might_contain("revoked_jti") is False
+
+def test_bloom_generation_keys_expire(bloom_enabled, mock_auth_redis):
+    blocklist.add_jti_to_blocklist("revoked_jti", exp=60)
+
+    key = blocklist._bloom_key(blocklist._bloom_generation())
+    assert 0 < mock_auth_redis.ttl(key) <= 2 * blocklist.BLOOM_PERIOD
+    assert 0 < mock_auth_redis.ttl(f"{key}:count") <= 2 * blocklist.BLOOM_PERIOD
+
+def test_bloom_answers_maybe_when_redis_is_unavailable(bloom_enabled, mock_auth_redis, mocker):
+    mocker.patch.object(mock_auth_redis, "mget", side_effect=RedisError("down"))
+
+    assert blocklist._bloom_might_contain("any_jti") is True
@@ -0,0 +1,38 @@
+import uuid
+
+from api.utils.bloom import BloomFilter
+
+def test_parameters_for_target_error_rate():
+    size, hash_count = BloomFilter.parameters_for(capacity=1000, error_rate=0.01)
+
+    assert size == 9586
+    assert hash_count == 7
+
+def test_added_items_are_always_found():
+    bloom = BloomFilter(*BloomFilter.parameters_for(1000, 0.01))
+    items = [str(uuid.uuid4()) for _ in range(1000)]
+
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+
+def test_false_positive_rate_at_capacity():
+    bloom = BloomFilter(*BloomFilter.parameters_for(10000, 0.01))
+    for _ in range(10000):
+        bloom.add(str(uuid.uuid4()))
+
+    probes = 20000
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(probes))
+
+    assert false_positives / probes < 0.02
+
+def test_bit_layout_matches_redis_bitmaps(mock_auth_redis):
+    bloom = BloomFilter(*BloomFilter.parameters_for(100, 0.01))
+    for position in bloom.positions("some-jti"):
+        mock_auth_redis.setbit("bloom", position, 1)
+
+    loaded = BloomFilter(bloom.size, bloom.hash_count, mock_auth_redis.get("bloom"))
+
+    assert "some-jti" in loaded
+    assert "other-jti" not in loaded
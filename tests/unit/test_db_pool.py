@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from api.config import Config
+from api.infra import db_pool
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    db_pool.reset_stats()
+    yield
+    db_pool.reset_stats()
+
+def make_engine(path, name=db_pool.PRIMARY):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        poolclass=db_pool.InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    db_pool.instrument_engine(engine, name)
+    return engine
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = make_engine(tmp_path / 'pool.db')
+    yield engine
+    engine.dispose()
+
+def test_engine_options_for_mysql_use_instrumented_queue_pool():
+    options = db_pool.engine_options("mysql+pymysql://user:password@db:3306/subtracker", Config.SQLALCHEMY_ENGINE_OPTIONS)
+
+    assert options == {"poolclass": db_pool.InstrumentedQueuePool, **Config.SQLALCHEMY_ENGINE_OPTIONS}
+    engine = create_engine("mysql+pymysql://user:password@db:3306/subtracker", **options)
+    assert isinstance(engine.pool, db_pool.InstrumentedQueuePool)
+    assert engine.pool.size() == Config.SQLALCHEMY_ENGINE_OPTIONS['pool_size']
+
+def test_engine_options_for_sqlite_drop_pool_sizing():
+    options = db_pool.engine_options("sqlite:///:memory:", Config.SQLALCHEMY_ENGINE_OPTIONS)
+
+    assert set(options) == {"pool_recycle", "pool_pre_ping"}
+
+def test_checkouts_are_counted(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = db_pool.get_pool_stats(engine)
+        assert stats['checked_out'] == 1
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    stats = db_pool.get_pool_stats(engine)
+    assert stats['pool'] == "InstrumentedQueuePool"
+    assert stats['connects'] == 1
+    assert stats['checkouts'] == 2
+    assert stats['checkins'] == 2
+    assert stats['checked_out'] == 0
+    assert stats['checked_in'] == 1
+    assert stats['checked_out_max'] == 1
+    assert stats['overflow'] == 0
+
+def test_exhausted_pool_counts_timeout_and_wait(engine):
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    stats = db_pool.get_pool_stats(engine)
+    assert stats['timeouts'] == 1
+    assert stats['checkout_wait_ms_max'] >= 50
+    assert stats['checkout_wait_ms_total'] >= stats['checkout_wait_ms_max']
+
+def test_invalidated_connections_are_counted(engine):
+    with engine.connect() as conn:
+        conn.invalidate()
+
+    assert db_pool.get_pool_stats(engine)['invalidations'] == 1
+
+def test_listeners_survive_dispose(engine):
+    engine.dispose(close=False)
+
+    with engine.connect():
+        pass
+
+    assert db_pool.get_pool_stats(engine)['checkouts'] == 1
+
+def test_engines_are_counted_separately(engine, tmp_path):
+    replica = make_engine(tmp_path / 'replica.db', "replica")
+    try:
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        replica.dispose(close=False)
+        with replica.connect():
+            pass
+
+        primary_stats = db_pool.get_pool_stats(engine)
+        replica_stats = db_pool.get_pool_stats(replica, "replica")
+    finally:
+        replica.dispose()
+
+    assert (primary_stats['checkouts'], primary_stats['timeouts']) == (1, 1)
+    assert (replica_stats['checkouts'], replica_stats['timeouts']) == (1, 0)
+    assert replica_stats['checkout_wait_ms_max'] < 50
@@ -1,6 +1,9 @@
+import pytest
+import requests
 from datetime import date
 
 from api.tasks import email_tasks
+from api.exceptions import EmailTemporaryError, EmailPermanentError
 
 def test_registration_email_renders_and_sends(mocker):
     mock_render = mocker.patch("api.tasks.email_tasks.render_template", return_value="<html>")
@@ -66,4 +69,88 @@ def test_monthly_summary_email_renders_and_sends(mocker):
         subject="Your subscription summary for 2025-10",
         body="Your spending summary for 2025-10 is 72.45.",
         html="<html>",
-    )
\ No newline at end of file
+    )
+
+def test_send_mailgun_message_uses_injected_session(mocker):
+    session = mocker.Mock()
+    session.post.return_value = mocker.Mock(ok=True)
+
+    email_tasks.send_mailgun_message("test@example.com", "Subject", "Body", "<html>", session=session)
+
+    session.post.assert_called_once()
+    args, kwargs = session.post.call_args
+    assert args[0].endswith("/messages")
+    assert kwargs['data']['to'] == ["test@example.com"]
+
+def test_send_mailgun_message_uses_shared_session_by_default(mocker):
+    session = mocker.Mock()
+    session.post.return_value = mocker.Mock(ok=True)
+    mocker.patch("api.tasks.email_tasks.get_http_session", return_value=session)
+
+    email_tasks.send_mailgun_message("test@example.com", "Subject", "Body", "<html>")
+
+    session.post.assert_called_once()
+
+@pytest.mark.parametrize("status_code, error", [
+    (503, EmailTemporaryError),
+    (400, EmailPermanentError),
+])
+def test_send_mailgun_message_maps_error_status(mocker, status_code, error):
+    session = mocker.Mock()
+    session.post.return_value = mocker.Mock(ok=False, status_code=status_code, text="error")
+
+    with pytest.raises(error):
+        email_tasks.send_mailgun_message("test@example.com", "Subject", "Body", "<html>", session=session)
+
+def test_send_mailgun_message_network_error_is_temporary(mocker):
+    session = mocker.Mock()
+    session.post.side_effect = requests.ConnectionError("Connection reset")
+
+    with pytest.raises(EmailTemporaryError):
+        email_tasks.send_mailgun_message("test@example.com", "Subject", "Body", "<html>", session=session)
+
+def test_reminders_batch_sends_single_request_with_recipient_variables(mocker):
+    mock_render = mocker.patch("api.tasks.email_tasks.render_template", return_value="<html>")
+    mock_mailgun = mocker.patch("api.tasks.email_tasks.send_mailgun_message")
+
+    email_tasks.send_email_reminders_batch([
+        {"user_email": "a@example.com", "subscription_name": "Netflix", "next_payment_date": date(2025, 1, 1)},
+        {"user_email": "b@example.com", "subscription_name": "Spotify", "next_payment_date": date(2025, 1, 2)},
+    ])
+
+    mock_render.assert_called_once_with(
+        "email/reminder.html",
+        subscription_name="%recipient.subscription_name%",
+        next_payment_date="%recipient.next_payment_date%",
+    )
+    mock_mailgun.assert_called_once_with(
+        to=["a@example.com", "b@example.com"],
+        subject="Upcoming payment reminder: %recipient.subscription_name%",
+        body="Your next payment for %recipient.subscription_name% is due on %recipient.next_payment_date%.",
+        html="<html>",
+        recipient_variables={
+            "a@example.com": {"subscription_name": "Netflix", "next_payment_date": "2025-01-01"},
+            "b@example.com": {"subscription_name": "Spotify", "next_payment_date": "2025-01-02"},
+        },
+    )
+
+def test_reminders_batch_rejects_duplicate_recipients(mocker):
+    mocker.patch("api.tasks.email_tasks.send_mailgun_message")
+    reminder = {"user_email": "a@example.com", "subscription_name": "Netflix", "next_payment_date": date(2025, 1, 1)}
+
+    with pytest.raises(ValueError):
+        email_tasks.send_email_reminders_batch([reminder, reminder])
+
+def test_send_mailgun_message_posts_recipient_variables_as_json(mocker):
+    session = mocker.Mock()
+    session.post.return_value = mocker.Mock(ok=True)
+
+    email_tasks.send_mailgun_message(
+        ["a@example.com", "b@example.com"], "Subject", "Body", "<html>",
+        session=session,
+        recipient_variables={"a@example.com": {"name": "A"}, "b@example.com": {"name": "B"}},
+    )
+
+    data = session.post.call_args.kwargs['data']
+    assert data['to'] == ["a@example.com", "b@example.com"]
+    assert data['recipient-variables'] == '{"a@example.com": {"name": "A"}, "b@example.com": {"name": "B"}}'
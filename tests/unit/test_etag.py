@@ -0,0 +1,31 @@
+import pytest
+from werkzeug.exceptions import HTTPException
+
+from api.utils.etag import conditional_get
+
+def test_conditional_get_returns_weak_etag_headers(app):
+    with app.test_request_context("/subscriptions"):
+        headers = conditional_get(1, 5)
+
+    assert headers["ETag"].startswith('W/"')
+    assert headers["Cache-Control"] == "private, no-cache"
+
+def test_conditional_get_depends_on_version(app):
+    with app.test_request_context("/subscriptions"):
+        assert conditional_get(1, 5) == conditional_get(1, 5)
+        assert conditional_get(1, 5)["ETag"] != conditional_get(1, 6)["ETag"]
+        assert conditional_get(1, 5)["ETag"] != conditional_get(2, 5)["ETag"]
+
+@pytest.mark.parametrize("weak", [True, False])
+def test_conditional_get_aborts_with_304_on_match(app, weak):
+    with app.test_request_context("/subscriptions"):
+        etag = conditional_get(1, 5)["ETag"]
+    if_none_match = etag if weak else etag.removeprefix("W/")
+
+    with app.test_request_context("/subscriptions", headers={"If-None-Match": f'"other", {if_none_match}'}):
+        with pytest.raises(HTTPException) as exc_info:
+            conditional_get(1, 5)
+
+    response = exc_info.value.get_response()
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
@@ -0,0 +1,45 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from api.models.enums import BillingCycleEnum
+from api.utils import export
+
+COLUMNS = ("name", "price", "billing_cycle", "next_payment_date", "sent_at", "category")
+ROW = ("Spotify", Decimal("9.99"), BillingCycleEnum.monthly, date(2025, 1, 5), datetime(2025, 1, 1, 8, tzinfo=timezone.utc), None)
+
+def test_ndjson_chunks_converts_values():
+    [chunk] = export.ndjson_chunks(COLUMNS, [ROW])
+
+    assert json.loads(chunk) == {
+        "name": "Spotify",
+        "price": "9.99",
+        "billing_cycle": "monthly",
+        "next_payment_date": "2025-01-05",
+        "sent_at": "2025-01-01T08:00:00+00:00",
+        "category": None,
+    }
+
+def test_csv_chunks_writes_header_with_first_chunk():
+    [chunk] = export.csv_chunks(COLUMNS, [ROW])
+
+    assert chunk.splitlines() == [
+        "name,price,billing_cycle,next_payment_date,sent_at,category",
+        "Spotify,9.99,monthly,2025-01-05,2025-01-01T08:00:00+00:00,",
+    ]
+
+def test_chunks_hold_a_bounded_number_of_rows(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_CHUNK_ROWS", 2)
+    consumed = []
+
+    def rows():
+        for i in range(5):
+            consumed.append(i)
+            yield (f"Sub {i}",)
+
+    chunks = export.ndjson_chunks(("name",), rows())
+    first = next(chunks)
+
+    assert first.count("\n") == 2
+    assert len(consumed) == 2
+    assert [chunk.count("\n") for chunk in chunks] == [2, 1]
@@ -0,0 +1,58 @@
+import gunicorn_config
+from api import create_app
+from api.extensions import db
+from api.infra import db_routing
+
+def make_server(mocker, app, preload_app=True):
+    server = mocker.Mock()
+    server.cfg.preload_app = preload_app
+    server.app.wsgi.return_value = app
+    return server
+
+def test_post_fork_resets_process_resources(app, mocker):
+    dispose = mocker.patch.object(db.engine, "dispose")
+    resets = [
+        mocker.patch("api.infra.redis.reset_redis"),
+        mocker.patch("api.infra.queues.reset_queues"),
+        mocker.patch("api.services.blocklist.reset_cache"),
+        mocker.patch("api.services.user_cache.reset_cache"),
+        mocker.patch("api.infra.response_cache.reset_stats"),
+        mocker.patch("api.infra.db_pool.reset_stats"),
+        mocker.patch("api.infra.db_routing.reset_cache"),
+        mocker.patch("api.services.password.reset"),
+    ]
+
+    gunicorn_config.post_fork(make_server(mocker, app), mocker.Mock())
+
+    dispose.assert_called_once_with(close=False)
+    for reset in resets:
+        reset.assert_called_once_with()
+
+def test_post_fork_disposes_replica_engine(mocker):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite://",
+        "SQLALCHEMY_REPLICA_URI": "sqlite://",
+        "JWT_SECRET_KEY": "test-secret",
+    })
+    try:
+        with app.app_context():
+            disposals = [mocker.patch.object(engine, "dispose") for engine in db.engines.values()]
+
+        gunicorn_config.post_fork(make_server(mocker, app), mocker.Mock())
+    finally:
+        # init_app registered the replica bind's metadata on the shared `db`.
+        db.metadatas.pop(db_routing.REPLICA_BIND, None)
+
+    assert len(disposals) == 2
+    for dispose in disposals:
+        dispose.assert_called_once_with(close=False)
+
+def test_post_fork_without_preload_leaves_engine_alone(app, mocker):
+    dispose = mocker.patch.object(db.engine, "dispose")
+    server = make_server(mocker, app, preload_app=False)
+
+    gunicorn_config.post_fork(server, mocker.Mock())
+
+    dispose.assert_not_called()
+    server.app.wsgi.assert_not_called()
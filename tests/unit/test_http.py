@@ -0,0 +1,20 @@
+from api.infra import http
+
+def test_get_http_session_is_reused_within_process():
+    assert http.get_http_session() is http.get_http_session()
+
+def test_get_http_session_is_rebuilt_after_fork(mocker):
+    session = http.get_http_session()
+
+    mocker.patch("api.infra.http.os.getpid", return_value=-1)
+
+    assert http.get_http_session() is not session
+
+def test_http_session_pool_size_is_configurable(monkeypatch):
+    monkeypatch.setenv("MAILGUN_POOL_SIZE", "3")
+
+    session = http._build_session()
+
+    adapter = session.get_adapter("https://api.mailgun.net")
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
@@ -0,0 +1,66 @@
+import pytest
+from passlib.hash import pbkdf2_sha256
+
+from api.services import password
+
+@pytest.fixture(autouse=True)
+def reset_password_context():
+    password.reset()
+    yield
+    password.reset()
+
+def test_hash_and_verify_roundtrip():
+    hashed = password.hash_password("s3cret")
+
+    assert hashed.startswith("$pbkdf2-sha256$29000$")
+    assert password.verify_password("s3cret", hashed) == (True, None)
+
+def test_verify_wrong_password():
+    hashed = password.hash_password("s3cret")
+
+    assert password.verify_password("wrong", hashed) == (False, None)
+
+def test_verify_unrecognized_hash_does_not_match():
+    assert password.verify_password("secret", "secret") == (False, None)
+
+def test_verify_returns_new_hash_when_cost_changed(monkeypatch):
+    old_hash = pbkdf2_sha256.using(rounds=1000).hash("s3cret")
+    monkeypatch.setattr(password, "PBKDF2_ROUNDS", 2000)
+
+    verified, new_hash = password.verify_password("s3cret", old_hash)
+
+    assert verified is True
+    assert new_hash.startswith("$pbkdf2-sha256$2000$")
+    assert password.verify_password("s3cret", new_hash) == (True, None)
+
+def test_wrong_password_never_returns_new_hash(monkeypatch):
+    old_hash = pbkdf2_sha256.using(rounds=1000).hash("s3cret")
+    monkeypatch.setattr(password, "PBKDF2_ROUNDS", 2000)
+
+    assert password.verify_password("wrong", old_hash) == (False, None)
+
+def test_unavailable_scheme_falls_back_to_pbkdf2(monkeypatch, mocker):
+    monkeypatch.setattr(password, "HASH_SCHEME", "argon2")
+    mocker.patch.object(password, "available_schemes", return_value=["pbkdf2_sha256"])
+
+    assert password.get_password_context().default_scheme() == "pbkdf2_sha256"
+
+def test_hashes_of_other_available_schemes_are_upgraded(monkeypatch):
+    if "bcrypt" not in password.available_schemes():
+        pytest.skip("bcrypt backend not installed")
+    monkeypatch.setattr(password, "HASH_SCHEME", "bcrypt")
+    monkeypatch.setattr(password, "BCRYPT_ROUNDS", 4)
+    pbkdf2_hash = pbkdf2_sha256.hash("s3cret")
+
+    verified, new_hash = password.verify_password("s3cret", pbkdf2_hash)
+
+    assert verified is True
+    assert new_hash.startswith("$2b$04$")
+
+def test_process_pool_offload(monkeypatch):
+    monkeypatch.setattr(password, "HASH_WORKERS", 1)
+
+    hashed = password.hash_password("s3cret")
+
+    assert password.verify_password("s3cret", hashed) == (True, None)
+    assert password._pool is not None
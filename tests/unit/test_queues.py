@@ -0,0 +1,75 @@
+import fakeredis
+import pytest
+from redis import RedisError
+from rq.serializers import JSONSerializer
+
+from api.infra import queues
+
+def dummy_task(*args):
+    pass
+
+@pytest.fixture
+def fake_redis_conn(mocker):
+    queues.reset_queues()
+    fake_redis = fakeredis.FakeRedis()
+    mocker.patch("api.infra.queues.get_redis", return_value=fake_redis)
+    yield fake_redis
+    queues.reset_queues()
+
+def test_queue_is_built_once_per_connection(fake_redis_conn):
+    assert queues.get_reminder_queue() is queues.get_reminder_queue()
+    assert queues.get_email_queue().name == "emails"
+
+def test_queue_is_rebuilt_for_new_connection(fake_redis_conn, mocker):
+    queue = queues.get_report_queue()
+
+    mocker.patch("api.infra.queues.get_redis", return_value=fakeredis.FakeRedis())
+
+    assert queues.get_report_queue() is not queue
+
+def test_enqueue_applies_queue_policy(fake_redis_conn):
+    job = queues.enqueue(queues.get_email_queue(), dummy_task, "a@example.com")
+
+    assert job.timeout == 30
+    assert job.retries_left == 3
+    assert job.retry_intervals == [30, 60, 120]
+
+def test_enqueue_options_override_policy(fake_redis_conn):
+    job = queues.enqueue(queues.get_reminder_queue(), dummy_task, 1, job_timeout=600)
+
+    assert job.timeout == 600
+    assert job.retries_left == 3
+
+def test_queue_uses_policy_serializer(fake_redis_conn, monkeypatch):
+    monkeypatch.setitem(queues.QUEUE_POLICIES, "json", queues.QueuePolicy(serializer=JSONSerializer))
+
+    queue = queues.get_queue("json")
+    job = queues.enqueue(queue, dummy_task, 1, "x")
+
+    assert queue.serializer is JSONSerializer
+    assert queue.fetch_job(job.id).args == [1, "x"]
+
+def test_enqueue_many_flushes_in_pipelines(fake_redis_conn, mocker):
+    queue = queues.get_reminder_queue()
+    spy = mocker.spy(queue, "enqueue_many")
+
+    enqueued = queues.enqueue_many(
+        queue,
+        (queues.prepare_job(queue, dummy_task, i) for i in range(5)),
+        flush_size=2,
+    )
+
+    assert enqueued == 5
+    assert [len(call.args[0]) for call in spy.call_args_list] == [2, 2, 1]
+    assert queue.count == 5
+    assert queue.jobs[0].timeout == 60
+    assert queue.jobs[0].retries_left == 3
+
+def test_enqueue_many_skips_failed_flush(mocker):
+    queue = mocker.Mock()
+    queue.enqueue_many.side_effect = [RedisError("Redis down"), None]
+
+    enqueued = queues.enqueue_many(queue, [mocker.Mock() for _ in range(3)], flush_size=2)
+
+    assert enqueued == 1
+    assert queue.enqueue_many.call_count == 2
@@ -0,0 +1,79 @@
+import fakeredis
+import pytest
+import redis
+
+from api.infra import redis as redis_infra
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    redis_infra.reset_redis()
+    yield
+    redis_infra.reset_redis()
+
+@pytest.fixture
+def fake_pool(mocker):
+    server = fakeredis.FakeServer()
+    mocker.patch.object(
+        redis_infra,
+        "_build_pool",
+        side_effect=lambda: redis_infra.InstrumentedBlockingConnectionPool(
+            max_connections=2, timeout=0.1, connection_class=fakeredis.FakeRedisConnection, server=server
+        ),
+    )
+
+def test_pool_is_configured_from_environment(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", "redis://example.org:6380/2")
+    monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("REDIS_POOL_TIMEOUT", "1.5")
+    monkeypatch.setenv("REDIS_SOCKET_TIMEOUT", "3")
+    monkeypatch.setenv("REDIS_CONNECT_TIMEOUT", "0.5")
+    monkeypatch.setenv("REDIS_HEALTH_CHECK_INTERVAL", "15")
+    monkeypatch.setenv("REDIS_RETRY_ON_TIMEOUT", "false")
+
+    pool = redis_infra.get_redis().connection_pool
+
+    assert isinstance(pool, redis_infra.InstrumentedBlockingConnectionPool)
+    assert pool.max_connections == 7
+    assert pool.timeout == 1.5
+    assert pool.connection_kwargs["host"] == "example.org"
+    assert pool.connection_kwargs["port"] == 6380
+    assert pool.connection_kwargs["db"] == 2
+    assert pool.connection_kwargs["socket_timeout"] == 3
+    assert pool.connection_kwargs["socket_connect_timeout"] == 0.5
+    assert pool.connection_kwargs["health_check_interval"] == 15
+
+def test_client_is_created_lazily_and_reused():
+    assert redis_infra._redis is None
+
+    assert redis_infra.get_redis() is redis_infra.get_redis()
+
+def test_client_is_rebuilt_after_fork(mocker):
+    client = redis_infra.get_redis()
+
+    mocker.patch("api.infra.redis.os.getpid", return_value=-1)
+
+    assert redis_infra.get_redis() is not client
+
+def test_pool_stats_track_connection_usage(fake_pool):
+    client = redis_infra.get_redis()
+    client.set("key", "value")
+
+    assert redis_infra.get_redis_pool_stats() == {"max_connections": 2, "created": 1, "in_use": 0, "idle": 1}
+
+    connection = client.connection_pool.get_connection()
+    assert redis_infra.get_redis_pool_stats() == {"max_connections": 2, "created": 1, "in_use": 1, "idle": 0}
+    client.connection_pool.release(connection)
+    assert redis_infra.get_redis_pool_stats()["in_use"] == 0
+
+def test_pool_never_opens_more_than_max_connections(fake_pool):
+    pool = redis_infra.get_redis().connection_pool
+    held = [pool.get_connection(), pool.get_connection()]
+
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection()
+
+    for connection in held:
+        pool.release(connection)
+
+def test_pool_stats_without_client():
+    assert redis_infra.get_redis_pool_stats()["created"] == 0
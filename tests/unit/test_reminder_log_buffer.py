@@ -0,0 +1,67 @@
+import pytest
+
+from api.services.reminder_log_buffer import ReminderLogBuffer
+from api.exceptions import ReminderLogCreateError
+
+@pytest.fixture
+def mock_create_logs(mocker):
+    return mocker.patch(
+        "api.services.reminder_log_buffer.reminder_log_service.create_reminder_logs"
+    )
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_buffer_flushes_when_size_threshold_reached(mock_create_logs):
+    buffer = ReminderLogBuffer(max_size=2, max_interval=60)
+
+    buffer.add(1, "Sent", success=True)
+    mock_create_logs.assert_not_called()
+
+    buffer.add(2, "Sent", success=True)
+    mock_create_logs.assert_called_once_with([
+        {"subscription_id": 1, "message": "Sent", "success": True},
+        {"subscription_id": 2, "message": "Sent", "success": True},
+    ])
+    assert len(buffer) == 0
+
+def test_buffer_flushes_when_time_threshold_reached(mock_create_logs):
+    clock = FakeClock()
+    buffer = ReminderLogBuffer(max_size=100, max_interval=5, clock=clock)
+
+    buffer.add(1, "Sent", success=True)
+    clock.now = 4.9
+    buffer.add(2, "Sent", success=True)
+    mock_create_logs.assert_not_called()
+
+    clock.now = 5.0
+    buffer.add(3, "Sent", success=True)
+    assert mock_create_logs.call_count == 1
+    assert len(mock_create_logs.call_args.args[0]) == 3
+
+def test_buffer_flushes_on_context_exit(mock_create_logs):
+    with ReminderLogBuffer(max_size=100, max_interval=60) as buffer:
+        buffer.add(1, "Sent", success=True)
+
+    mock_create_logs.assert_called_once()
+
+def test_buffer_flush_without_rows_is_noop(mock_create_logs):
+    assert ReminderLogBuffer().flush() == 0
+    mock_create_logs.assert_not_called()
+
+def test_buffer_keeps_rows_when_flush_fails(app_ctx, mock_create_logs):
+    mock_create_logs.side_effect = [ReminderLogCreateError("DB down"), None]
+    buffer = ReminderLogBuffer(max_size=1, max_interval=60)
+
+    # Act: threshold flush fails but must NOT raise
+    buffer.add(1, "Sent", success=True)
+    assert len(buffer) == 1
+
+    buffer.add(2, "Sent", success=True)
+
+    assert len(buffer) == 0
+    assert [row["subscription_id"] for row in mock_create_logs.call_args.args[0]] == [1, 2]
@@ -11,7 +11,7 @@ def mocked_dependencies_1(mocker):
     Provides patched versions of task dependencies for `check_upcoming_payments`.
     """
     mock_get_subs = mocker.patch(
-        "api.tasks.reminder_tasks.subscription_service.get_subscriptions_due_in"
+        "api.tasks.reminder_tasks.subscription_service.iter_subscription_ids_due_in"
     )
     mock_reminder_queue = mocker.Mock()
     mocker.patch(
@@ -45,10 +45,7 @@ def test_check_upcoming_payments_enqueues_job_per_subscription(
     ):  
     mock_get_subs, mock_reminder_queue = mocked_dependencies_1
 
-    sub1 = mocker.Mock(id=1)
-    sub2 = mocker.Mock(id=2)
-
-    mock_get_subs.return_value = [sub1, sub2]
+    mock_get_subs.return_value = iter([1, 2])
 
     reminder_tasks.check_upcoming_payments()
 
@@ -61,9 +58,7 @@ def test_check_upcoming_payments_enqueue_arguments(
     ):
     mock_get_subs, mock_reminder_queue = mocked_dependencies_1
 
-    sub = mocker.Mock(id=1)
-
-    mock_get_subs.return_value = [sub]
+    mock_get_subs.return_value = iter([1])
 
     reminder_tasks.check_upcoming_payments()
 
@@ -81,10 +76,7 @@ def test_check_upcoming_payments_handles_redis_error(
 ):
     mock_get_subs, mock_reminder_queue = mocked_dependencies_1
 
-    sub1 = mocker.Mock(id=1)
-    sub2 = mocker.Mock(id=2)
-
-    mock_get_subs.return_value = [sub1, sub2]
+    mock_get_subs.return_value = iter([1, 2])
 
     mock_reminder_queue.enqueue.side_effect = RedisError("Redis down")
 
@@ -177,4 +169,214 @@ def test_send_single_subscription_reminder_handles_temporary_email_failure(
 
     with pytest.raises(EmailTemporaryError):
         reminder_tasks.send_single_subscription_reminder(sub_id=1)
-    mock_create_log.assert_not_called()
\ No newline at end of file
+    mock_create_log.assert_not_called()
+
+def test_check_upcoming_payments_batch_mode_enqueues_job_per_chunk(
+        app,
+        app_ctx,
+        mocker,
+        mocked_dependencies_1
+    ):
+    mock_get_subs, mock_reminder_queue = mocked_dependencies_1
+    app.config['REMINDER_FANOUT_MODE'] = "batch"
+    app.config['REMINDER_BATCH_SIZE'] = 2
+
+    mock_chunks = mocker.patch(
+        "api.tasks.reminder_tasks.subscription_service.iter_subscription_id_chunks_due_in",
+        return_value=iter([[1, 2], [3]])
+    )
+
+    reminder_tasks.check_upcoming_payments()
+
+    mock_chunks.assert_called_once_with([1, 7], 2)
+    mock_get_subs.assert_not_called()
+    mock_reminder_queue.enqueue.assert_not_called()
+    mock_reminder_queue.enqueue_many.assert_called_once()
+
+    job_datas = mock_reminder_queue.enqueue_many.call_args.args[0]
+    assert [job_data.args for job_data in job_datas] == [([1, 2],), ([3],)]
+    assert job_datas[0].func.__name__ == "send_subscription_reminders_batch"
+
+def test_check_upcoming_payments_batch_jobs_are_not_retried(
+        app,
+        app_ctx,
+        mocker,
+        mocked_dependencies_1
+    ):
+    _, mock_reminder_queue = mocked_dependencies_1
+    app.config['REMINDER_FANOUT_MODE'] = "batch"
+
+    mocker.patch(
+        "api.tasks.reminder_tasks.subscription_service.iter_subscription_id_chunks_due_in",
+        return_value=iter([[1, 2], [3]])
+    )
+
+    reminder_tasks.check_upcoming_payments()
+
+    # Retrying a chunk would re-send the reminders it already delivered.
+    job_datas = mock_reminder_queue.enqueue_many.call_args.args[0]
+    assert [job_data.retry for job_data in job_datas] == [None, None]
+
+def test_check_upcoming_payments_batch_mode_handles_redis_error(
+        app,
+        app_ctx,
+        mocker,
+        mocked_dependencies_1
+    ):
+    _, mock_reminder_queue = mocked_dependencies_1
+    app.config['REMINDER_FANOUT_MODE'] = "batch"
+
+    mocker.patch(
+        "api.tasks.reminder_tasks.subscription_service.iter_subscription_id_chunks_due_in",
+        return_value=iter([[1, 2]])
+    )
+    mock_reminder_queue.enqueue_many.side_effect = RedisError("Redis down")
+
+    # Act: should NOT raise
+    reminder_tasks.check_upcoming_payments()
+
+@pytest.fixture
+def mocked_dependencies_3(mocker):
+    """
+    Provides patched versions of task dependencies for `send_subscription_reminders_batch`.
+    """
+    mock_get_subs = mocker.patch(
+        "api.tasks.reminder_tasks.subscription_service.get_subscriptions_by_ids"
+    )
+    mock_send_email = mocker.patch(
+        "api.tasks.reminder_tasks.email_tasks.send_email_reminder"
+    )
+    mock_create_logs = mocker.patch(
+        "api.tasks.reminder_tasks.reminder_log_service.create_reminder_logs"
+    )
+    mocker.patch(
+        "api.tasks.reminder_tasks.email_tasks.send_email_reminders_batch"
+    )
+    mock_reminder_queue = mocker.Mock()
+    mocker.patch(
+        "api.tasks.reminder_tasks.get_reminder_queue",
+        return_value=mock_reminder_queue
+    )
+
+    return mock_get_subs, mock_send_email, mock_create_logs, mock_reminder_queue
+
+def _make_sub(mocker, sub_id, name):
+    sub = mocker.Mock()
+    sub.id = sub_id
+    sub.name = name
+    sub.next_payment_date = date(2025, 12, 1)
+    sub.user = mocker.Mock(email=f"user{sub_id}@example.com")
+    return sub
+
+def test_send_subscription_reminders_batch_logs_all_outcomes_in_one_insert(
+        app,
+        app_ctx,
+        mocker,
+        mocked_dependencies_3
+    ):
+    mock_get_subs, mock_send_email, mock_create_logs, mock_reminder_queue = mocked_dependencies_3
+    app.config['REMINDER_EMAIL_BATCH_SIZE'] = 1
+
+    mock_get_subs.return_value = [_make_sub(mocker, 1, "Netflix"), _make_sub(mocker, 2, "Spotify")]
+    mock_send_email.side_effect = [None, EmailPermanentError("Invalid email")]
+
+    reminder_tasks.send_subscription_reminders_batch([1, 2])
+
+    mock_get_subs.assert_called_once_with([1, 2])
+    assert mock_send_email.call_count == 2
+    mock_create_logs.assert_called_once_with([
+        {"subscription_id": 1, "message": "Reminder sent for Netflix", "success": True},
+        {"subscription_id": 2, "message": "Invalid email", "success": False},
+    ])
+    mock_reminder_queue.enqueue.assert_not_called()
+
+def test_send_subscription_reminders_batch_reenqueues_temporary_failures(
+        app,
+        app_ctx,
+        mocker,
+        mocked_dependencies_3
+    ):
+    mock_get_subs, mock_send_email, mock_create_logs, mock_reminder_queue = mocked_dependencies_3
+    app.config['REMINDER_EMAIL_BATCH_SIZE'] = 1
+
+    mock_get_subs.return_value = [_make_sub(mocker, 1, "Netflix"), _make_sub(mocker, 2, "Spotify")]
+    mock_send_email.side_effect = [EmailTemporaryError("Timeout occurred"), None]
+
+    reminder_tasks.send_subscription_reminders_batch([1, 2])
+
+    mock_create_logs.assert_called_once_with([
+        {"subscription_id": 2, "message": "Reminder sent for Spotify", "success": True},
+    ])
+    mock_reminder_queue.enqueue.assert_called_once()
+    args, kwargs = mock_reminder_queue.enqueue.call_args
+    assert args[0].__name__ == "send_single_subscription_reminder"
+    assert args[1] == 1
+    assert kwargs['retry'] is not None
+
+def test_send_subscription_reminders_batch_sends_one_mailgun_batch(
+        app_ctx,
+        mocker,
+        mocked_dependencies_3
+    ):
+    mock_get_subs, mock_send_email, mock_create_logs, _ = mocked_dependencies_3
+    mock_send_batch = reminder_tasks.email_tasks.send_email_reminders_batch
+
+    mock_get_subs.return_value = [_make_sub(mocker, 1, "Netflix"), _make_sub(mocker, 2, "Spotify")]
+
+    reminder_tasks.send_subscription_reminders_batch([1, 2])
+
+    mock_send_batch.assert_called_once_with([
+        {"user_email": "user1@example.com", "subscription_name": "Netflix", "next_payment_date": date(2025, 12, 1)},
+        {"user_email": "user2@example.com", "subscription_name": "Spotify", "next_payment_date": date(2025, 12, 1)},
+    ])
+    mock_send_email.assert_not_called()
+    mock_create_logs.assert_called_once_with([
+        {"subscription_id": 1, "message": "Reminder sent for Netflix", "success": True},
+        {"subscription_id": 2, "message": "Reminder sent for Spotify", "success": True},
+    ])
+
+def test_send_subscription_reminders_batch_falls_back_to_single_sends_on_permanent_error(
+        app_ctx,
+        mocker,
+        mocked_dependencies_3
+    ):
+    mock_get_subs, mock_send_email, mock_create_logs, _ = mocked_dependencies_3
+    reminder_tasks.email_tasks.send_email_reminders_batch.side_effect = EmailPermanentError("Invalid address")
+
+    mock_get_subs.return_value = [_make_sub(mocker, 1, "Netflix"), _make_sub(mocker, 2, "Spotify")]
+    mock_send_email.side_effect = [None, EmailPermanentError("Invalid email")]
+
+    reminder_tasks.send_subscription_reminders_batch([1, 2])
+
+    assert mock_send_email.call_count == 2
+    mock_create_logs.assert_called_once_with([
+        {"subscription_id": 1, "message": "Reminder sent for Netflix", "success": True},
+        {"subscription_id": 2, "message": "Invalid email", "success": False},
+    ])
+
+def test_send_subscription_reminders_batch_reenqueues_group_on_temporary_error(
+        app_ctx,
+        mocker,
+        mocked_dependencies_3
+    ):
+    mock_get_subs, mock_send_email, mock_create_logs, mock_reminder_queue = mocked_dependencies_3
+    reminder_tasks.email_tasks.send_email_reminders_batch.side_effect = EmailTemporaryError("Timeout occurred")
+
+    mock_get_subs.return_value = [_make_sub(mocker, 1, "Netflix"), _make_sub(mocker, 2, "Spotify")]
+
+    reminder_tasks.send_subscription_reminders_batch([1, 2])
+
+    mock_send_email.assert_not_called()
+    mock_create_logs.assert_not_called()
+    assert [c.args[1] for c in mock_reminder_queue.enqueue.call_args_list] == [1, 2]
+
+def test_group_by_recipient_keeps_addresses_unique_per_group(mocker):
+    subs = [_make_sub(mocker, i, f"Sub {i}") for i in range(1, 6)]
+    subs[1].user = subs[0].user  # user1 owns subs 1 and 2
+
+    groups = list(reminder_tasks._group_by_recipient(subs, batch_size=2))
+
+    assert [[sub.id for sub in group] for group in groups] == [[1, 3], [4, 5], [2]]
+    for group in groups:
+        emails = [sub.user.email for sub in group]
+        assert len(emails) == len(set(emails))
@@ -10,7 +10,7 @@ def mocked_dependencies_1(mocker):
     Provides patched versions of task dependencies for `generate_monthly_report`.
     """
     mock_users = mocker.patch(
-        "api.tasks.report_tasks.user_service.get_all_users"
+        "api.tasks.report_tasks.user_service.iter_user_ids"
     )
     mock_queue = mocker.Mock()
     mocker.patch(
@@ -48,10 +48,7 @@ def test_generate_monthly_report_enqueues_job_per_user(
     ):
     mock_users, mock_queue, _ = mocked_dependencies_1
 
-    mock_users.return_value = [
-        mocker.Mock(id=1),
-        mocker.Mock(id=2),
-    ]
+    mock_users.return_value = iter([1, 2])
 
     report_tasks.generate_monthly_report()
 
@@ -64,8 +61,7 @@ def test_generate_monthly_report_enqueue_arguments(
     ):
     mock_users, mock_queue, _ = mocked_dependencies_1
 
-    user = mocker.Mock(id=42)
-    mock_users.return_value = [user]
+    mock_users.return_value = iter([42])
 
     report_tasks.generate_monthly_report()
 
@@ -83,8 +79,7 @@ def test_generate_monthly_report_handles_redis_error(
 ):
     mock_users, mock_queue, _ = mocked_dependencies_1
 
-    user = mocker.Mock(id=1)
-    mock_users.return_value = [user]
+    mock_users.return_value = iter([1])
 
     mock_queue.enqueue.side_effect = RedisError("Redis down")
 
@@ -0,0 +1,51 @@
+import os
+import pytest
+
+from api.infra import templates
+
+@pytest.fixture
+def fresh_env(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "bytecode"
+    monkeypatch.setenv("TEMPLATE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(templates, "_env", None)
+    return cache_dir
+
+def test_templates_resolve_independently_of_working_directory(fresh_env, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    html = templates.get_template("email/registration.html").render(username="alice")
+
+    assert "alice" in html
+
+def test_precompile_templates_writes_bytecode_cache(fresh_env):
+    assert templates.precompile_templates() == len(templates.EMAIL_TEMPLATES)
+
+    assert len(os.listdir(fresh_env)) == len(templates.EMAIL_TEMPLATES)
+
+def test_precompiled_templates_are_served_from_memory(fresh_env, mocker):
+    templates.precompile_templates()
+    spy = mocker.spy(templates.get_template_env().loader, "get_source")
+
+    for name in templates.EMAIL_TEMPLATES:
+        templates.get_template(name)
+
+    spy.assert_not_called()
+
+def test_bytecode_cache_is_reused_by_a_new_environment(fresh_env, monkeypatch, mocker):
+    templates.precompile_templates()
+    monkeypatch.setattr(templates, "_env", None)
+    compile_spy = mocker.spy(templates.get_template_env(), "compile")
+
+    templates.precompile_templates()
+
+    compile_spy.assert_not_called()
+
+def test_auto_reload_is_disabled_by_default(fresh_env, monkeypatch):
+    monkeypatch.delenv("TEMPLATE_AUTO_RELOAD", raising=False)
+
+    assert templates.get_template_env().auto_reload is False
+
+def test_auto_reload_can_be_enabled(fresh_env, monkeypatch):
+    monkeypatch.setenv("TEMPLATE_AUTO_RELOAD", "true")
+
+    assert templates.get_template_env().auto_reload is True
@@ -1,7 +1,11 @@
 from rq import Worker
 
+from api.infra.templates import precompile_templates
 from api.infra.queues import get_email_queue
 
 if __name__ == "__main__":
-    worker = Worker([get_email_queue()])
+    precompile_templates()
+
+    queue = get_email_queue()
+    worker = Worker([queue], serializer=queue.serializer)
     worker.work()
\ No newline at end of file
@@ -2,13 +2,17 @@ from rq import Worker
 
 from api import create_app
 from api.infra.redis import get_redis
+from api.infra.templates import precompile_templates
 from api.infra.queues import get_reminder_queue
 
 if __name__ == "__main__":
+    precompile_templates()
+
     app = create_app()
 
     redis_conn = get_redis()
 
     with app.app_context():
-        worker = Worker([get_reminder_queue()], connection=redis_conn)
+        queue = get_reminder_queue()
+        worker = Worker([queue], connection=redis_conn, serializer=queue.serializer)
         worker.work()
\ No newline at end of file